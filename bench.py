@@ -0,0 +1,129 @@
+#
+# bench.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+# Simple benchmarks for the UR library. Run with `python bench.py`.
+#
+# Cold-start numbers are measured in a fresh interpreter for each run, since
+# module imports and lazily built state are only paid for once per process.
+
+import os
+import subprocess
+import sys
+import time
+
+COLD_START_RUNS = 5
+
+# Message sizes, in fragments, for the fountain decoder scaling benchmark
+DECODER_FRAGMENT_COUNTS = [250, 500, 1000]
+DECODER_FRAGMENT_LEN = 20
+
+# Print the time taken to import a module, then the time taken by the first
+# and second calls of some code that uses it.
+COLD_START_SCRIPT = '''
+import time
+t0 = time.perf_counter()
+{imports}
+t1 = time.perf_counter()
+{setup}
+t2 = time.perf_counter()
+{call}
+t3 = time.perf_counter()
+{call}
+t4 = time.perf_counter()
+print(t1 - t0, t3 - t2, t4 - t3)
+'''
+
+COLD_START_CASES = [
+    (
+        'import ur',
+        'import ur',
+        '',
+        'pass',
+    ),
+    (
+        'UR part decode',
+        'from ur.ur_decoder import URDecoder',
+        'part = "ur:bytes/1-9/lpadascfadaxcywenbpljkhdcahkadaemejtswhhylkepmykhhtsytsnoyoyaxaedsuttydmmhhpktpmsrjtdkgslpgh"',
+        'URDecoder().receive_part(part)',
+    ),
+    (
+        'UR part encode',
+        'from ur.ur_encoder import UREncoder\nfrom ur.ur import UR',
+        'ur = UR("bytes", bytearray(range(256)) * 4)',
+        'UREncoder(ur, 100).next_part()',
+    ),
+    (
+        'Bytewords decode',
+        'from ur.bytewords import Bytewords, Bytewords_Style_minimal',
+        'text = "aeadaolazmjendeoti"',
+        'Bytewords.decode(Bytewords_Style_minimal, text)',
+    ),
+    (
+        'CRC32 table fallback',
+        'from ur.crc32 import _table_crc32',
+        'buf = bytes(range(256))',
+        '_table_crc32(buf, 0)',
+    ),
+]
+
+def run_cold_start(imports, setup, call):
+    script = COLD_START_SCRIPT.format(imports=imports, setup=setup, call=call)
+    best = None
+    for i in range(COLD_START_RUNS):
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=sys.path[0])
+        times = [float(t) for t in output.split()]
+        if best == None:
+            best = times
+        else:
+            best = [min(a, b) for a, b in zip(best, times)]
+    return best
+
+def bench_cold_start():
+    print('Cold start (best of {} fresh interpreters)'.format(COLD_START_RUNS))
+    print('{:<24} {:>12} {:>12} {:>12}'.format('case', 'import ms', 'first ms', 'second ms'))
+    for (name, imports, setup, call) in COLD_START_CASES:
+        (import_time, first_time, second_time) = run_cold_start(imports, setup, call)
+        print('{:<24} {:>12.3f} {:>12.3f} {:>12.3f}'.format(name, import_time * 1000, first_time * 1000, second_time * 1000))
+
+# Decode a stream of mixed parts only, which is the hardest case for the
+# peeling solver. The work it should do grows with the number of edges (the
+# total degree of the parts received), so the time per edge should stay about
+# the same as the message grows.
+def bench_fountain_decoder_scaling():
+    from ur.fountain_decoder import FountainDecoder, Fountain_Solver_peeling, Fountain_Solver_gaussian
+    from ur.fountain_encoder import FountainEncoder
+    from ur.schedule_cache import ScheduleCache
+
+    print('Fountain decoder, mixed parts only, {} byte fragments'.format(DECODER_FRAGMENT_LEN))
+    print('{:<10} {:>10} {:>8} {:>10} {:>10} {:>10}'.format('solver', 'fragments', 'parts', 'edges', 'ms', 'us/edge'))
+    for count in DECODER_FRAGMENT_COUNTS:
+        message = os.urandom(count * DECODER_FRAGMENT_LEN)
+        schedule_cache = ScheduleCache(count * 16)
+        encoder = FountainEncoder(message, DECODER_FRAGMENT_LEN, min_fragment_len=DECODER_FRAGMENT_LEN, schedule_cache=schedule_cache)
+        parts = [encoder.part_at(seq_num) for seq_num in range(count + 1, count * 8)]
+
+        for solver in [Fountain_Solver_peeling, Fountain_Solver_gaussian]:
+            decoder = FountainDecoder(schedule_cache=schedule_cache, solver=solver)
+            received = 0
+            start = time.perf_counter()
+            for part in parts:
+                decoder.receive_part(part)
+                received += 1
+                if decoder.is_complete():
+                    break
+            elapsed = time.perf_counter() - start
+            assert(decoder.result_message() == message)
+
+            edges = 0
+            for part in parts[0:received]:
+                edges += len(schedule_cache.get(part.seq_num, part.seq_len, part.checksum))
+            print('{:<10} {:>10} {:>8} {:>10} {:>10.1f} {:>10.2f}'.format(solver, count, received, edges, elapsed * 1000, elapsed / edges * 1e6))
+
+if __name__ == '__main__':
+    bench_cold_start()
+    print()
+    bench_fountain_decoder_scaling()
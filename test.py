@@ -13,14 +13,26 @@ except:
 from test_utils import make_message, make_message_ur
 
 from ur.bytewords import *
-from ur.utils import crc32_bytes, crc32_int, data_to_hex, bytes_to_int, string_to_bytes, xor_into
-from ur.xoshiro256 import Xoshiro256
+import ur
+from ur.crc32 import Crc32, _table_crc32, _make_table
+from ur.crc32_table import TABLE as CRC32_TABLE
+from ur.utils import crc32_bytes, crc32_int, data_to_hex, bytes_to_int, string_to_bytes, xor_into, is_ur_type
+from ur.xoshiro256 import Xoshiro256, JUMP, LONG_JUMP, CHARACTERISTIC_POLYNOMIAL, _make_characteristic_polynomial, jump_polynomial, _make_jump_matrix
+from ur.xoshiro256_jump_table import JUMP_MATRIX, LONG_JUMP_MATRIX
 from ur.random_sampler import RandomSampler
-from ur.fountain_utils import shuffled, choose_degree, choose_fragments
-from ur.fountain_encoder import FountainEncoder, Part
-from ur.fountain_decoder import FountainDecoder
-from ur.ur_encoder import UREncoder
+from ur.fountain_utils import shuffled, partial_shuffled, take_ranked_fenwick, choose_degree, choose_fragments, choose_fragments_batch, DEGREE_SAMPLER_CACHE, NUMPY_CHUNK_SIZE
+from ur.lru_cache import LRUCache
+from ur.schedule_cache import ScheduleCache
+from ur.index_set import IndexSet
+from ur import xor_kernel
+from ur.qr_capacity import qr_capacity
+from ur.fountain_encoder import FountainEncoder, Part, InvalidHeader, InvalidHeader_truncated, InvalidHeader_not_array, \
+    InvalidHeader_wrong_array_size, InvalidHeader_not_unsigned, InvalidHeader_not_bytes, InvalidHeader_bad_additional
+from ur.fountain_decoder import FountainDecoder, Fountain_Solver_peeling, Fountain_Solver_gaussian
+from ur.ur_encoder import UREncoder, PartTemplate
 from ur.ur_decoder import URDecoder
+from ur.prefetching_encoder import PrefetchingEncoder
+from ur.parallel import generate_parts
 
 def check_crc32(input, expected_hex):
     checksum = crc32_int(bytes(input, 'utf8'))
@@ -49,6 +61,34 @@ class TestUR(BaseClass):
         assert check_crc32("Hello, world!", "ebe6c6e6")
         assert check_crc32("Wolf", "598c84dc")
 
+    def test_crc32_incremental(self):
+        message = make_message(1000)
+        expected = crc32_int(message)
+
+        c = Crc32()
+        for i in range(0, len(message), 77):
+            c.update(message[i:i + 77])
+        assert(c.value() == expected)
+        assert(c.digest() == crc32_bytes(message))
+
+        # The table-driven fallback must agree with the native implementation
+        for length in [0, 1, 7, 8, 9, 1000]:
+            assert(_table_crc32(message[0:length], 0) == crc32_int(message[0:length]))
+        assert(_table_crc32(message[500:], _table_crc32(message[0:500], 0)) == expected)
+
+    def test_frozen_tables(self):
+        generated = _make_table()
+        assert([list(t) for t in CRC32_TABLE] == generated)
+
+        for i in range(256):
+            assert(WORDS[i] == BYTEWORDS[i * 4:i * 4 + 4])
+            assert(MINIMAL_WORDS[i] == BYTEWORDS[i * 4] + BYTEWORDS[i * 4 + 3])
+
+    def test_lazy_package_names(self):
+        assert(ur.UREncoder == UREncoder)
+        assert(ur.URDecoder == URDecoder)
+        self.assertRaises(AttributeError, lambda: ur.NotAName)
+
     def test_bytewords_1(self):
         input = bytes([0, 1, 2, 128, 255])
         assert(Bytewords.encode(Bytewords_Style_standard, input) == "able acid also lava zoom jade need echo taxi")
@@ -71,6 +111,15 @@ class TestUR(BaseClass):
         
         self.assertRaises(ValueError, lambda: Bytewords.decode(Bytewords_Style_standard, ""))
 
+        # case-insensitive
+        assert(Bytewords.decode(Bytewords_Style_standard, "ABLE acid ALSO Lava zoom jade need echo taxi") == input)
+        assert(Bytewords.decode(Bytewords_Style_minimal, "AEADAOLAZMJENDEOTI") == input)
+
+        # bad middle letters, bad word length, odd number of letters
+        self.assertRaises(ValueError, lambda: Bytewords.decode(Bytewords_Style_uri, "abxe-acid-also-lava-zoom-jade-need-echo-taxi"))
+        self.assertRaises(ValueError, lambda: Bytewords.decode(Bytewords_Style_uri, "ae-acid-also-lava-zoom-jade-need-echo-taxi"))
+        self.assertRaises(ValueError, lambda: Bytewords.decode(Bytewords_Style_minimal, "aeadaolazmjendeotia"))
+
     def test_bytewords_2(self):
         input = bytes([
             245, 215, 20, 198, 241, 235, 69, 59, 209, 205,
@@ -111,6 +160,23 @@ class TestUR(BaseClass):
         assert(Bytewords.decode(Bytewords_Style_standard, encoded) == input)
         assert(Bytewords.decode(Bytewords_Style_minimal, encoded_minimal) == input)
 
+    def test_bytewords_streaming(self):
+        message = make_message(1000)
+        chunks = [message[i:i + 97] for i in range(0, len(message), 97)]
+        for style in [Bytewords_Style_standard, Bytewords_Style_uri, Bytewords_Style_minimal]:
+            encoded = Bytewords.encode(style, message)
+            assert(''.join(Bytewords.iter_encode(style, chunks)) == encoded)
+
+            # Split the text at arbitrary points, including mid-word
+            text_chunks = [encoded[i:i + 13] for i in range(0, len(encoded), 13)]
+            assert(b''.join(Bytewords.iter_decode(style, text_chunks)) == message)
+
+            # The checksum is verified at the end of the stream
+            bad = encoded[0:-2] + ('ab' if encoded[-2:] != 'ab' else 'ad')
+            self.assertRaises(ValueError, lambda: b''.join(Bytewords.iter_decode(style, [bad])))
+
+        # too short
+        self.assertRaises(ValueError, lambda: b''.join(Bytewords.iter_decode(Bytewords_Style_minimal, ['aeaeaeae'])))
 
     def test_rng_1(self):
         rng = Xoshiro256.from_string("Wolf")
@@ -140,6 +206,53 @@ class TestUR(BaseClass):
         expected_numbers = [6, 5, 8, 4, 10, 5, 7, 10, 4, 9, 10, 9, 7, 7, 1, 1, 2, 9, 9, 2, 6, 4, 5, 7, 8, 5, 4, 2, 3, 8, 7, 4, 5, 1, 10, 9, 3, 10, 2, 6, 8, 5, 7, 9, 3, 1, 5, 2, 7, 1, 4, 4, 4, 4, 9, 4, 5, 5, 6, 9, 5, 1, 2, 8, 3, 3, 2, 8, 4, 3, 2, 1, 10, 8, 9, 3, 10, 8, 5, 5, 6, 7, 10, 5, 8, 9, 4, 6, 4, 2, 10, 2, 1, 7, 9, 6, 7, 4, 2, 5]
         assert(numbers == expected_numbers)
 
+    def test_rng_batch(self):
+        rng = Xoshiro256.from_string("Wolf")
+        reference = Xoshiro256.from_string("Wolf")
+
+        assert(list(rng.next_n(100)) == [reference.next() for i in range(100)])
+        assert(list(rng.next_doubles(100)) == [reference.next_double() for i in range(100)])
+        assert(rng.next_ints(1, 10, 100) == [reference.next_int(1, 10) for i in range(100)])
+        assert(list(rng.next_data(100)) == [reference.next_byte() for i in range(100)])
+        assert(rng.s == reference.s)
+
+    def test_rng_jump(self):
+        rng = Xoshiro256.from_string("Wolf")
+        rng.jump()
+        assert(rng.s == [0x1d327c3dd20c6154, 0x062c87119766f830, 0xd271e6d24a690ca0, 0x2b8ae7bf9277f1da])
+
+        rng = Xoshiro256.from_string("Wolf")
+        rng.long_jump()
+        assert(rng.s == [0x70749ed3c9de3cb1, 0xa8927020abc49774, 0x66eff6e3e4255c94, 0x92779186c657f01e])
+
+        # The fixed jumps are the jump polynomials for 2^128 and 2^192 steps
+        assert(CHARACTERISTIC_POLYNOMIAL == _make_characteristic_polynomial())
+        assert(jump_polynomial(1 << 128) == JUMP)
+        assert(jump_polynomial(1 << 192) == LONG_JUMP)
+        assert(list(JUMP_MATRIX) == _make_jump_matrix(JUMP))
+        assert(list(LONG_JUMP_MATRIX) == _make_jump_matrix(LONG_JUMP))
+
+        for n in [0, 1, 2, 3, 64, 255, 256, 1023, 1024, 1025, 5000]:
+            rng = Xoshiro256.from_string("Wolf")
+            reference = Xoshiro256.from_string("Wolf")
+            rng.jump_ahead(n)
+            reference.next_n(n)
+            assert(rng.s == reference.s)
+
+        # Jumps compose, and a jump of 2^128 is the same as `jump()`
+        rng = Xoshiro256.from_string("Wolf")
+        rng.jump_ahead(0xfedcba9876543210)
+        reference = Xoshiro256.from_string("Wolf")
+        reference.jump_ahead(0xfedcba9800000000)
+        reference.jump_ahead(0x76543210)
+        assert(rng.s == reference.s)
+
+        rng = Xoshiro256.from_string("Wolf")
+        rng.jump_ahead(1 << 128)
+        reference = Xoshiro256.from_string("Wolf")
+        reference.jump()
+        assert(rng.s == reference.s)
+
     def test_find_fragment_length(self):
         assert(FountainEncoder.find_nominal_fragment_length(12345, 1005, 1955) == 1764)
         assert(FountainEncoder.find_nominal_fragment_length(12345, 1005, 30000) == 12345)
@@ -156,6 +269,17 @@ class TestUR(BaseClass):
         expected_samples = [3, 3, 3, 3, 3, 3, 3, 0, 2, 3, 3, 3, 3, 1, 2, 2, 1, 3, 3, 2, 3, 3, 1, 1, 2, 1, 1, 3, 1, 3, 1, 2, 0, 2, 1, 0, 3, 3, 3, 1, 3, 3, 3, 3, 1, 3, 2, 3, 2, 2, 3, 3, 3, 3, 2, 3, 3, 0, 3, 3, 3, 3, 1, 2, 3, 3, 2, 2, 2, 1, 2, 2, 1, 2, 3, 1, 3, 0, 3, 2, 3, 3, 3, 3, 3, 3, 3, 3, 2, 3, 1, 3, 3, 2, 0, 2, 2, 3, 1, 1, 2, 3, 2, 3, 3, 3, 3, 2, 3, 3, 3, 3, 3, 2, 3, 1, 2, 1, 1, 3, 1, 3, 2, 2, 3, 3, 3, 1, 3, 3, 3, 3, 3, 3, 3, 3, 2, 3, 2, 3, 3, 1, 2, 3, 3, 1, 3, 2, 3, 3, 3, 2, 3, 1, 3, 0, 3, 2, 1, 1, 3, 1, 3, 2, 3, 3, 3, 3, 2, 0, 3, 3, 1, 3, 0, 2, 1, 3, 3, 1, 1, 3, 1, 2, 3, 3, 3, 0, 2, 3, 2, 0, 1, 3, 3, 3, 2, 2, 2, 3, 3, 3, 3, 3, 2, 3, 3, 3, 3, 2, 3, 3, 2, 0, 2, 3, 3, 3, 3, 2, 1, 1, 1, 2, 1, 3, 3, 3, 2, 2, 3, 3, 1, 2, 3, 0, 3, 2, 3, 3, 3, 3, 0, 2, 2, 3, 2, 2, 3, 3, 3, 3, 1, 3, 2, 3, 3, 3, 3, 3, 2, 2, 3, 1, 3, 0, 2, 1, 3, 3, 3, 3, 3, 3, 3, 3, 1, 3, 3, 3, 3, 2, 2, 2, 3, 1, 1, 3, 2, 2, 0, 3, 2, 1, 2, 1, 0, 3, 3, 3, 2, 2, 3, 2, 1, 2, 0, 0, 3, 3, 2, 3, 3, 2, 3, 3, 3, 3, 3, 2, 2, 2, 3, 3, 3, 3, 3, 1, 1, 3, 2, 2, 3, 1, 1, 0, 1, 3, 2, 3, 3, 2, 3, 3, 2, 3, 3, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 1, 2, 3, 3, 2, 2, 2, 2, 3, 3, 2, 0, 2, 1, 3, 3, 3, 3, 0, 3, 3, 3, 3, 2, 2, 3, 1, 3, 3, 3, 2, 3, 3, 3, 2, 3, 3, 3, 3, 2, 3, 2, 1, 3, 3, 3, 3, 2, 2, 0, 1, 2, 3, 2, 0, 3, 3, 3, 3, 3, 3, 1, 3, 3, 2, 3, 2, 2, 3, 3, 3, 3, 3, 2, 2, 3, 3, 2, 2, 2, 1, 3, 3, 3, 3, 1, 2, 3, 2, 3, 3, 2, 3, 2, 3, 3, 3, 2, 3, 1, 2, 3, 2, 1, 1, 3, 3, 2, 3, 3, 2, 3, 3, 0, 0, 1, 3, 3, 2, 3, 3, 3, 3, 1, 3, 3, 0, 3, 2, 3, 3, 1, 3, 3, 3, 3, 3, 3, 3, 0, 3, 3, 2]
         assert(samples == expected_samples)
 
+    def test_lru_cache(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert(cache.get('a') == 1)
+        cache.put('c', 3)  # evicts 'b', the least recently used
+        assert(cache.get('b') == None)
+        assert(cache.get('c') == 3)
+        assert(len(cache) == 2)
+        assert(cache.hits == 2 and cache.misses == 1)
+
     def test_shuffle(self):
         rng = Xoshiro256.from_string("Wolf")
         values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
@@ -177,6 +301,19 @@ class TestUR(BaseClass):
         ]
         assert(result == expectedResult)
 
+    def test_partial_shuffle(self):
+        for n in [1, 2, 10, 100]:
+            for count in [0, 1, n // 2, n]:
+                rng = Xoshiro256.from_string("Wolf-{}".format(n))
+                reference = Xoshiro256.from_string("Wolf-{}".format(n))
+                assert(partial_shuffled(n, count, rng) == shuffled(list(range(n)), reference)[0:count])
+
+        rng = Xoshiro256.from_string("Wolf")
+        n = 1000
+        ranks = [rng.next_int(0, n - j - 1) for j in range(n)]
+        remaining = list(range(n))
+        assert(take_ranked_fenwick(n, ranks) == [remaining.pop(k) for k in ranks])
+
     def test_partition_and_join(self):
         message = make_message(1024)
         fragment_len = FountainEncoder.find_nominal_fragment_length(len(message), 10, 100)
@@ -203,6 +340,10 @@ class TestUR(BaseClass):
         rejoined_message = FountainDecoder.join_fragments(fragments, len(message))
         assert(message == rejoined_message)
 
+        # Immutable messages can be partitioned too
+        fragments = FountainEncoder.partition_message(bytes(message), fragment_len)
+        assert([data_to_hex(f) for f in fragments] == expected_fragments)
+
     def test_choose_degree(self):
         message = make_message(1024)
         fragment_len = FountainEncoder.find_nominal_fragment_length(len(message), 10, 100)
@@ -215,6 +356,11 @@ class TestUR(BaseClass):
         expected_degrees = [11, 3, 6, 5, 2, 1, 2, 11, 1, 3, 9, 10, 10, 4, 2, 1, 1, 2, 1, 1, 5, 2, 4, 10, 3, 2, 1, 1, 3, 11, 2, 6, 2, 9, 9, 2, 6, 7, 2, 5, 2, 4, 3, 1, 6, 11, 2, 11, 3, 1, 6, 3, 1, 4, 5, 3, 6, 1, 1, 3, 1, 2, 2, 1, 4, 5, 1, 1, 9, 1, 1, 6, 4, 1, 5, 1, 2, 2, 3, 1, 1, 5, 2, 6, 1, 7, 11, 1, 8, 1, 5, 1, 1, 2, 2, 6, 4, 10, 1, 2, 5, 5, 5, 1, 1, 4, 1, 1, 1, 3, 5, 5, 5, 1, 4, 3, 3, 5, 1, 11, 3, 2, 8, 1, 2, 1, 1, 4, 5, 2, 1, 1, 1, 5, 6, 11, 10, 7, 4, 7, 1, 5, 3, 1, 1, 9, 1, 2, 5, 5, 2, 2, 3, 10, 1, 3, 2, 3, 3, 1, 1, 2, 1, 3, 2, 2, 1, 3, 8, 4, 1, 11, 6, 3, 1, 1, 1, 1, 1, 3, 1, 2, 1, 10, 1, 1, 8, 2, 7, 1, 2, 1, 9, 2, 10, 2, 1, 3, 4, 10]
         assert(degrees == expected_degrees)
 
+        # The degree sampler is built once per seq_len and then reused
+        hits = DEGREE_SAMPLER_CACHE.hits
+        choose_degree(len(fragments), Xoshiro256.from_string("Wolf"))
+        assert(DEGREE_SAMPLER_CACHE.hits == hits + 1)
+
     def test_choose_fragments(self):
         message = make_message(1024)
         checksum = crc32_int(message)
@@ -261,6 +407,38 @@ class TestUR(BaseClass):
         ]
         assert(fragment_indexes == expected_fragment_indexes)
 
+    def test_index_set(self):
+        a = IndexSet([5, 0, 130, 64])
+        b = IndexSet([0, 130])
+        assert(list(a) == [0, 5, 64, 130])
+        assert(len(a) == 4 and len(IndexSet()) == 0)
+        assert(130 in a and 6 not in a and -1 not in a)
+        assert(b.issubset(a) and not a.issubset(b))
+        assert(a.difference(b) == IndexSet([5, 64]))
+        assert(a.difference([5, 7]) == IndexSet([0, 64, 130]))
+        assert(b.union(IndexSet([3])) == IndexSet([0, 3, 130]))
+        assert(a.lowest() == 0 and IndexSet([99]).lowest() == 99)
+        assert(a == IndexSet([0, 5, 64, 130]) and a != b)
+        assert(len(set([a, IndexSet([130, 64, 5, 0]), b])) == 2)
+        assert(IndexSet.from_mask(0b1010) == IndexSet([1, 3]))
+
+        # Parts don't carry a __dict__
+        for p in [Part(1, 2, 3, 4, b''), FountainDecoder.Part([1], b''), make_message_ur(10), a]:
+            assert(not hasattr(p, '__dict__'))
+
+    def test_choose_fragments_batch(self):
+        message = make_message(1024)
+        checksum = crc32_int(message)
+        seq_nums = list(range(1, 200)) + [0xfffffffe]
+        for seq_len in [1, 2, 11, 100]:
+            expected = [choose_fragments(seq_num, seq_len, checksum) for seq_num in seq_nums]
+            assert(choose_fragments_batch(seq_nums, seq_len, checksum) == expected)
+
+        # More parts than are chosen at once
+        seq_nums = list(range(101, 102 + NUMPY_CHUNK_SIZE))
+        expected = [choose_fragments(seq_num, 100, checksum) for seq_num in seq_nums]
+        assert(choose_fragments_batch(seq_nums, 100, checksum) == expected)
+
     def test_xor(self):
         rng = Xoshiro256.from_string("Wolf")
         data1 = rng.next_data(10)
@@ -273,6 +451,50 @@ class TestUR(BaseClass):
         xor_into(data3, data1)
         assert(data3 == data2)
 
+    def test_xor_backends(self):
+        rng = Xoshiro256.from_string("Wolf")
+        data1 = rng.next_data(13)
+        data2 = rng.next_data(13)
+        data3 = rng.next_data(13)
+        expected = bytes([a ^ b ^ c for (a, b, c) in zip(data1, data2, data3)])
+
+        message = make_message(256)
+        saved_backend = xor_kernel.get_backend()
+        expected_parts = None
+        try:
+            assert(xor_kernel.select_backend().name == 'bigint')
+            for name in xor_kernel.BACKEND_NAMES:
+                try:
+                    xor_kernel.set_backend(name)
+                except ValueError:
+                    # NumPy isn't installed
+                    assert(name == 'numpy')
+                    continue
+                backend = xor_kernel.get_backend()
+                acc = backend.zero(13)
+                for data in [data1, data2, data3]:
+                    acc = backend.xor(acc, backend.load(data))
+                assert(backend.store(acc, 13) == expected)
+
+                assert(backend.xor_bytes(backend.xor_bytes(data1, data2), data3) == expected)
+                target = bytearray(data1)
+                xor_into(target, data2)
+                xor_into(target, data3)
+                assert(target == expected)
+
+                # Encoders produce the same parts whichever backend is used,
+                # with or without caching the converted fragments
+                for cache_native_fragments in [False, True]:
+                    encoder = FountainEncoder(message, 30, cache_native_fragments=cache_native_fragments)
+                    parts = [encoder.next_part().data for i in range(20)]
+                    if expected_parts == None:
+                        expected_parts = parts
+                    assert(parts == expected_parts)
+        finally:
+            xor_kernel.BACKEND = saved_backend
+
+        self.assertRaises(ValueError, lambda: xor_kernel.set_backend('none'))
+
     def test_fountain_encoder(self):
         message = make_message(256)
         encoder = FountainEncoder(message, 30)
@@ -369,6 +591,138 @@ class TestUR(BaseClass):
             print(decoder.result_error())
             assert(False)
 
+    def test_fountain_decoder_reused_buffer(self):
+        # A scanner may parse each frame from the same buffer, so the decoder
+        # must not hold on to views of it
+        message = make_message(10000)
+        encoder = FountainEncoder(message, 100)
+        for lazy in [False, True]:
+            for solver in [Fountain_Solver_peeling, Fountain_Solver_gaussian]:
+                decoder = FountainDecoder(solver=solver, lazy=lazy)
+                buf = bytearray(200)
+                seq_num = 0
+                while not decoder.is_complete():
+                    seq_num += 1
+                    if seq_num <= encoder.seq_len() and seq_num % 2 != 0:
+                        continue
+                    cbor = encoder.part_at(seq_num).cbor()
+                    buf[0:len(cbor)] = cbor
+                    decoder.receive_part(Part.from_cbor(buf))
+                assert(decoder.result_message() == message)
+
+    def test_fountain_decoder_peeling(self):
+        message = make_message(20000)
+        encoder = FountainEncoder(message, 100)
+        decoder = FountainDecoder()
+        seq_num = 0
+        while not decoder.is_complete():
+            seq_num += 1
+            # Drop most of the pure parts, so the message has to be peeled
+            if seq_num <= encoder.seq_len() and seq_num % 4 != 0:
+                continue
+            part = encoder.part_at(seq_num)
+            decoder.receive_part(part)
+            decoder.receive_part(part)
+
+            # Every mixed part is indexed under each of its fragments, and
+            # none of them contains a fragment that has been received
+            for (indexes, p) in decoder.mixed_parts.items():
+                assert(indexes == p.indexes and len(indexes) > 1)
+                for index in indexes:
+                    assert(p in decoder.fragment_parts[index])
+                    assert(index not in decoder.received_part_indexes)
+        assert(decoder.result_message() == message)
+
+    def test_fountain_decoder_gaussian(self):
+        message = make_message(10000)
+        encoder = FountainEncoder(message, 100)
+
+        # Without any pure parts, elimination needs far fewer parts than peeling
+        counts = []
+        for solver in [Fountain_Solver_peeling, Fountain_Solver_gaussian]:
+            decoder = FountainDecoder(solver=solver)
+            seq_num = encoder.seq_len()
+            while not decoder.is_complete():
+                seq_num += 1
+                decoder.receive_part(encoder.part_at(seq_num))
+            assert(decoder.result_message() == message)
+            counts.append(decoder.processed_parts_count)
+        assert(counts[1] < counts[0])
+        assert(counts[1] < encoder.seq_len() + 20)
+
+        # Pure and repeated parts
+        decoder = FountainDecoder(solver=Fountain_Solver_gaussian)
+        for seq_num in [3, 1, 3, 150, 150, 2] + list(range(4, 200)):
+            if decoder.is_complete():
+                break
+            decoder.receive_part(encoder.part_at(seq_num))
+        assert(decoder.result_message() == message)
+
+        ur = make_message_ur(10000)
+        ur_encoder = UREncoder(ur, 100)
+        decoder = URDecoder(solver=Fountain_Solver_gaussian)
+        while not decoder.is_complete():
+            decoder.receive_part(ur_encoder.next_part())
+        assert(decoder.result == ur)
+
+        self.assertRaises(ValueError, lambda: FountainDecoder(solver='magic'))
+
+    def test_fountain_decoder_lazy(self):
+        message = make_message(30000)
+        encoder = FountainEncoder(message, 1000)
+        for solver in [Fountain_Solver_peeling, Fountain_Solver_gaussian]:
+            decoder = FountainDecoder(solver=solver, lazy=True)
+            seq_num = 0
+            while not decoder.is_complete():
+                seq_num += 1
+                if seq_num <= encoder.seq_len() and seq_num % 3 != 0:
+                    continue
+                decoder.receive_part(encoder.part_at(seq_num))
+            assert(decoder.result_message() == message)
+            # Each recovered fragment's data is only computed once
+            assert(len(decoder.fragment_data) == encoder.seq_len())
+            assert(len(decoder.received_data) == decoder.processed_parts_count)
+
+        ur = make_message_ur(10000)
+        ur_encoder = UREncoder(ur, 100)
+        decoder = URDecoder(lazy=True)
+        while not decoder.is_complete():
+            decoder.receive_part(ur_encoder.next_part())
+        assert(decoder.result == ur)
+
+    def test_schedule_cache(self):
+        message = make_message(1024)
+        checksum = crc32_int(message)
+        cache = ScheduleCache(100)
+        for seq_num in range(1, 40):
+            assert(cache.get(seq_num, 11, checksum) == choose_fragments(seq_num, 11, checksum))
+        assert(cache.hits() == 0)
+        for seq_num in range(1, 40):
+            cache.get(seq_num, 11, checksum)
+        assert(cache.hits() == cache.misses())
+
+        # An encoder and a decoder sharing a cache only compute each schedule once
+        cache = ScheduleCache(100)
+        encoder = FountainEncoder(message, 100, schedule_cache=cache)
+        decoder = FountainDecoder(schedule_cache=cache)
+        while not decoder.is_complete():
+            decoder.receive_part(encoder.next_part())
+        assert(decoder.result_message() == message)
+        assert(cache.hits() == cache.misses())
+
+        # Prewarming computes the following schedules in the background
+        cache = ScheduleCache(100, prewarm_count=10)
+        if cache.prewarm_count != 0:
+            import time
+            cache.prewarm(20, 11, checksum)
+            for i in range(500):
+                if not cache.prewarm_running:
+                    break
+                time.sleep(0.01)
+            for seq_num in range(21, 31):
+                cache.get(seq_num, 11, checksum)
+            assert(cache.hits() == 10 and cache.misses() == 0)
+
     def test_fountain_cbor(self):
         part = Part(12, 8, 100, 0x12345678, bytes([1, 5, 3, 3 ,5]))
         cbor = part.cbor()
@@ -376,6 +730,30 @@ class TestUR(BaseClass):
         cbor2 = part2.cbor()
         assert(cbor == cbor2)
 
+        # Every integer width, with the data returned as a view
+        part = Part(0x100000000, 0x10000, 0x100, 0x12345678, bytes(range(30)))
+        cbor = bytes(part.cbor()) + b'trailing'
+        part2 = Part.from_cbor(cbor)
+        assert((part2.seq_num, part2.seq_len, part2.message_len, part2.checksum) == (0x100000000, 0x10000, 0x100, 0x12345678))
+        assert(isinstance(part2.data, memoryview) and part2.data == bytes(range(30)))
+
+        def header_error(cbor):
+            try:
+                Part.from_cbor(cbor)
+            except InvalidHeader as err:
+                return err.code
+            return None
+
+        cbor = bytes(Part(12, 8, 100, 0x12345678, bytes([1, 5, 3, 3, 5])).cbor())
+        assert(header_error(b'') == InvalidHeader_truncated)
+        assert(header_error(cbor[0:-1]) == InvalidHeader_truncated)
+        assert(header_error(cbor[0:4]) == InvalidHeader_truncated)
+        assert(header_error(b'\xa5' + cbor[1:]) == InvalidHeader_not_array)
+        assert(header_error(b'\x84' + cbor[1:]) == InvalidHeader_wrong_array_size)
+        assert(header_error(cbor[0:1] + b'\x2c' + cbor[2:]) == InvalidHeader_not_unsigned)
+        assert(header_error(cbor[0:1] + b'\x1c' + cbor[2:]) == InvalidHeader_bad_additional)
+        assert(header_error(cbor[0:10] + b'\x65' + cbor[11:]) == InvalidHeader_not_bytes)
+
     def test_single_part_ur(self):
         ur = make_message_ur(50)
         encoded = UREncoder.encode(ur)
@@ -423,6 +801,256 @@ class TestUR(BaseClass):
         ]
         assert(parts == expected_parts)
 
+    def test_qr_capacity(self):
+        assert(qr_capacity(1, 'L', 'alphanumeric') == 25)
+        assert(qr_capacity(1, 'H', 'byte') == 7)
+        assert(qr_capacity(10, 'M', 'alphanumeric') == 311)
+        assert(qr_capacity(40, 'L', 'alphanumeric') == 4296)
+        assert(qr_capacity(40, 'L', 'byte') == 2953)
+        self.assertRaises(ValueError, lambda: qr_capacity(41, 'L', 'byte'))
+        self.assertRaises(ValueError, lambda: qr_capacity(1, 'X', 'byte'))
+
+    def test_ur_part_length(self):
+        ur = make_message_ur(1000)
+        # Sequence numbers around the CBOR integer width boundaries
+        for first_seq_num in [0, 22, 254, 65534, 0xfffffffd]:
+            encoder = UREncoder(ur, 100, first_seq_num)
+            for i in range(3):
+                part = encoder.next_part()
+                fountain_encoder = encoder.fountain_encoder
+                expected = UREncoder.part_length(ur.type, fountain_encoder.seq_num, fountain_encoder.seq_len(),
+                    fountain_encoder.message_len, fountain_encoder.checksum, fountain_encoder.fragment_len)
+                assert(len(part) == expected)
+
+        assert(UREncoder.single_part_length(ur) == len(UREncoder.encode(ur)))
+
+    def test_ur_plan(self):
+        ur = make_message_ur(32767)
+        for (version, ecc, mode) in [(5, 'L', 'alphanumeric'), (10, 'M', 'byte'), (25, 'Q', 'alphanumeric'), (40, 'H', 'byte')]:
+            capacity = qr_capacity(version, ecc, mode)
+            fragment_len = UREncoder.plan(ur, version, ecc, mode)
+
+            # Every part fits, even after the sequence number has grown large
+            for first_seq_num in [0, 0xfffffffd]:
+                encoder = UREncoder(ur, fragment_len, first_seq_num, min_fragment_len=1)
+                assert(encoder.fountain_encoder.fragment_len == fragment_len)
+                for i in range(3):
+                    assert(len(encoder.next_part()) <= capacity)
+
+            # One fewer fragment wouldn't fit
+            seq_len = encoder.fountain_encoder.seq_len()
+            larger_len = (len(ur.cbor) + seq_len - 2) // (seq_len - 1)
+            assert(UREncoder.part_length(ur.type, 0xfffffffe, seq_len - 1, len(ur.cbor), encoder.fountain_encoder.checksum, larger_len) > capacity)
+
+        # Small URs fit in a single part
+        ur = make_message_ur(10)
+        assert(UREncoder.plan(ur, 2, 'L') == len(ur.cbor))
+
+        self.assertRaises(ValueError, lambda: UREncoder.plan(make_message_ur(1000), 1, 'H'))
+
+    def test_part_at(self):
+        message = make_message(1024)
+        encoder = FountainEncoder(message, 100, 0xfffffff0)
+        expected = [encoder.next_part().cbor() for i in range(40)]
+
+        # Random access doesn't depend on, or change, the encoder state
+        encoder = FountainEncoder(message, 100)
+        for i in reversed(range(40)):
+            assert(encoder.part_at(0xfffffff1 + i).cbor() == expected[i])
+        assert(encoder.seq_num == 0)
+        assert([p.cbor() for p in encoder.parts_range(0xfffffff1, 0xfffffff1 + 40, 3)] == expected[0::3])
+
+        ur = make_message_ur(1024)
+        encoder = UREncoder(ur, 100)
+        expected = [encoder.next_part() for i in range(30)]
+        encoder = UREncoder(ur, 100)
+        assert(encoder.ur_part_at(25) == expected[24])
+        assert(list(encoder.parts_range(1, 31)) == expected)
+        assert(encoder.next_part() == expected[0])
+
+        # Single-part URs
+        ur = make_message_ur(10)
+        encoder = UREncoder(ur, 100)
+        assert(encoder.ur_part_at(7) == UREncoder.encode(ur))
+
+    def test_striped_encoders(self):
+        ur = make_message_ur(32767)
+        stripe_count = 3
+        encoders = [UREncoder(ur, 1000, stripe_index=i, stripe_count=stripe_count) for i in range(stripe_count)]
+        seq_len = encoders[0].fountain_encoder.seq_len()
+
+        # Each stripe gets every third sequence number, starting with the pure parts
+        seq_nums = [[] for i in range(stripe_count)]
+        for i in range(stripe_count):
+            while not encoders[i].is_complete():
+                encoders[i].next_part()
+                seq_nums[i].append(encoders[i].fountain_encoder.seq_num)
+            for j in range(20):
+                encoders[i].next_part()
+                seq_nums[i].append(encoders[i].fountain_encoder.seq_num)
+            assert(seq_nums[i] == list(range(i + 1, 3 * len(seq_nums[i]) + 1, 3)))
+        assert(sorted(sum([s[0:11] for s in seq_nums], [])) == list(range(1, seq_len + 1)))
+
+        # Receiving from all displays at once needs about a third as many rounds
+        encoders = [UREncoder(ur, 1000, stripe_index=i, stripe_count=stripe_count) for i in range(stripe_count)]
+        decoder = URDecoder()
+        rounds = 0
+        while not decoder.is_complete():
+            rounds += 1
+            for encoder in encoders:
+                decoder.receive_part(encoder.next_part())
+        assert(decoder.result == ur)
+        assert(rounds <= (seq_len + stripe_count - 1) // stripe_count + 2)
+
+    def test_generate_parts(self):
+        ur = make_message_ur(10000)
+        encoder = UREncoder(ur, 100)
+        expected = [encoder.next_part() for i in range(300)]
+
+        assert(list(generate_parts(ur, 100, range(1, 301))) == expected)
+        assert(list(generate_parts(ur, 100, range(1, 301), workers=2, chunk_size=16)) == expected)
+        assert(list(generate_parts(ur, 100, range(2, 301, 7), workers=2, chunk_size=5)) == expected[1::7])
+
+    def test_part_template(self):
+        message = make_message(1000)
+        encoder = FountainEncoder(message, 100)
+        template = PartTemplate('bytes', encoder.seq_len(), encoder.message_len, encoder.checksum, encoder.fragment_len)
+        # Every seq_num width
+        for seq_num in [1, 23, 24, 255, 256, 65535, 65536, 0xfffffffe, 0x100000000]:
+            part = encoder.part_at(seq_num)
+            part.seq_num = seq_num
+            assert(template.encode(seq_num, part.data) == UREncoder.encode_part('bytes', part))
+
+    def test_prefetching_encoder(self):
+        ur = make_message_ur(32767)
+        expected_encoder = UREncoder(ur, 1000, 100)
+        expected = [expected_encoder.next_part() for i in range(20)]
+
+        # Cooperative stepping
+        encoder = PrefetchingEncoder(UREncoder(ur, 1000, 100), 4)
+        assert(encoder.get_frame() == None)
+        assert(encoder.underrun_count() == 1)
+        encoder.fill()
+        assert(encoder.fill_level() == 4 and encoder.is_full())
+        assert(not encoder.step())
+        frames = []
+        while len(frames) < 20:
+            encoder.step()
+            frames.append(encoder.get_frame())
+        assert(frames == expected)
+        assert(encoder.underrun_count() == 1)
+
+        # Background thread
+        if PrefetchingEncoder.threads_available():
+            import time
+            encoder = PrefetchingEncoder(UREncoder(ur, 1000, 100), 4)
+            encoder.start()
+            frames = []
+            for i in range(2000):
+                frame = encoder.get_frame()
+                if frame != None:
+                    frames.append(frame)
+                    if len(frames) == 20:
+                        break
+                else:
+                    time.sleep(0.001)
+            encoder.stop()
+            assert(frames == expected)
+            assert(encoder.frames_displayed + encoder.fill_level() == encoder.frames_generated)
+
+    def test_ur_decoder_duplicates(self):
+        ur = make_message_ur(32767)
+        encoder = UREncoder(ur, 1000, 100)
+        decoder = URDecoder()
+        received = 0
+        while not decoder.is_complete():
+            part = encoder.next_part()
+            assert(decoder.receive_part(part))
+            received += 1
+            # The same frame read again, and the same part in upper case
+            assert(not decoder.receive_part(part))
+            assert(not decoder.receive_part(part.upper()))
+        assert(decoder.result == ur)
+        # Parts after the last are rejected because decoding is complete
+        assert(decoder.duplicate_parts_count == received - 1)
+        assert(decoder.duplicate_seq_nums_count == received - 1)
+        assert(decoder.seen_parts.hits == received - 1)
+
+        # Bad frames are rejected every time, but a good frame for the same
+        # sequence number is still accepted
+        encoder = UREncoder(ur, 1000, 100)
+        decoder = URDecoder()
+        part = encoder.next_part()
+        bad_part = part[0:-4] + ('ae' if part[-4:-2] != 'ae' else 'ad') + part[-2:]
+        assert(not decoder.receive_part(bad_part))
+        assert(not decoder.receive_part(bad_part))
+        assert(decoder.receive_part(part))
+        assert(decoder.duplicate_parts_count == 1)
+
+        # Garbage and frames of other messages don't take up room in the cache
+        decoder = URDecoder(seen_parts_size=2)
+        assert(decoder.receive_part(part))
+        other = UREncoder(make_message_ur(3000), 1000).next_part()
+        for bad in ['ur:bytes', 'not a ur', 'ur:other/1-33/' + part[14:], other]:
+            assert(not decoder.receive_part(bad))
+        assert(len(decoder.seen_parts) == 1)
+        assert(not decoder.receive_part(part))
+        assert(decoder.duplicate_parts_count == 1)
+
+        # Without the cache, repeats reach the fountain decoder
+        decoder = URDecoder(seen_parts_size=0)
+        assert(decoder.receive_part(part))
+        assert(decoder.receive_part(part))
+        assert(decoder.duplicate_parts_count == 0)
+
+    def test_ur_type(self):
+        for type in ['bytes', 'crypto-seed', 'crypto-hdkey', 'abc123', '-']:
+            assert(is_ur_type(type))
+        for type in ['', 'Bytes', 'crypto_seed', 'a/b', 'bytes\n', 'bytes!', 'z{']:
+            assert(not is_ur_type(type))
+
+    def test_ur_decoder_admission(self):
+        ur = make_message_ur(32767)
+        encoder = UREncoder(ur, 1000, 0)
+        parts = [encoder.next_part() for i in range(40)]
+        decoder = URDecoder()
+        assert(decoder.receive_part(parts[0]))
+
+        # Frames for another type or message length are rejected by their header
+        assert(not decoder.receive_part('ur:other' + parts[1][8:]))
+        other = UREncoder(make_message_ur(3000), 1000).next_part()
+        assert(not decoder.receive_part(other))
+        assert(not decoder.admit_part(1, 4))
+        assert(not decoder.admit_part(0, 33))
+
+        # A pure part whose fragment has been received isn't needed
+        assert(not decoder.admit_part(1, 33))
+        assert(decoder.admit_part(2, 33))
+        assert(decoder.admit_part(34, 33))
+
+        # Malformed frames
+        for part in ['', 'ur:bytes', 'ur:bytes/', 'ur:bytes/2-33/', 'ur:bytes/2-33/ab/cd', 'ur:by_tes/2-33/' + parts[1][14:]]:
+            assert(not decoder.receive_part(part))
+        assert(URDecoder.parse_header('UR:Bytes/2-33/abcd') == ('bytes', 2, 33, 'abcd'))
+        assert(URDecoder.parse_header('ur:bytes/abcd') == ('bytes', None, None, 'abcd'))
+        assert(URDecoder.parse_header('ur:bytes/+2-33/ab') == ('bytes', None, None, '+2-33/ab'))
+        assert(URDecoder.parse_header('ur:bytes/2-/ab') == ('bytes', None, None, '2-/ab'))
+        for part in ['uri:bytes/ab', 'ur:bytes', 'ur:/ab', 'ur:by_tes/ab']:
+            assert(URDecoder.parse_header(part) == None)
+
+        # Headers in upper case are fine
+        assert(decoder.receive_part(parts[1].upper()))
+        for part in parts[2:]:
+            decoder.receive_part(part)
+        assert(decoder.result == ur)
+        assert(not decoder.receive_part(parts[0]))
+
+        # Single-part URs
+        ur = make_message_ur(10)
+        decoder = URDecoder()
+        assert(decoder.receive_part(UREncoder.encode(ur).upper()))
+        assert(decoder.result == ur)
+
     def test_multipart_ur(self):
         ur = make_message_ur(32767)
         max_fragment_len = 1000
@@ -445,30 +1073,52 @@ class TestUR(BaseClass):
         try:
             print('test_crc32()')
             self.test_crc32()
+            print('test_crc32_incremental()')
+            self.test_crc32_incremental()
+            print('test_frozen_tables()')
+            self.test_frozen_tables()
+            print('test_lazy_package_names()')
+            self.test_lazy_package_names()
             print('test_bytewords_1()')
             self.test_bytewords_1()
             print('test_bytewords_2()')
             self.test_bytewords_2()
+            print('test_bytewords_streaming()')
+            self.test_bytewords_streaming()
             print('test_rng_1()')
             self.test_rng_1()
             print('test_rng_2()')
             self.test_rng_2()
             print('test_rng_3()')
             self.test_rng_3()
+            print('test_rng_batch()')
+            self.test_rng_batch()
+            print('test_rng_jump()')
+            self.test_rng_jump()
             print('test_find_fragment_length()')
             self.test_find_fragment_length()
             print('test_random_sampler()')
             self.test_random_sampler()
+            print('test_lru_cache()')
+            self.test_lru_cache()
             print('test_shuffle()')
             self.test_shuffle()
+            print('test_partial_shuffle()')
+            self.test_partial_shuffle()
             print('test_partition_and_join()')
             self.test_partition_and_join()
             print('test_choose_degree()')
             self.test_choose_degree()
             print('test_choose_fragments()')
             self.test_choose_fragments()
+            print('test_index_set()')
+            self.test_index_set()
+            print('test_choose_fragments_batch()')
+            self.test_choose_fragments_batch()
             print('test_xor()')
             self.test_xor()
+            print('test_xor_backends()')
+            self.test_xor_backends()
             print('test_fountain_encoder()')
             self.test_fountain_encoder()
             print('test_fountain_encoder_cbor()')
@@ -477,12 +1127,44 @@ class TestUR(BaseClass):
             self.test_fountain_encoder_is_complete()
             print('test_fountain_decoder()')
             self.test_fountain_decoder()
+            print('test_fountain_decoder_reused_buffer()')
+            self.test_fountain_decoder_reused_buffer()
+            print('test_fountain_decoder_peeling()')
+            self.test_fountain_decoder_peeling()
+            print('test_fountain_decoder_gaussian()')
+            self.test_fountain_decoder_gaussian()
+            print('test_fountain_decoder_lazy()')
+            self.test_fountain_decoder_lazy()
+            print('test_schedule_cache()')
+            self.test_schedule_cache()
             print('test_fountain_cbor()')
             self.test_fountain_cbor()
             print('test_single_part_ur()')
             self.test_single_part_ur()
             print('test_ur_encoder()')
             self.test_ur_encoder()
+            print('test_qr_capacity()')
+            self.test_qr_capacity()
+            print('test_ur_part_length()')
+            self.test_ur_part_length()
+            print('test_ur_plan()')
+            self.test_ur_plan()
+            print('test_part_at()')
+            self.test_part_at()
+            print('test_striped_encoders()')
+            self.test_striped_encoders()
+            print('test_generate_parts()')
+            self.test_generate_parts()
+            print('test_part_template()')
+            self.test_part_template()
+            print('test_prefetching_encoder()')
+            self.test_prefetching_encoder()
+            print('test_ur_decoder_duplicates()')
+            self.test_ur_decoder_duplicates()
+            print('test_ur_type()')
+            self.test_ur_type()
+            print('test_ur_decoder_admission()')
+            self.test_ur_decoder_admission()
             print('test_multipart_ur()')
             self.test_multipart_ur()
         except Exception as err:
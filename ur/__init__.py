@@ -0,0 +1,34 @@
+#
+# __init__.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+# The main classes can be used directly from the package, e.g. `ur.UREncoder`.
+# Each submodule is only imported the first time one of its names is accessed,
+# so `import ur` stays cheap and a program only loads the parts it uses.
+_LAZY_NAMES = {
+    'UR': 'ur',
+    'UREncoder': 'ur_encoder',
+    'PrefetchingEncoder': 'prefetching_encoder',
+    'URDecoder': 'ur_decoder',
+    'Bytewords': 'bytewords',
+    'FountainEncoder': 'fountain_encoder',
+    'FountainDecoder': 'fountain_decoder',
+    'Xoshiro256': 'xoshiro256',
+    'Crc32': 'crc32',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name == None:
+        raise AttributeError("module 'ur' has no attribute '{}'".format(name))
+
+    module = __import__('ur.' + module_name, None, None, [name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_LAZY_NAMES.keys()))
@@ -5,71 +5,80 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
+from .crc32 import Crc32
 from .utils import crc32_bytes, partition
 
 BYTEWORDS = 'ableacidalsoapexaquaarchatomauntawayaxisbackbaldbarnbeltbetabiasbluebodybragbrewbulbbuzzcalmcashcatschefcityclawcodecolacookcostcruxcurlcuspcyandarkdatadaysdelidicedietdoordowndrawdropdrumdulldutyeacheasyechoedgeepicevenexamexiteyesfactfairfernfigsfilmfishfizzflapflewfluxfoxyfreefrogfuelfundgalagamegeargemsgiftgirlglowgoodgraygrimgurugushgyrohalfhanghardhawkheathelphighhillholyhopehornhutsicedideaidleinchinkyintoirisironitemjadejazzjoinjoltjowljudojugsjumpjunkjurykeepkenokeptkeyskickkilnkingkitekiwiknoblamblavalazyleaflegsliarlimplionlistlogoloudloveluaulucklungmainmanymathmazememomenumeowmildmintmissmonknailnavyneednewsnextnoonnotenumbobeyoboeomitonyxopenovalowlspaidpartpeckplaypluspoempoolposepuffpumapurrquadquizraceramprealredorichroadrockroofrubyruinrunsrustsafesagascarsetssilkskewslotsoapsolosongstubsurfswantacotasktaxitenttiedtimetinytoiltombtoystriptunatwinuglyundouniturgeuservastveryvetovialvibeviewvisavoidvowswallwandwarmwaspwavewaxywebswhatwhenwhizwolfworkyankyawnyellyogayurtzapszerozestzinczonezoom'
-WORD_ARRAY = None
 
-def decode_word(word, word_len):
-    global WORD_ARRAY
-    global BYTEWORDS
+# Precomputed lookup tables, stored as constants so they can be frozen into
+# firmware. WORDS and MINIMAL_WORDS map a byte value to its full and minimal
+# Byteword. The decode maps go straight from a (lowercase) token to its byte
+# value. Since the first and last letters of each Byteword are unique, the
+# minimal map holds every valid two-letter token, and the full map also
+# validates the two middle letters.
+WORDS = (
+    'able', 'acid', 'also', 'apex', 'aqua', 'arch', 'atom', 'aunt', 'away', 'axis', 'back', 'bald', 'barn', 'belt', 'beta', 'bias',
+    'blue', 'body', 'brag', 'brew', 'bulb', 'buzz', 'calm', 'cash', 'cats', 'chef', 'city', 'claw', 'code', 'cola', 'cook', 'cost',
+    'crux', 'curl', 'cusp', 'cyan', 'dark', 'data', 'days', 'deli', 'dice', 'diet', 'door', 'down', 'draw', 'drop', 'drum', 'dull',
+    'duty', 'each', 'easy', 'echo', 'edge', 'epic', 'even', 'exam', 'exit', 'eyes', 'fact', 'fair', 'fern', 'figs', 'film', 'fish',
+    'fizz', 'flap', 'flew', 'flux', 'foxy', 'free', 'frog', 'fuel', 'fund', 'gala', 'game', 'gear', 'gems', 'gift', 'girl', 'glow',
+    'good', 'gray', 'grim', 'guru', 'gush', 'gyro', 'half', 'hang', 'hard', 'hawk', 'heat', 'help', 'high', 'hill', 'holy', 'hope',
+    'horn', 'huts', 'iced', 'idea', 'idle', 'inch', 'inky', 'into', 'iris', 'iron', 'item', 'jade', 'jazz', 'join', 'jolt', 'jowl',
+    'judo', 'jugs', 'jump', 'junk', 'jury', 'keep', 'keno', 'kept', 'keys', 'kick', 'kiln', 'king', 'kite', 'kiwi', 'knob', 'lamb',
+    'lava', 'lazy', 'leaf', 'legs', 'liar', 'limp', 'lion', 'list', 'logo', 'loud', 'love', 'luau', 'luck', 'lung', 'main', 'many',
+    'math', 'maze', 'memo', 'menu', 'meow', 'mild', 'mint', 'miss', 'monk', 'nail', 'navy', 'need', 'news', 'next', 'noon', 'note',
+    'numb', 'obey', 'oboe', 'omit', 'onyx', 'open', 'oval', 'owls', 'paid', 'part', 'peck', 'play', 'plus', 'poem', 'pool', 'pose',
+    'puff', 'puma', 'purr', 'quad', 'quiz', 'race', 'ramp', 'real', 'redo', 'rich', 'road', 'rock', 'roof', 'ruby', 'ruin', 'runs',
+    'rust', 'safe', 'saga', 'scar', 'sets', 'silk', 'skew', 'slot', 'soap', 'solo', 'song', 'stub', 'surf', 'swan', 'taco', 'task',
+    'taxi', 'tent', 'tied', 'time', 'tiny', 'toil', 'tomb', 'toys', 'trip', 'tuna', 'twin', 'ugly', 'undo', 'unit', 'urge', 'user',
+    'vast', 'very', 'veto', 'vial', 'vibe', 'view', 'visa', 'void', 'vows', 'wall', 'wand', 'warm', 'wasp', 'wave', 'waxy', 'webs',
+    'what', 'when', 'whiz', 'wolf', 'work', 'yank', 'yawn', 'yell', 'yoga', 'yurt', 'zaps', 'zero', 'zest', 'zinc', 'zone', 'zoom',
+)
 
-    if len(word) != word_len:
-        raise ValueError('Invalid Bytewords.')
+MINIMAL_WORDS = (
+    'ae', 'ad', 'ao', 'ax', 'aa', 'ah', 'am', 'at', 'ay', 'as', 'bk', 'bd', 'bn', 'bt', 'ba', 'bs',
+    'be', 'by', 'bg', 'bw', 'bb', 'bz', 'cm', 'ch', 'cs', 'cf', 'cy', 'cw', 'ce', 'ca', 'ck', 'ct',
+    'cx', 'cl', 'cp', 'cn', 'dk', 'da', 'ds', 'di', 'de', 'dt', 'dr', 'dn', 'dw', 'dp', 'dm', 'dl',
+    'dy', 'eh', 'ey', 'eo', 'ee', 'ec', 'en', 'em', 'et', 'es', 'ft', 'fr', 'fn', 'fs', 'fm', 'fh',
+    'fz', 'fp', 'fw', 'fx', 'fy', 'fe', 'fg', 'fl', 'fd', 'ga', 'ge', 'gr', 'gs', 'gt', 'gl', 'gw',
+    'gd', 'gy', 'gm', 'gu', 'gh', 'go', 'hf', 'hg', 'hd', 'hk', 'ht', 'hp', 'hh', 'hl', 'hy', 'he',
+    'hn', 'hs', 'id', 'ia', 'ie', 'ih', 'iy', 'io', 'is', 'in', 'im', 'je', 'jz', 'jn', 'jt', 'jl',
+    'jo', 'js', 'jp', 'jk', 'jy', 'kp', 'ko', 'kt', 'ks', 'kk', 'kn', 'kg', 'ke', 'ki', 'kb', 'lb',
+    'la', 'ly', 'lf', 'ls', 'lr', 'lp', 'ln', 'lt', 'lo', 'ld', 'le', 'lu', 'lk', 'lg', 'mn', 'my',
+    'mh', 'me', 'mo', 'mu', 'mw', 'md', 'mt', 'ms', 'mk', 'nl', 'ny', 'nd', 'ns', 'nt', 'nn', 'ne',
+    'nb', 'oy', 'oe', 'ot', 'ox', 'on', 'ol', 'os', 'pd', 'pt', 'pk', 'py', 'ps', 'pm', 'pl', 'pe',
+    'pf', 'pa', 'pr', 'qd', 'qz', 're', 'rp', 'rl', 'ro', 'rh', 'rd', 'rk', 'rf', 'ry', 'rn', 'rs',
+    'rt', 'se', 'sa', 'sr', 'ss', 'sk', 'sw', 'st', 'sp', 'so', 'sg', 'sb', 'sf', 'sn', 'to', 'tk',
+    'ti', 'tt', 'td', 'te', 'ty', 'tl', 'tb', 'ts', 'tp', 'ta', 'tn', 'uy', 'uo', 'ut', 'ue', 'ur',
+    'vt', 'vy', 'vo', 'vl', 've', 'vw', 'va', 'vd', 'vs', 'wl', 'wd', 'wm', 'wp', 'we', 'wy', 'ws',
+    'wt', 'wn', 'wz', 'wf', 'wk', 'yk', 'yn', 'yl', 'ya', 'yt', 'zs', 'zo', 'zt', 'zc', 'ze', 'zm',
+)
 
-    dim = 26
-
-    # Since the first and last letters of each Byteword are unique,
-    # we can use them as indexes into a two-dimensional lookup table.
-    # This table is generated lazily.
-    if WORD_ARRAY == None:
-        WORD_ARRAY = [-1] * (dim * dim)  # create empty array
-
-        for i in range(256):
-            byteword_offset = i * 4
-            x = ord(BYTEWORDS[byteword_offset]) - ord('a')
-            y = ord(BYTEWORDS[byteword_offset + 3]) - ord('a')
-            array_offset = y * dim + x
-            WORD_ARRAY[array_offset] = i
-
-    # If the coordinates generated by the first and last letters are out of bounds,
-    # or the lookup table contains -1 at the coordinates, then the word is not valid.
-    x = ord(word[0].lower()) - ord('a')
-    y = ord((word[3 if len(word) == 4 else 1]).lower()) - ord('a')
-    if not (0 <= x and x < dim and 0 <= y and y < dim):
-        raise ValueError('Invalid Bytewords.')
+WORD_DECODE_MAP = dict((w, i) for i, w in enumerate(WORDS))
+MINIMAL_WORD_DECODE_MAP = dict((w, i) for i, w in enumerate(MINIMAL_WORDS))
 
-    offset = y * dim + x
-    value = WORD_ARRAY[offset]
-    if value == -1:
+def decode_word(word, word_len):
+    if len(word) != word_len:
         raise ValueError('Invalid Bytewords.')
 
-    # If we're decoding a full four-letter word, verify that the two middle letters are correct.
-    if len(word) == 4:
-        byteword_offset = value * 4
-        c1 = word[1].lower()
-        c2 = word[2].lower()
-        if c1 != BYTEWORDS[byteword_offset + 1] or c2 != BYTEWORDS[byteword_offset + 2]:
+    table = WORD_DECODE_MAP if word_len == 4 else MINIMAL_WORD_DECODE_MAP
+    value = table.get(word)
+    if value == None:
+        value = table.get(word.lower())
+        if value == None:
             raise ValueError('Invalid Bytewords.')
 
     # Successful decode.
     return value
 
 def get_word(index):
-    byteword_offset = index * 4
-    return BYTEWORDS[byteword_offset:byteword_offset + 4]
+    return WORDS[index]
 
 def get_minimal_word(index):
-    byteword_offset = index * 4
-    return BYTEWORDS[byteword_offset] + BYTEWORDS[byteword_offset + 3]
+    return MINIMAL_WORDS[index]
 
 def encode(buf, separator):
-    words = []
-    for i in range(len(buf)):
-        byte = buf[i]
-        words.append(get_word(byte))
-
-    return separator.join(words)
+    return separator.join([WORDS[byte] for byte in buf])
 
 def add_crc(buf):
     crc_buf = crc32_bytes(buf)
@@ -80,25 +89,26 @@ def encode_with_separator(buf, separator):
     return encode(crc_buf, separator)
 
 def encode_minimal(buf):
-    result = ''
-
     crc_buf = add_crc(buf)
-    for i in range(len(crc_buf)):
-        byte = crc_buf[i]
-        result += get_minimal_word(byte)
+    return ''.join([MINIMAL_WORDS[byte] for byte in crc_buf])
 
-    return result
+def decode_words(words, table):
+    try:
+        return bytearray([table[word] for word in words])
+    except KeyError:
+        pass
 
-def decode(s, separator, word_len):
-    buf = bytearray()
+    # Slow path for mixed-case input; lowercase each word before looking it up.
+    try:
+        return bytearray([table[word.lower()] for word in words])
+    except KeyError:
+        raise ValueError('Invalid Bytewords.')
 
+def decode(s, separator, word_len):
     if word_len == 4:
-        words = s.split(separator)
+        buf = decode_words(s.split(separator), WORD_DECODE_MAP)
     else:
-        words = partition(s, 2)
-
-    for word in words:
-        buf.append(decode_word(word, word_len))
+        buf = decode_words(partition(s, 2), MINIMAL_WORD_DECODE_MAP)
 
     if len(buf) < 5:
         raise ValueError('Invalid Bytewords.') 
@@ -112,6 +122,88 @@ def decode(s, separator, word_len):
 
     return body
 
+# Yield the chunks of `source`, which may be a file-like object with a `read()`
+# method, a single buffer or string, or any iterable of buffers or strings.
+def iter_chunks(source, chunk_size=4096):
+    if hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    elif isinstance(source, (bytes, bytearray, memoryview, str)):
+        yield source
+    else:
+        for chunk in source:
+            yield chunk
+
+# Streaming version of `encode_with_separator()` and `encode_minimal()`.
+# A separator of `None` selects minimal encoding.
+def iter_encode(chunks, separator):
+    crc = Crc32()
+    first = True
+    for chunk in iter_chunks(chunks):
+        if len(chunk) == 0:
+            continue
+        crc.update(chunk)
+        if separator == None:
+            yield ''.join([MINIMAL_WORDS[byte] for byte in chunk])
+        else:
+            text = encode(chunk, separator)
+            yield text if first else separator + text
+        first = False
+
+    if separator == None:
+        yield ''.join([MINIMAL_WORDS[byte] for byte in crc.digest()])
+    else:
+        text = encode(crc.digest(), separator)
+        yield text if first else separator + text
+
+# Decode the text in `text_chunks` a chunk at a time, carrying any partial word
+# over to the next chunk.
+def iter_decode_words(text_chunks, separator, word_len):
+    table = WORD_DECODE_MAP if word_len == 4 else MINIMAL_WORD_DECODE_MAP
+    pending = ''
+    for chunk in iter_chunks(text_chunks):
+        text = pending + chunk
+        if word_len == 4:
+            words = text.split(separator)
+            pending = words.pop()
+        else:
+            end = len(text) - (len(text) % 2)
+            pending = text[end:]
+            words = partition(text[0:end], 2)
+        yield decode_words(words, table)
+
+    # Whatever is left over is the last word
+    if word_len == 4 or len(pending) != 0:
+        yield decode_words([pending], table)
+
+# Streaming version of `decode()`. The last four decoded bytes are held back
+# until the end of the stream, where they are checked against a rolling CRC of
+# the body. Bytes are yielded before the checksum is verified, so consumers must
+# run the generator to completion before trusting the data.
+def iter_decode(text_chunks, separator, word_len):
+    crc = Crc32()
+    tail = bytearray()
+    count = 0
+
+    for buf in iter_decode_words(text_chunks, separator, word_len):
+        count += len(buf)
+        tail += buf
+        if len(tail) > 4:
+            body = bytes(tail[0:-4])
+            tail = tail[-4:]
+            crc.update(body)
+            yield body
+
+    if count < 5:
+        raise ValueError('Invalid Bytewords.')
+
+    # Validate checksum
+    if crc.digest() != tail:
+        raise ValueError('Invalid Bytewords.')
+
 Bytewords_Style_standard = 1
 Bytewords_Style_uri = 2
 Bytewords_Style_minimal = 3
@@ -138,3 +230,32 @@ class Bytewords:
             return decode(str, 0, 2)
         else:
             assert(False)
+
+    # Encode the buffers in `chunks` (an iterable or file-like object), yielding
+    # the Bytewords text piece by piece. Joining the pieces gives the same
+    # result as `encode()`.
+    @staticmethod
+    def iter_encode(style, chunks):
+        if style == Bytewords_Style_standard:
+            return iter_encode(chunks, ' ')
+        elif style == Bytewords_Style_uri:
+            return iter_encode(chunks, '-')
+        elif style == Bytewords_Style_minimal:
+            return iter_encode(chunks, None)
+        else:
+            assert(False)
+
+    # Decode the text in `text_chunks` (an iterable or file-like object),
+    # yielding the decoded bytes piece by piece. Raises `ValueError` once the
+    # end of the stream is reached if the text is invalid or the checksum
+    # doesn't match.
+    @staticmethod
+    def iter_decode(style, text_chunks):
+        if style == Bytewords_Style_standard:
+            return iter_decode(text_chunks, ' ', 4)
+        elif style == Bytewords_Style_uri:
+            return iter_decode(text_chunks, '-', 4)
+        elif style == Bytewords_Style_minimal:
+            return iter_decode(text_chunks, 0, 2)
+        else:
+            assert(False)
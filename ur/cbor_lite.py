@@ -69,6 +69,15 @@ def get_byte_length(value):
     
     return (bit_length(value) + 7) // 8
 
+# Return the number of bytes written by `encodeTagAndValue()` for `value`
+def get_tag_and_value_length(value):
+    length = get_byte_length(value)
+    if length >= 5:
+        return 9
+    elif length >= 3:
+        return 5
+    return 1 + length
+
 class CBOREncoder:
     def __init__(self):
         self.buf = bytearray()
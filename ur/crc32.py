@@ -7,30 +7,99 @@
 
 from .constants import MAX_UINT32
 
+# Use the fastest CRC implementation available. CPython ships a C implementation
+# in `zlib` (and `binascii`), and some MicroPython ports provide `binascii.crc32`.
+# When neither is available, fall back to a slicing-by-8 table implementation.
+try:
+    from zlib import crc32 as _native_crc32
+except:
+    try:
+        from binascii import crc32 as _native_crc32
+    except:
+        _native_crc32 = None
+
 def bit_length(n):
     return len(bin(abs(n))) - 2
 
 TABLE = None
 
-def crc32(buf):
-    # Lazily instantiate CRC table
+# Build the eight 256-entry tables used by the slicing-by-8 fallback.
+# TABLE[0] is the classic byte-at-a-time table; TABLE[k] advances the CRC
+# of a byte by k additional zero bytes. The output of this function is frozen
+# into crc32_table.py, so it is only needed to regenerate that file.
+def _make_table():
+    table = [[0] * 256 for _ in range(8)]
+    t0 = table[0]
+    for i in range(256):
+        c = i
+        for j in range(8):
+            c = (c >> 1) if (c % 2 == 0) else (0xEDB88320 ^ (c >> 1))
+        t0[i] = c
+
+    for i in range(256):
+        c = t0[i]
+        for k in range(1, 8):
+            c = (c >> 8) ^ t0[c & 0xFF]
+            table[k][i] = c
+
+    return table
+
+def _table_crc32(buf, crc):
+    # The tables are only needed when there is no native CRC, so don't import
+    # them until then.
     global TABLE
     if TABLE == None:
-        TABLE = [None] * (256 * 4)
+        from .crc32_table import TABLE
 
-        for i in range(256):
-            c = i
-            for j in range(8):
-                c = (c >> 1) if (c % 2 == 0) else (0xEDB88320 ^ (c >> 1))
+    t0, t1, t2, t3, t4, t5, t6, t7 = TABLE
+    crc = MAX_UINT32 & ~crc
+    n = len(buf)
+    i = 0
 
-            TABLE[i] = c
+    # Process eight bytes per iteration
+    end8 = n - (n % 8)
+    while i < end8:
+        lo = crc ^ (buf[i] | (buf[i + 1] << 8) | (buf[i + 2] << 16) | (buf[i + 3] << 24))
+        crc = t7[lo & 0xFF] ^ t6[(lo >> 8) & 0xFF] ^ t5[(lo >> 16) & 0xFF] ^ t4[lo >> 24] ^ \
+            t3[buf[i + 4]] ^ t2[buf[i + 5]] ^ t1[buf[i + 6]] ^ t0[buf[i + 7]]
+        i += 8
 
-    crc = MAX_UINT32 & ~0
-    for byte in buf:
-        crc = (crc >> 8) ^ TABLE[(crc ^ byte) & 0xFF]
+    # Process any remaining bytes one at a time
+    while i < n:
+        crc = (crc >> 8) ^ t0[(crc ^ buf[i]) & 0xFF]
+        i += 1
 
     return MAX_UINT32 & ~crc
 
+# Compute the CRC32 of `buf`. Passing the result of a previous call as `crc`
+# continues the checksum, so `crc32(b, crc32(a)) == crc32(a + b)`.
+def crc32(buf, crc=0):
+    if _native_crc32 != None:
+        return _native_crc32(buf, crc) & MAX_UINT32
+    return _table_crc32(buf, crc)
+
 def crc32n(buf):
     n = crc32(buf)
     return n.to_bytes(4, 'big')
+
+# Incremental CRC32, for checksumming data that arrives in chunks
+class Crc32:
+    def __init__(self, buf=None):
+        self.crc = 0
+        if buf != None:
+            self.update(buf)
+
+    def update(self, buf):
+        self.crc = crc32(buf, self.crc)
+        return self
+
+    def copy(self):
+        c = Crc32()
+        c.crc = self.crc
+        return c
+
+    def value(self):
+        return self.crc
+
+    def digest(self):
+        return self.crc.to_bytes(4, 'big')
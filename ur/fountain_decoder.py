@@ -5,8 +5,16 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
-from .fountain_utils import choose_fragments, contains, is_strict_subset, set_difference
-from .utils import join_lists, join_bytes, crc32_int, xor_with, take_first
+try:
+    from collections import deque
+except:
+    from ucollections import deque
+
+from .fountain_utils import contains, is_strict_subset, set_difference
+from .index_set import IndexSet
+from .schedule_cache import DEFAULT_SCHEDULE_CACHE
+from .utils import join_lists, join_bytes, crc32_int, xor_bytes, take_first
+from . import xor_kernel
 
 class InvalidPart(Exception):
     pass
@@ -14,31 +22,71 @@ class InvalidPart(Exception):
 class InvalidChecksum(Exception):
     pass
 
+# Ways of solving for the fragments of a message
+#
+# Peeling only reduces a part by another whose fragments are a subset of its
+# own. It is fast, but may hold enough parts to recover the message without
+# finding it. Gaussian elimination keeps the parts as rows of a matrix over
+# GF(2) in reduced row echelon form, and recovers the message as soon as they
+# have full rank, which usually takes fewer parts.
+Fountain_Solver_peeling = 'peeling'
+Fountain_Solver_gaussian = 'gaussian'
+
+# The largest number of parts queued at once, on ports whose `deque` needs one
+MAX_QUEUED_PARTS = 1 << 16
+
+def new_queue():
+    try:
+        return deque()
+    except TypeError:
+        return deque((), MAX_QUEUED_PARTS, 1)
+
+# Decodes a message from its fountain-coded parts by "peeling": each fragment
+# that is recovered is XORed out of the mixed parts that contain it, which may
+# in turn leave them with a single fragment, and so on. Mixed parts are indexed
+# by the fragments they contain, so recovering a fragment only touches the
+# parts that contain it, and the total work grows with the number of
+# (part, fragment) pairs rather than the square of the number of parts held.
 class FountainDecoder:
     class Part:
+        __slots__ = ('indexes', 'data')
+
         def __init__(self, indexes, data):
-            self.indexes = frozenset(indexes)
+            self.indexes = indexes if isinstance(indexes, IndexSet) else IndexSet(indexes)
             self.data = data
         
         @classmethod
-        def from_encoder_part(cls, p):
-            return cls(choose_fragments(p.seq_num, p.seq_len, p.checksum), p.data[:])
-
-        def indexes(self):
-            return self.indexes
-
-        def data(self):
-            return self.data
+        def from_encoder_part(cls, p, schedule_cache = None):
+            if schedule_cache == None:
+                schedule_cache = DEFAULT_SCHEDULE_CACHE
+            # Copy the data, since it may be a view into a buffer the caller reuses
+            return cls(schedule_cache.get(p.seq_num, p.seq_len, p.checksum), bytes(p.data))
 
         def is_simple(self):
             return len(self.indexes) == 1
 
         def index(self):
-            # TODO: Not efficient
-            return list(self.indexes)[0]
+            return self.indexes.lowest()
 
     # FountainDecoder
-    def __init__(self):
+    # `schedule_cache` is the `ScheduleCache` used to look up the fragments mixed
+    # into each part. By default, one cache is shared by all encoders and decoders.
+    # `solver` is `Fountain_Solver_peeling` or `Fountain_Solver_gaussian`.
+    #
+    # With `lazy`, the data of the parts isn't XORed together as they are
+    # reduced. Instead, the data of each reduced part is represented by a
+    # bitmask of the received parts it is the XOR of, and the data of a
+    # fragment is only computed once it has been recovered. This saves the
+    # XORs of parts that never lead to a fragment, at the cost of keeping the
+    # data of every part received.
+    def __init__(self, schedule_cache = None, solver = Fountain_Solver_peeling, lazy = False):
+        if solver != Fountain_Solver_peeling and solver != Fountain_Solver_gaussian:
+            raise ValueError('Unknown fountain solver: {}'.format(solver))
+        self.solver = solver
+        self.lazy = lazy
+        self.received_data = []    # data of each part received, when lazy
+        self.fragment_data = {}    # fragment index -> data of the recovered fragment
+        self.schedule_cache = schedule_cache if schedule_cache != None else DEFAULT_SCHEDULE_CACHE
         self.received_part_indexes = set()
         self.last_part_indexes = None
         self.processed_parts_count = 0
@@ -47,9 +95,12 @@ class FountainDecoder:
         self.expected_fragment_len = None
         self.expected_message_len = None
         self.expected_checksum = None
-        self.simple_parts = {}
-        self.mixed_parts = {}
-        self.queued_parts = []
+        self.simple_parts = {}     # fragment index -> simple part
+        self.mixed_parts = {}      # fragment indexes -> mixed part
+        self.fragment_parts = {}   # fragment index -> set of mixed parts containing it
+        self.queued_parts = new_queue()
+        self.rows = {}             # pivot bit -> (fragment bitmask, data), for Gaussian elimination
+        self.pivots = 0            # bitmask of the pivots of all the rows
 
     def expected_part_count(self):
         return len(self.expected_part_indexes)  # TODO: Handle None?
@@ -89,7 +140,12 @@ class FountainDecoder:
             return False
 
         # Add this part to the queue
-        p = FountainDecoder.Part.from_encoder_part(encoder_part)
+        if self.lazy:
+            indexes = self.schedule_cache.get(encoder_part.seq_num, encoder_part.seq_len, encoder_part.checksum)
+            p = FountainDecoder.Part(indexes, 1 << len(self.received_data))
+            self.received_data.append(bytes(encoder_part.data))
+        else:
+            p = FountainDecoder.Part.from_encoder_part(encoder_part, self.schedule_cache)
         self.last_part_indexes = p.indexes
         self.enqueue(p)
 
@@ -110,37 +166,86 @@ class FountainDecoder:
         message = join_bytes(fragments)
         return take_first(message, message_len)
 
+    # Return `a` XOR `b`, which are the data of two parts
+    def xor_data(self, a, b):
+        if self.lazy:
+            return a ^ b
+        return xor_bytes(a, b)
+
+    # Return the data of a recovered fragment from its (possibly symbolic) data
+    def materialize(self, data):
+        if not self.lazy:
+            return data
+
+        backend = xor_kernel.BACKEND
+        length = self.expected_fragment_len
+        result = backend.zero(length)
+        bits = bin(data)
+        end = len(bits) - 1
+        for i in range(end, 1, -1):
+            if bits[i] == '1':
+                result = backend.xor(result, backend.load(self.received_data[end - i]))
+        return backend.store(result, length)
+
     def enqueue(self, p):
         self.queued_parts.append(p)
 
     def process_queue_item(self):
-        part = self.queued_parts.pop(0)
+        part = self.queued_parts.popleft()
         # self.print_part(part)
 
-        if part.is_simple():
+        if self.solver == Fountain_Solver_gaussian:
+            self.eliminate(part)
+        elif part.is_simple():
             self.process_simple_part(part)
         else:
             self.process_mixed_part(part)
         # self.print_state()
 
-    def reduce_mixed_by(self, p):
-        # Reduce all the current mixed parts by the given part
-        reduced_parts = []
-        for value in self.mixed_parts.values():
-            reduced_parts.append(self.reduce_part_by_part(value, p))
-
-        # Collect all the remaining mixed parts
-        new_mixed = {}
-        for reduced_part in reduced_parts:
-            # If this reduced part is now simple
-            if reduced_part.is_simple():
-                # Add it to the queue
-                self.enqueue(reduced_part)
-            else:
-                # Otherwise, add it to the dict of current mixed parts
-                new_mixed[reduced_part.indexes] = reduced_part
+    def add_mixed_part(self, p):
+        self.mixed_parts[p.indexes] = p
+        for index in p.indexes:
+            parts = self.fragment_parts.get(index)
+            if parts == None:
+                parts = set()
+                self.fragment_parts[index] = parts
+            parts.add(p)
+
+    # Reduce the mixed part `r` by `p`, whose fragments are a strict subset of
+    # those of `r`, updating the index
+    def reduce_mixed_part(self, r, p):
+        del self.mixed_parts[r.indexes]
+        for index in p.indexes:
+            self.fragment_parts[index].discard(r)
+        r.indexes = set_difference(r.indexes, p.indexes)
+        r.data = self.xor_data(r.data, p.data)
+
+        if r.is_simple() or r.indexes in self.mixed_parts:
+            # It's no longer a new mixed part
+            for index in r.indexes:
+                self.fragment_parts[index].discard(r)
+            if r.is_simple():
+                self.enqueue(r)
+        else:
+            self.mixed_parts[r.indexes] = r
+
+    # Return the mixed parts that contain the rarest fragment of `p`
+    def rarest_bucket(self, p):
+        candidates = None
+        for index in p.indexes:
+            parts = self.fragment_parts.get(index)
+            if parts == None:
+                return ()
+            if candidates == None or len(parts) < len(candidates):
+                candidates = parts
+        return candidates
 
-        self.mixed_parts = new_mixed
+    def reduce_mixed_by(self, p):
+        # Only the mixed parts that contain all of the fragments of `p` can be
+        # reduced by it, so just check those that contain its rarest fragment
+        for r in list(self.rarest_bucket(p)):
+            if r is not p and is_strict_subset(p.indexes, r.indexes):
+                self.reduce_mixed_part(r, p)
 
     def reduce_part_by_part(self, a, b):
         # If the fragments mixed into `b` are a strict (proper) subset of those in `a`...
@@ -148,34 +253,31 @@ class FountainDecoder:
             # The new fragments in the revised part are `a` - `b`.
             new_indexes = set_difference(a.indexes, b.indexes)
             # The new data in the revised part are `a` XOR `b`
-            new_data = xor_with(bytearray(a.data), b.data)
+            new_data = self.xor_data(a.data, b.data)
             return self.Part(new_indexes, new_data)
         else:
             # `a` is not reducable by `b`, so return a
             return a
 
     def process_simple_part(self, p):
-        # Don't process duplicate parts
+        # Don't process duplicate parts, or fragments that aren't in the message
         fragment_index = p.index()
-        if contains(self.received_part_indexes, fragment_index):
+        if contains(self.simple_parts, fragment_index):
+            return
+        if not contains(self.expected_part_indexes, fragment_index):
             return
 
         # Record this part
-        self.simple_parts[p.indexes] = p
+        self.simple_parts[fragment_index] = p
+        self.fragment_data[fragment_index] = self.materialize(p.data)
         self.received_part_indexes.add(fragment_index)
 
         # If we've received all the parts
-        if self.received_part_indexes == self.expected_part_indexes:
+        if len(self.received_part_indexes) == self.expected_part_count():
             # Reassemble the message from its fragments
-            sorted_parts = []
-            for value in self.simple_parts.values():
-                sorted_parts.append(value)
-
-            sorted_parts.sort(key=lambda a: a.index())
-
             fragments = []
-            for part in sorted_parts:
-                fragments.append(part.data)
+            for index in range(self.expected_part_count()):
+                fragments.append(self.fragment_data[index])
 
             message = self.join_fragments(fragments, self.expected_message_len)
 
@@ -192,27 +294,81 @@ class FountainDecoder:
 
     def process_mixed_part(self, p):
         # Don't process duplicate parts
-        for r in self.mixed_parts.values():
-            if r == p.indexes:
-                return
-
-        # Reduce this part by all the others
-        p2 = p  # TODO: Does this need to make a copy of p?
-        for r in self.simple_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
+        if p.indexes in self.mixed_parts:
+            return
 
-        for r in self.mixed_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
+        # Reduce this part by the fragments already received
+        received = [index for index in p.indexes if index in self.simple_parts]
+        if len(received) != 0:
+            if len(received) == len(p.indexes):
+                return
+            data = p.data
+            for index in received:
+                data = self.xor_data(data, self.simple_parts[index].data)
+            p = self.Part(set_difference(p.indexes, received), data)
+
+        # Reduce it by the mixed parts made only of its fragments. To keep the
+        # work per part bounded, only those that contain its rarest fragment
+        # are checked, and parts missed here are still reduced as fragments
+        # are recovered.
+        if not p.is_simple():
+            for r in self.rarest_bucket(p):
+                if len(r.indexes) < len(p.indexes) and is_strict_subset(r.indexes, p.indexes):
+                    p = self.reduce_part_by_part(p, r)
 
         # If the part is now simple
-        if p2.is_simple():
+        if p.is_simple():
             # Add it to the queue
-            self.enqueue(p2)
-        else:
+            self.enqueue(p)
+        elif p.indexes not in self.mixed_parts:
             # Reduce all the mixed parts by this one
-            self.reduce_mixed_by(p2)
+            self.reduce_mixed_by(p)
             # Record this new mixed part
-            self.mixed_parts[p2.indexes] = p2
+            self.add_mixed_part(p)
+
+    # Add a part to the matrix used by Gaussian elimination, keeping it in
+    # reduced row echelon form: each row's pivot is its lowest bit, and no
+    # other row has that bit set. A row with a single bit is a recovered
+    # fragment, and is passed to `process_simple_part()`.
+    def eliminate(self, p):
+        mask = p.indexes.mask
+        if mask >> self.expected_part_count() != 0:
+            return
+        data = p.data
+
+        # Reduce the new row by the existing rows
+        pivots = mask & self.pivots
+        while pivots != 0:
+            pivot = pivots & -pivots
+            (row_mask, row_data) = self.rows[pivot]
+            mask ^= row_mask
+            data = self.xor_data(data, row_data)
+            pivots ^= pivot
+
+        # It's a combination of the parts already received
+        if mask == 0:
+            return
+
+        # Eliminate the new pivot from the existing rows
+        pivot = mask & -mask
+        solved = []
+        for (row_pivot, (row_mask, row_data)) in list(self.rows.items()):
+            if row_mask & pivot != 0:
+                row_mask ^= mask
+                self.rows[row_pivot] = (row_mask, self.xor_data(row_data, data))
+                if row_mask == row_pivot:
+                    solved.append(row_pivot)
+
+        self.rows[pivot] = (mask, data)
+        self.pivots |= pivot
+        if mask == pivot:
+            solved.append(pivot)
+
+        for pivot in solved:
+            if self.is_complete():
+                return
+            index = len(bin(pivot)) - 3
+            self.process_simple_part(self.Part([index], self.rows[pivot][1]))
 
     def validate_part(self, p):
         # If this is the first part we've seen
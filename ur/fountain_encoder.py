@@ -5,16 +5,57 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
-import math
-from .cbor_lite import CBORDecoder, CBOREncoder
-from .fountain_utils import choose_fragments
-from .utils import split, crc32_int, xor_into, data_to_hex
-from .constants import MAX_UINT32, MAX_UINT64
+try:
+    import struct
+except:
+    import ustruct as struct
+
+from .cbor_lite import CBOREncoder, Tag_Major_mask, Tag_Minor_mask, Tag_Major_unsignedInteger, \
+    Tag_Major_byteString, Tag_Major_array, Tag_Minor_length1, Tag_Minor_length8
+from .schedule_cache import DEFAULT_SCHEDULE_CACHE
+from .utils import crc32_int, data_to_hex
+from . import xor_kernel
+from .constants import MAX_UINT32
+
+# Reasons for an `InvalidHeader`, given as its `code`
+InvalidHeader_truncated = 1
+InvalidHeader_not_array = 2
+InvalidHeader_wrong_array_size = 3
+InvalidHeader_not_unsigned = 4
+InvalidHeader_not_bytes = 5
+InvalidHeader_bad_additional = 6
 
 class InvalidHeader(Exception):
-    pass
+    def __init__(self, code = None):
+        Exception.__init__(self, code)
+        self.code = code
+
+# `struct` formats of the 1, 2, 4 and 8 byte CBOR values
+VALUE_FORMATS = ('>B', '>H', '>I', '>Q')
+
+# Decode the CBOR tag with major type `major` at `offset` in `buf`, and return
+# its value and the offset of what follows it
+def decode_tag_and_value(buf, offset, major, code):
+    if offset >= len(buf):
+        raise InvalidHeader(InvalidHeader_truncated)
+    initial = buf[offset]
+    if initial & Tag_Major_mask != major:
+        raise InvalidHeader(code)
+
+    additional = initial & Tag_Minor_mask
+    if additional < Tag_Minor_length1:
+        return (additional, offset + 1)
+    if additional > Tag_Minor_length8:
+        raise InvalidHeader(InvalidHeader_bad_additional)
+
+    width = additional - Tag_Minor_length1
+    size = 1 << width
+    if offset + 1 + size > len(buf):
+        raise InvalidHeader(InvalidHeader_truncated)
+    return (struct.unpack_from(VALUE_FORMATS[width], buf, offset + 1)[0], offset + 1 + size)
 
 class Part:
+    __slots__ = ('seq_num', 'seq_len', 'message_len', 'checksum', 'data')
 
     def __init__(self, seq_num, seq_len, message_len, checksum, data):
         self.seq_num = seq_num
@@ -23,35 +64,26 @@ class Part:
         self.checksum = checksum
         self.data = data
 
+    # Parse a part from its CBOR: an array of `seq_num`, `seq_len`,
+    # `message_len`, `checksum` and the data. Any bytes after the array are
+    # ignored. The data is returned as a view into `cbor_buf`, without copying
+    # it. Raises `InvalidHeader`, with one of the `InvalidHeader_*` codes.
     @staticmethod
     def from_cbor(cbor_buf):
-        try:
-            decoder = CBORDecoder(cbor_buf)
-            (array_size, _) = decoder.decodeArraySize()
-            if array_size != 5:
-                raise InvalidHeader()
-                        
-            (seq_num, _) = decoder.decodeUnsigned()
-            if seq_num > MAX_UINT64:  # TODO: Do something better with this check
-                raise InvalidHeader()
-            
-            (seq_len, _) = decoder.decodeUnsigned()
-            if seq_len > MAX_UINT64:
-                raise InvalidHeader()
-            
-            (message_len, _) = decoder.decodeUnsigned()
-            if message_len > MAX_UINT64:
-                raise InvalidHeader()
-            
-            (checksum, _) = decoder.decodeUnsigned()
-            if checksum > MAX_UINT64:
-                raise InvalidHeader()
-
-            (data, _) = decoder.decodeBytes()
-
-            return Part(seq_num, seq_len, message_len, checksum, data)
-        except Exception as err:
-            raise InvalidHeader()
+        buf = memoryview(cbor_buf)
+        (array_size, offset) = decode_tag_and_value(buf, 0, Tag_Major_array, InvalidHeader_not_array)
+        if array_size != 5:
+            raise InvalidHeader(InvalidHeader_wrong_array_size)
+
+        (seq_num, offset) = decode_tag_and_value(buf, offset, Tag_Major_unsignedInteger, InvalidHeader_not_unsigned)
+        (seq_len, offset) = decode_tag_and_value(buf, offset, Tag_Major_unsignedInteger, InvalidHeader_not_unsigned)
+        (message_len, offset) = decode_tag_and_value(buf, offset, Tag_Major_unsignedInteger, InvalidHeader_not_unsigned)
+        (checksum, offset) = decode_tag_and_value(buf, offset, Tag_Major_unsignedInteger, InvalidHeader_not_unsigned)
+        (data_len, offset) = decode_tag_and_value(buf, offset, Tag_Major_byteString, InvalidHeader_not_bytes)
+        if data_len > len(buf) - offset:
+            raise InvalidHeader(InvalidHeader_truncated)
+
+        return Part(seq_num, seq_len, message_len, checksum, buf[offset:offset + data_len])
 
     def cbor(self):
         encoder = CBOREncoder()
@@ -63,62 +95,65 @@ class Part:
         encoder.encodeBytes(self.data)
         return encoder.get_bytes()
 
-    def seq_num(self):
-        return self.seq_num
-
-    def seq_len(self):
-        return self.seq_len
-
-    def message_len(self):
-        return self.message_len
-
-    def checksum(self):
-        return self.checksum
-
-    def data(self):
-        return self.data
-
     def description(self):
         return "seqNum:{}, seqLen:{}, messageLen:{}, checksum:{}, data:{}".format(
             self.seq_num, self.seq_len, self.message_len, self.checksum, data_to_hex(self.data))
 
 class FountainEncoder:
-    def __init__(self, message, max_fragment_len, first_seq_num = 0, min_fragment_len = 10):
+    # `schedule_cache` is the `ScheduleCache` used to look up the fragments mixed
+    # into each part. By default, one cache is shared by all encoders and decoders.
+    #
+    # To show the same message on `stripe_count` displays at once, give each
+    # display's encoder a different `stripe_index`. The encoder for stripe `i`
+    # generates sequence numbers `first_seq_num + j * stripe_count + i + 1`, so
+    # the displays share the pure parts evenly and never repeat each other's
+    # parts (until the sequence numbers wrap).
+    #
+    # By default each part converts the fragments it mixes to the native
+    # representation of the XOR backend as it goes. Pass
+    # `cache_native_fragments=True` to convert them all once and keep them,
+    # which makes parts faster to generate but keeps a second copy of the
+    # message for the life of the encoder.
+    def __init__(self, message, max_fragment_len, first_seq_num = 0, min_fragment_len = 10, schedule_cache = None, stripe_index = 0, stripe_count = 1, cache_native_fragments = False):
         assert(len(message) <= MAX_UINT32)
+        assert(stripe_count > 0)
+        assert(0 <= stripe_index < stripe_count)
+        self.schedule_cache = schedule_cache if schedule_cache != None else DEFAULT_SCHEDULE_CACHE
         self.message_len = len(message)
         self.checksum = crc32_int(message)
         self.fragment_len = FountainEncoder.find_nominal_fragment_length(self.message_len, min_fragment_len, max_fragment_len)
         self.fragments = FountainEncoder.partition_message(message, self.fragment_len)
-        self.seq_num = first_seq_num
+        self.cache_native_fragments = cache_native_fragments
+        self.native_fragments = None
+        self.native_backend = None
+        self.stripe_count = stripe_count
+        self.seq_num = first_seq_num + stripe_index + 1 - stripe_count
     
+    # Return the length of the fragments when the message is split into as few
+    # fragments as possible, each no longer than `max_fragment_len`, but no more
+    # than `message_len // min_fragment_len` of them.
     @staticmethod
     def find_nominal_fragment_length(message_len, min_fragment_len, max_fragment_len):
         assert(message_len > 0)
         assert(min_fragment_len > 0)
         assert(max_fragment_len >= min_fragment_len)
         max_fragment_count = message_len // min_fragment_len
-        fragment_len = None
-
-        for fragment_count in range(1, max_fragment_count + 1):
-            fragment_len = math.ceil(message_len / fragment_count)
-            if fragment_len <= max_fragment_len:
-                break
-
-        assert(fragment_len != None)
-        return fragment_len
+        assert(max_fragment_count > 0)
 
+        fragment_count = min((message_len + max_fragment_len - 1) // max_fragment_len, max_fragment_count)
+        return (message_len + fragment_count - 1) // fragment_count
 
+    # Copy the message once into a single buffer, padded with zeros to a whole
+    # number of fragments, and return read-only views of each fragment.
     @staticmethod
     def partition_message(message, fragment_len):
-        remaining = message
+        fragment_count = (len(message) + fragment_len - 1) // fragment_len
+        padding = fragment_count * fragment_len - len(message)
+        buf = memoryview(b''.join([message, bytes(padding)]))
         fragments = []
-        while len(remaining) != 0:
-            (fragment, remaining) = split(remaining, fragment_len)
-            padding = fragment_len - len(fragment)
-            while padding > 0:
-                fragment.append(0)
-                padding -= 1
-            fragments.append(fragment)
+        for i in range(fragment_count):
+            offset = i * fragment_len
+            fragments.append(buf[offset:offset + fragment_len])
 
         return fragments
 
@@ -130,23 +165,54 @@ class FountainEncoder:
 
     # This becomes `true` when the minimum number of parts
     # to relay the complete message have been generated
+    # (by this stripe)
     def is_complete(self):
-        return self.seq_num >= self.seq_len()
+        return self.seq_num + self.stripe_count > self.seq_len()
 
     # True if only a single part will be generated.
     def is_single_part(self):
         return self.seq_len() == 1
 
     def next_part(self):
-        self.seq_num += 1
+        self.seq_num += self.stripe_count
         self.seq_num = self.seq_num % MAX_UINT32  # wrap at period 2^32
-        indexes = choose_fragments(self.seq_num, self.seq_len(), self.checksum)
-        mixed = self.mix(indexes)
-        data = bytes(mixed)
-        return Part(self.seq_num, self.seq_len(), self.message_len, self.checksum, data)
+        self.schedule_cache.prewarm(self.seq_num, self.seq_len(), self.checksum, self.stripe_count)
+        return self.part_at(self.seq_num)
+
+    # Return the part with the given sequence number. A part depends only on
+    # the message, the fragment length and `seq_num`, so this doesn't change
+    # the encoder, and parts can be generated in any order, or by several
+    # encoders of the same message at once.
+    def part_at(self, seq_num):
+        seq_num = seq_num % MAX_UINT32  # wrap at period 2^32
+        indexes = self.schedule_cache.get(seq_num, self.seq_len(), self.checksum)
+        data = self.mix(indexes)
+        return Part(seq_num, self.seq_len(), self.message_len, self.checksum, data)
+
+    # Generate the parts with sequence numbers `range(start, stop, step)`
+    def parts_range(self, start, stop, step = 1):
+        for seq_num in range(start, stop, step):
+            yield self.part_at(seq_num)
+
+    # Return the fragments in the native representation of the current XOR
+    # backend, converting them the first time they are needed.
+    def get_native_fragments(self):
+        backend = xor_kernel.BACKEND
+        if self.native_backend != backend:
+            self.native_fragments = [backend.load(f) for f in self.fragments]
+            self.native_backend = backend
+        return self.native_fragments
 
     def mix(self, indexes):
-        result = [0] * self.fragment_len
-        for index in indexes:
-            xor_into(result, self.fragments[index])
-        return result
+        backend = xor_kernel.BACKEND
+        result = backend.zero(self.fragment_len)
+        if self.cache_native_fragments:
+            fragments = self.get_native_fragments()
+            for index in indexes:
+                result = backend.xor(result, fragments[index])
+        else:
+            fragments = self.fragments
+            load = backend.load
+            for index in indexes:
+                result = backend.xor(result, load(fragments[index]))
+        return backend.store(result, self.fragment_len)
@@ -5,9 +5,29 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
+from .index_set import IndexSet
+from .lru_cache import LRUCache
 from .random_sampler import RandomSampler
 from .utils import int_to_bytes
-from .xoshiro256 import Xoshiro256
+from .constants import MAX_UINT64
+from .xoshiro256 import Xoshiro256, hashlib
+
+# NumPy is optional. When it is available, `choose_fragments_batch()` runs the
+# random number generators for many parts in lockstep. It takes a long time to
+# import, so it is only imported by the first call of `choose_fragments_batch()`.
+np = None
+NUMPY_IMPORTED = False
+
+def import_numpy():
+    global np, NUMPY_IMPORTED
+    if not NUMPY_IMPORTED:
+        NUMPY_IMPORTED = True
+        try:
+            import numpy
+            np = numpy
+        except:
+            np = None
+    return np
 
 # Fisher-Yates shuffle
 def shuffled(items, rng):
@@ -20,30 +40,206 @@ def shuffled(items, rng):
 
     return result
 
-def choose_degree(seq_len, rng):
-    degree_probabilities = []
-    for i in range(1, seq_len + 1):
-        degree_probabilities.append(1.0 / i)
+# Select items from `range(n)` without replacement. Each rank in `ranks` picks
+# the item at that (0-based) position among the items not picked so far, like
+# `remaining.pop(rank)` on a list does.
+def take_ranked(n, ranks):
+    # Popping from a list costs O(n) per pick, but it runs at C speed, so it
+    # wins unless the list is large relative to the number of picks. Otherwise
+    # use a Fenwick tree, at O(log n) per pick.
+    d = len(ranks)
+    if n * (d + 50) <= 1600 * d * n.bit_length():
+        remaining = list(range(n))
+        return [remaining.pop(k) for k in ranks]
+    return take_ranked_fenwick(n, ranks)
+
+# Same as `take_ranked()`, but the remaining items are tracked in a Fenwick
+# tree so that each pick costs O(log n). Every item starts out present, so the
+# tree only stores the removals; node `i` initially counts `i & -i` items.
+def take_ranked_fenwick(n, ranks):
+    removed = [0] * (n + 1)
+    top = 1
+    while top * 2 <= n:
+        top *= 2
+
+    result = []
+    for k in ranks:
+        # Find the last position whose prefix count is <= k
+        pos = 0
+        step = top
+        while step:
+            nxt = pos + step
+            if nxt <= n:
+                count = (nxt & -nxt) - removed[nxt]
+                if count <= k:
+                    pos = nxt
+                    k -= count
+            step >>= 1
+        result.append(pos)
+
+        # Remove the item from the tree
+        i = pos + 1
+        while i <= n:
+            removed[i] += 1
+            i += i & -i
+
+    return result
+
+# Return the first `count` items of `shuffled(list(range(n)), rng)`. Only the
+# first `count` random draws are made, since they alone decide those items.
+def partial_shuffled(n, count, rng):
+    return take_ranked(n, [rng.next_int(0, n - j - 1) for j in range(count)])
 
-    degree_chooser = RandomSampler(degree_probabilities)
-    return degree_chooser.next(lambda: rng.next_double()) + 1
+# The degree sampler depends only on `seq_len`, so it is built once and shared
+# by every part of a message (and by every message with the same number of
+# fragments). DEGREE_SAMPLER_CACHE.hits/misses count how often it was reused.
+DEGREE_SAMPLER_CACHE = LRUCache(16)
+
+def get_degree_sampler(seq_len):
+    degree_chooser = DEGREE_SAMPLER_CACHE.get(seq_len)
+    if degree_chooser == None:
+        degree_probabilities = []
+        for i in range(1, seq_len + 1):
+            degree_probabilities.append(1.0 / i)
+
+        degree_chooser = RandomSampler(degree_probabilities)
+        DEGREE_SAMPLER_CACHE.put(seq_len, degree_chooser)
+
+    return degree_chooser
+
+def choose_degree(seq_len, rng):
+    degree_chooser = get_degree_sampler(seq_len)
+    return degree_chooser.next(rng.next_double) + 1
 
 def choose_fragments(seq_num, seq_len, checksum):
     # The first `seq_len` parts are the "pure" fragments, not mixed with any
     # others. This means that if you only generate the first `seq_len` parts,
     # then you have all the parts you need to decode the message.
+    # (`seq_num` 0 only occurs after wrapping, and carries the last fragment.)
     if seq_num <= seq_len:
-        return set([seq_num - 1])
+        return IndexSet([(seq_num - 1) % seq_len])
     else:
         seed = int_to_bytes(seq_num) + int_to_bytes(checksum)
         rng = Xoshiro256.from_bytes(seed)
         degree = choose_degree(seq_len, rng)
-        indexes = []
+        return IndexSet(partial_shuffled(seq_len, degree, rng))
+
+# Return the fragment indexes for each of the given sequence numbers, in the
+# same order. The result is identical to calling `choose_fragments()` for each
+# one, but is much faster for large batches when NumPy is available.
+def choose_fragments_batch(seq_nums, seq_len, checksum):
+    seq_nums = list(seq_nums)
+    if import_numpy() == None:
+        return [choose_fragments(seq_num, seq_len, checksum) for seq_num in seq_nums]
+
+    result = [None] * len(seq_nums)
+    mixed = []
+    for i in range(len(seq_nums)):
+        if seq_nums[i] <= seq_len:
+            result[i] = IndexSet([(seq_nums[i] - 1) % seq_len])
+        else:
+            mixed.append(i)
+
+    if len(mixed) != 0:
+        mixed_indexes = choose_mixed_fragments_numpy([seq_nums[i] for i in mixed], seq_len, checksum)
+        for i in range(len(mixed)):
+            result[mixed[i]] = mixed_indexes[i]
+
+    return result
 
-        for i in range(seq_len):
-            indexes.append(i)
-        shuffled_indexes = shuffled(indexes, rng)
-        return set(shuffled_indexes[0:degree])
+# Run one Xoshiro256 generator per element of the uint64 arrays `s0`..`s3`,
+# returning the next output of each and updating the arrays in place.
+def next_numpy(s0, s1, s2, s3):
+    x = s1 * np.uint64(5)
+    result = ((x << np.uint64(7)) | (x >> np.uint64(57))) * np.uint64(9)
+    t = s1 << np.uint64(17)
+
+    s2 ^= s0
+    s3 ^= s1
+    s1 ^= s2
+    s0 ^= s3
+
+    s2 ^= t
+
+    s3[:] = (s3 << np.uint64(45)) | (s3 >> np.uint64(19))
+
+    return result
+
+def next_double_numpy(s0, s1, s2, s3):
+    m = float(MAX_UINT64) + 1
+    return next_numpy(s0, s1, s2, s3).astype(np.float64) / m
+
+# The number of parts whose generators run in lockstep at once, which bounds
+# the memory used by `choose_mixed_fragments_numpy()`
+NUMPY_CHUNK_SIZE = 1024
+
+def choose_mixed_fragments_numpy(seq_nums, seq_len, checksum):
+    result = []
+    for start in range(0, len(seq_nums), NUMPY_CHUNK_SIZE):
+        result.extend(choose_mixed_fragments_numpy_chunk(seq_nums[start:start + NUMPY_CHUNK_SIZE], seq_len, checksum))
+    return result
+
+def choose_mixed_fragments_numpy_chunk(seq_nums, seq_len, checksum):
+    count = len(seq_nums)
+
+    # Seed one generator per part, exactly as `choose_fragments()` does
+    digests = []
+    for seq_num in seq_nums:
+        m = hashlib.sha256()
+        m.update(int_to_bytes(seq_num) + int_to_bytes(checksum))
+        digests.append(m.digest())
+    state = np.frombuffer(b''.join(digests), dtype='>u8').reshape(count, 4).astype(np.uint64)
+    s0 = state[:, 0].copy()
+    s1 = state[:, 1].copy()
+    s2 = state[:, 2].copy()
+    s3 = state[:, 3].copy()
+
+    # Choose the degrees, as `choose_degree()` and `RandomSampler.next()` do
+    sampler = get_degree_sampler(seq_len)
+    probs = np.frombuffer(sampler.probs, dtype=np.float64)
+    aliases = np.frombuffer(sampler.aliases, dtype=np.uintc).astype(np.int64)
+
+    r1 = next_double_numpy(s0, s1, s2, s3)
+    r2 = next_double_numpy(s0, s1, s2, s3)
+    i = (float(seq_len) * r1).astype(np.int64)
+    degrees = np.where(r2 < probs[i], i, aliases[i]) + 1
+
+    # Only the first `degree` draws of the shuffle affect the chosen fragments.
+    # Order the generators by decreasing degree, so that those still drawing
+    # in round `j` (the ones with a degree above `j`) are a prefix of the
+    # arrays, and the work is proportional to the sum of the degrees.
+    order = np.argsort(-degrees, kind='stable')
+    s0 = s0[order]
+    s1 = s1[order]
+    s2 = s2[order]
+    s3 = s3[order]
+    degrees = degrees[order].tolist()
+
+    picks = []
+    active = count
+    j = 0
+    while True:
+        while active > 0 and degrees[active - 1] <= j:
+            active -= 1
+        if active == 0:
+            break
+        d = next_double_numpy(s0[:active], s1[:active], s2[:active], s3[:active])
+        picks.append((d * (seq_len - j)).astype(np.int64))
+        j += 1
+
+    # The draws of round `j` start at `offsets[j]`, in the same order
+    offsets = np.zeros(len(picks), dtype=np.int64)
+    for j in range(1, len(picks)):
+        offsets[j] = offsets[j - 1] + len(picks[j - 1])
+    picks = np.concatenate(picks)
+
+    result = [None] * count
+    order = order.tolist()
+    for p in range(count):
+        ranks = picks[offsets[0:degrees[p]] + p].tolist()
+        result[order[p]] = IndexSet(take_ranked(seq_len, ranks))
+
+    return result
 
 def contains(set_or_list, el):
     return el in set_or_list
@@ -0,0 +1,87 @@
+#
+# index_set.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+# Return the index of the only bit set in `bit`
+try:
+    (1).bit_length()
+    def bit_index(bit):
+        return bit.bit_length() - 1
+except:
+    def bit_index(bit):
+        return len(bin(bit)) - 3
+
+# An immutable set of fragment indexes, stored as the bits of an integer. For
+# messages of hundreds or thousands of fragments, it is much smaller than a
+# `set`, and subset tests and differences are single integer operations.
+# Iterating over it yields the indexes in ascending order.
+class IndexSet:
+    __slots__ = ('mask', 'count')
+
+    def __init__(self, indexes = ()):
+        mask = 0
+        for index in indexes:
+            mask |= 1 << index
+        self.mask = mask
+        self.count = None
+
+    @staticmethod
+    def from_mask(mask):
+        s = IndexSet()
+        s.mask = mask
+        return s
+
+    def __len__(self):
+        if self.count == None:
+            self.count = bin(self.mask).count('1')
+        return self.count
+
+    def __contains__(self, index):
+        return index >= 0 and (self.mask >> index) & 1 == 1
+
+    def __iter__(self):
+        mask = self.mask
+        while mask != 0:
+            bit = mask & -mask
+            yield bit_index(bit)
+            mask ^= bit
+
+    def __eq__(self, other):
+        if not isinstance(other, IndexSet):
+            return NotImplemented
+        return self.mask == other.mask
+
+    def __ne__(self, other):
+        if not isinstance(other, IndexSet):
+            return NotImplemented
+        return self.mask != other.mask
+
+    def __hash__(self):
+        return hash(self.mask)
+
+    def __repr__(self):
+        return 'IndexSet({})'.format(list(self))
+
+    def issubset(self, other):
+        return self.mask & ~other.mask == 0
+
+    # `other` may be an `IndexSet` or any iterable of indexes
+    def difference(self, other):
+        if not isinstance(other, IndexSet):
+            other = IndexSet(other)
+        result = IndexSet.from_mask(self.mask & ~other.mask)
+        # When `other` is a subset, the size follows from the sizes we know,
+        # without counting the bits of a mask that may be thousands long
+        if self.count != None and other.count != None and other.mask & ~self.mask == 0:
+            result.count = self.count - other.count
+        return result
+
+    def union(self, other):
+        return IndexSet.from_mask(self.mask | other.mask)
+
+    # Return the smallest index in the set, which must not be empty
+    def lowest(self):
+        return bit_index(self.mask & -self.mask)
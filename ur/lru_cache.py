@@ -0,0 +1,58 @@
+#
+# lru_cache.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+try:
+    from collections import OrderedDict
+except:
+    from ucollections import OrderedDict
+
+# A dict with a bounded number of entries. When it is full, adding a new entry
+# evicts the least recently used one. Lookups are counted so that callers can
+# report how effective the cache is.
+class LRUCache:
+    def __init__(self, max_size):
+        assert(max_size > 0)
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, key):
+        return key in self.items
+
+    # Return the value for `key`, or `None` if it isn't cached
+    def get(self, key):
+        value = self.items.pop(key, None)
+        if value == None:
+            self.misses += 1
+            return None
+
+        # Re-insert to mark the entry as the most recently used
+        self.items[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        assert(value != None)
+        self.items.pop(key, None)
+        while len(self.items) >= self.max_size:
+            self.items.pop(next(iter(self.items)), None)
+        self.items[key] = value
+
+    def clear(self):
+        self.items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0
+        return self.hits / lookups
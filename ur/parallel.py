@@ -0,0 +1,71 @@
+#
+# parallel.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+# Generates large numbers of UR parts using a pool of processes, for example
+# to export the frames of a large message ahead of time.
+
+try:
+    import multiprocessing
+    from multiprocessing import shared_memory
+except:
+    multiprocessing = None
+
+from .ur import UR
+from .ur_encoder import UREncoder
+
+# The number of parts each worker generates per task
+DEFAULT_CHUNK_SIZE = 64
+
+# The encoder of each worker process, built once by `init_worker()`
+WORKER_ENCODER = None
+
+def init_worker(shm_name, message_len, type, max_fragment_len, min_fragment_len):
+    global WORKER_ENCODER
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        cbor = bytes(shm.buf[0:message_len])
+    finally:
+        shm.close()
+    WORKER_ENCODER = UREncoder(UR(type, cbor), max_fragment_len, min_fragment_len=min_fragment_len)
+
+def generate_chunk(seq_nums):
+    return list(WORKER_ENCODER.parts_range(seq_nums[0], seq_nums[1], seq_nums[2]))
+
+def split_range(seq_range, chunk_size):
+    step = seq_range.step
+    for i in range(0, len(seq_range), chunk_size):
+        chunk = seq_range[i:i + chunk_size]
+        yield (chunk.start, chunk.start + len(chunk) * step, step)
+
+# Generate the UR strings of the parts of `ur` with the sequence numbers in
+# `seq_range` (a `range`), in order. The parts are the same as those produced
+# by `UREncoder(ur, max_fragment_len, min_fragment_len=min_fragment_len)`.
+#
+# With `workers` greater than one, `seq_range` is split into chunks of
+# `chunk_size` parts that are generated by a pool of `workers` processes. The
+# message is passed to the workers once, through shared memory. Otherwise, or
+# if `multiprocessing` isn't available, the parts are generated in this
+# process.
+def generate_parts(ur, max_fragment_len, seq_range, workers = 1, min_fragment_len = 10, chunk_size = DEFAULT_CHUNK_SIZE):
+    if workers <= 1 or multiprocessing == None or len(seq_range) <= chunk_size:
+        encoder = UREncoder(ur, max_fragment_len, min_fragment_len=min_fragment_len)
+        for seq_num in seq_range:
+            yield encoder.ur_part_at(seq_num)
+        return
+
+    message_len = len(ur.cbor)
+    shm = shared_memory.SharedMemory(create=True, size=max(message_len, 1))
+    try:
+        shm.buf[0:message_len] = ur.cbor
+        initargs = (shm.name, message_len, ur.type, max_fragment_len, min_fragment_len)
+        with multiprocessing.Pool(workers, initializer=init_worker, initargs=initargs) as pool:
+            for parts in pool.imap(generate_chunk, split_range(seq_range, chunk_size)):
+                for part in parts:
+                    yield part
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,121 @@
+#
+# prefetching_encoder.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+try:
+    import _thread
+except:
+    _thread = None
+
+import time
+
+from .schedule_cache import NoLock
+
+# Generates the parts of a `UREncoder` ahead of time, so that an animated QR
+# display can take a ready-made frame at a constant rate. Parts with a high
+# degree take much longer to generate than pure parts, so calling
+# `next_part()` once per frame makes the frame rate jitter.
+#
+# Generated parts are kept in a ring buffer of `capacity` frames. Call
+# `start()` to fill it from a background thread, or, where threads aren't
+# available (or wanted), call `step()` during idle time to generate one part
+# at a time. `get_frame()` never blocks: it returns `None` if the buffer is
+# empty, and counts the underrun.
+class PrefetchingEncoder:
+    def __init__(self, encoder, capacity = 8):
+        assert(capacity > 0)
+        self.encoder = encoder
+        self.capacity = capacity
+        self.frames = [None] * capacity
+        self.head = 0
+        self.count = 0
+        self.underruns = 0
+        self.frames_generated = 0
+        self.frames_displayed = 0
+        self.running = False
+        self.worker_running = False
+        self.lock = _thread.allocate_lock() if _thread != None else NoLock()
+
+    @staticmethod
+    def threads_available():
+        return _thread != None
+
+    # Return the next frame, or `None` if none is ready yet
+    def get_frame(self):
+        with self.lock:
+            if self.count == 0:
+                self.underruns += 1
+                return None
+
+            frame = self.frames[self.head]
+            self.frames[self.head] = None
+            self.head = (self.head + 1) % self.capacity
+            self.count -= 1
+            self.frames_displayed += 1
+            return frame
+
+    # Generate one part if there is room for it. Returns `True` if a part was
+    # generated. Only call this when the background thread isn't running.
+    def step(self):
+        assert(not self.worker_running) # The worker owns the encoder
+        if self.count == self.capacity:
+            return False
+
+        self.push(self.encoder.next_part())
+        return True
+
+    # Generate parts until the buffer is full
+    def fill(self):
+        while self.step():
+            pass
+
+    def push(self, frame):
+        with self.lock:
+            tail = (self.head + self.count) % self.capacity
+            self.frames[tail] = frame
+            self.count += 1
+            self.frames_generated += 1
+
+    # Start filling the buffer from a background thread. Raises
+    # `RuntimeError` if threads aren't available; use `step()` instead.
+    def start(self):
+        if _thread == None:
+            raise RuntimeError('Threads are not available')
+        if self.worker_running:
+            return
+
+        self.running = True
+        self.worker_running = True
+        _thread.start_new_thread(self.worker, ())
+
+    # Stop the background thread, waiting for it to finish the part it is
+    # generating. Frames already in the buffer are kept.
+    def stop(self):
+        self.running = False
+        while self.worker_running:
+            time.sleep(0.001)
+
+    def worker(self):
+        try:
+            while self.running:
+                if self.count == self.capacity:
+                    time.sleep(0.001)
+                    continue
+
+                # Generate outside the lock, so `get_frame()` is never kept waiting
+                self.push(self.encoder.next_part())
+        finally:
+            self.worker_running = False
+
+    # The number of frames ready to display
+    def fill_level(self):
+        return self.count
+
+    def underrun_count(self):
+        return self.underruns
+
+    def is_full(self):
+        return self.count == self.capacity
@@ -0,0 +1,90 @@
+#
+# qr_capacity.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+# Number of data codewords in a QR code symbol, indexed by version (1-40).
+# Each entry is for error correction levels (L, M, Q, H). From ISO/IEC 18004.
+DATA_CODEWORDS = [
+    None,
+    (19, 16, 13, 9),
+    (34, 28, 22, 16),
+    (55, 44, 34, 26),
+    (80, 64, 48, 36),
+    (108, 86, 62, 46),
+    (136, 108, 76, 60),
+    (156, 124, 88, 66),
+    (194, 154, 110, 86),
+    (232, 182, 132, 100),
+    (274, 216, 154, 122),
+    (324, 254, 180, 140),
+    (370, 290, 206, 158),
+    (428, 334, 244, 180),
+    (461, 365, 261, 197),
+    (523, 415, 295, 223),
+    (589, 453, 325, 253),
+    (647, 507, 367, 283),
+    (721, 563, 397, 313),
+    (795, 627, 445, 341),
+    (861, 669, 485, 385),
+    (932, 714, 512, 406),
+    (1006, 782, 568, 442),
+    (1094, 860, 614, 464),
+    (1174, 914, 664, 514),
+    (1276, 1000, 718, 538),
+    (1370, 1062, 754, 596),
+    (1468, 1128, 808, 628),
+    (1531, 1193, 871, 661),
+    (1631, 1267, 911, 701),
+    (1735, 1373, 985, 745),
+    (1843, 1455, 1033, 793),
+    (1955, 1541, 1115, 845),
+    (2071, 1631, 1171, 901),
+    (2191, 1725, 1231, 961),
+    (2306, 1812, 1286, 986),
+    (2434, 1914, 1354, 1054),
+    (2566, 1992, 1426, 1096),
+    (2702, 2102, 1502, 1142),
+    (2812, 2216, 1582, 1222),
+    (2956, 2334, 1666, 1276),
+]
+
+ECC_LEVELS = 'LMQH'
+
+QR_Mode_alphanumeric = 'alphanumeric'
+QR_Mode_byte = 'byte'
+
+# Length in bits of the character count indicator, which depends on the mode
+# and on the version range (1-9, 10-26 or 27-40).
+def char_count_bits(version, mode):
+    if mode == QR_Mode_alphanumeric:
+        bits = (9, 11, 13)
+    elif mode == QR_Mode_byte:
+        bits = (8, 16, 16)
+    else:
+        raise ValueError('Unsupported QR mode: {}'.format(mode))
+
+    if version <= 9:
+        return bits[0]
+    elif version <= 26:
+        return bits[1]
+    return bits[2]
+
+# Return the maximum number of characters that fit in a single-segment QR code
+# of the given version, error correction level and mode.
+def qr_capacity(version, ecc, mode):
+    if version < 1 or version > 40:
+        raise ValueError('Invalid QR version: {}'.format(version))
+    level = ECC_LEVELS.find(ecc.upper())
+    if level == -1:
+        raise ValueError('Invalid QR error correction level: {}'.format(ecc))
+
+    # Subtract the 4-bit mode indicator and the character count indicator
+    bits = DATA_CODEWORDS[version][level] * 8 - 4 - char_count_bits(version, mode)
+
+    if mode == QR_Mode_alphanumeric:
+        # Pairs of characters take 11 bits, and a final single character takes 6
+        return (bits // 11) * 2 + (1 if bits % 11 >= 6 else 0)
+    return bits // 8
@@ -5,6 +5,8 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
+from array import array
+
 class RandomSampler:
 
     def __init__(self, probs):
@@ -33,8 +35,8 @@ class RandomSampler:
                 L.append(i)
 
         # Work through index lists
-        _probs = [0] * n
-        _aliases = [0] * n
+        _probs = array('d', [0.0] * n)
+        _aliases = array('I', [0] * n)
 
         while len(S) > 0 and len(L) > 0:
             a = S.pop()  # Schwarz's l
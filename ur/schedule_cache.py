@@ -0,0 +1,115 @@
+#
+# schedule_cache.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+try:
+    import _thread
+except:
+    _thread = None
+
+from .fountain_utils import choose_fragments
+from .index_set import IndexSet
+from .lru_cache import LRUCache
+from .constants import MAX_UINT32
+
+# Stands in for a lock when threads aren't available
+class NoLock:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+# Caches the fragment indexes chosen for each part, since they depend only on
+# `(seq_num, seq_len, checksum)`. A message that is displayed on a loop and
+# scanned repeatedly asks for the same schedules over and over again.
+#
+# If `prewarm_count` is nonzero, `prewarm()` computes the schedules of the
+# parts that follow a given part on a background thread, so that they are
+# ready by the time they are needed.
+class ScheduleCache:
+    def __init__(self, max_size=1024, prewarm_count=0):
+        assert(prewarm_count < max_size)
+        self.cache = LRUCache(max_size)
+        self.prewarm_count = prewarm_count if _thread != None else 0
+        self.prewarm_request = None
+        self.prewarm_running = False
+        self.lock = _thread.allocate_lock() if _thread != None else NoLock()
+
+    def get(self, seq_num, seq_len, checksum):
+        # Pure parts are trivial, so don't bother caching them
+        if seq_num <= seq_len:
+            return IndexSet([(seq_num - 1) % seq_len])
+
+        key = (seq_num, seq_len, checksum)
+        with self.lock:
+            indexes = self.cache.get(key)
+
+        if indexes == None:
+            indexes = choose_fragments(seq_num, seq_len, checksum)
+            self.put(key, indexes)
+
+        return indexes
+
+    def put(self, key, indexes):
+        with self.lock:
+            self.cache.put(key, indexes)
+
+    # Start computing the schedules for the `prewarm_count` parts after
+    # `seq_num`, counting in steps of `step`. Only the most recent request is
+    # kept, so a slow prewarm never falls behind the parts actually being used.
+    def prewarm(self, seq_num, seq_len, checksum, step=1):
+        if self.prewarm_count == 0:
+            return
+
+        with self.lock:
+            self.prewarm_request = (seq_num, seq_len, checksum, step)
+            if self.prewarm_running:
+                return
+            self.prewarm_running = True
+
+        _thread.start_new_thread(self.prewarm_worker, ())
+
+    def prewarm_worker(self):
+        while True:
+            with self.lock:
+                request = self.prewarm_request
+                self.prewarm_request = None
+                if request == None:
+                    self.prewarm_running = False
+                    return
+
+            (seq_num, seq_len, checksum, step) = request
+            for i in range(1, self.prewarm_count + 1):
+                next_seq_num = (seq_num + i * step) % MAX_UINT32
+                if next_seq_num <= seq_len:
+                    continue
+
+                key = (next_seq_num, seq_len, checksum)
+                with self.lock:
+                    if key in self.cache:
+                        continue
+                    # Stop early if a newer request has come in
+                    if self.prewarm_request != None:
+                        break
+
+                self.put(key, choose_fragments(next_seq_num, seq_len, checksum))
+
+    def hits(self):
+        return self.cache.hits
+
+    def misses(self):
+        return self.cache.misses
+
+    def hit_rate(self):
+        return self.cache.hit_rate()
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+# The cache used by encoders and decoders that aren't given one explicitly
+DEFAULT_SCHEDULE_CACHE = ScheduleCache()
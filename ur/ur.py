@@ -11,6 +11,7 @@ class InvalidType(Exception):
     pass
 
 class UR:
+    __slots__ = ('type', 'cbor')
 
     def __init__(self, type, cbor):
         if not is_ur_type(type):
@@ -7,9 +7,11 @@
 
 from .ur import UR
 from .fountain_encoder import FountainEncoder, Part as FountainEncoderPart
-from .fountain_decoder import FountainDecoder
-from .bytewords import *
-from .utils import drop_first, is_ur_type
+from .fountain_decoder import FountainDecoder, Fountain_Solver_peeling
+from .bytewords import Bytewords, Bytewords_Style_minimal
+from .lru_cache import LRUCache
+from .fountain_utils import contains
+from .utils import drop_first, is_ur_type, is_digits
 
 class InvalidScheme(Exception):
     pass
@@ -26,11 +28,26 @@ class InvalidSequenceComponent(Exception):
 class InvalidFragment(Exception):
     pass
 
+# The number of recently seen parts remembered by default
+DEFAULT_SEEN_PARTS_SIZE = 64
+
 class URDecoder:
-    def __init__(self):
-        self.fountain_decoder = FountainDecoder()
+    # `solver` and `lazy` choose how the fountain decoder recovers the message
+    # from multi-part URs. See `FountainDecoder`.
+    #
+    # A scanner usually reads each frame of an animated QR code several times.
+    # The decoder remembers the last `seen_parts_size` part strings whose
+    # header it accepted, and the sequence numbers of all the parts it has
+    # received, and rejects repeats of them before decoding them again. Pass 0
+    # to turn this off.
+    def __init__(self, solver = Fountain_Solver_peeling, lazy = False, seen_parts_size = DEFAULT_SEEN_PARTS_SIZE):
+        self.fountain_decoder = FountainDecoder(solver=solver, lazy=lazy)
         self.expected_type = None
         self.result = None
+        self.seen_parts = LRUCache(seen_parts_size) if seen_parts_size > 0 else None
+        self.received_seq_nums = set() if seen_parts_size > 0 else None
+        self.duplicate_parts_count = 0
+        self.duplicate_seq_nums_count = 0
 
     @staticmethod
     def decode(str):
@@ -72,6 +89,30 @@ class URDecoder:
         comps = components[1:] # Don't include the ur type
         return (type, comps)
 
+    # Split the start of a UR, without looking at its body, into
+    # `(type, seq_num, seq_len, body)`. `seq_num` and `seq_len` are `None` if
+    # there is no sequence component. Returns `None` if it isn't a UR.
+    @staticmethod
+    def parse_header(str):
+        if str[0:3].lower() != 'ur:':
+            return None
+
+        end = str.find('/', 3)
+        if end == -1:
+            return None
+        type = str[3:end].lower()
+        if not is_ur_type(type):
+            return None
+
+        body = str[end + 1:]
+        end = body.find('/')
+        if end != -1:
+            dash = body.find('-', 0, end)
+            if dash != -1 and is_digits(body[0:dash]) and is_digits(body[dash + 1:end]):
+                return (type, int(body[0:dash]), int(body[dash + 1:end]), body[end + 1:])
+
+        return (type, None, None, body)
+
     @staticmethod
     def parse_sequence_component(str):
         try:
@@ -95,32 +136,59 @@ class URDecoder:
         else:
             return type == self.expected_type
 
+    # Return `True` if a part with this sequence component could be accepted.
+    # Parts for a different message, or pure parts whose fragment has already
+    # been received, are rejected without decoding them.
+    def admit_part(self, seq_num, seq_len):
+        if seq_num < 1 or seq_len < 1:
+            return False
+
+        fountain_decoder = self.fountain_decoder
+        if fountain_decoder.expected_part_indexes != None:
+            if seq_len != fountain_decoder.expected_part_count():
+                return False
+            if seq_num <= seq_len and contains(fountain_decoder.received_part_indexes, seq_num - 1):
+                return False
+
+        return True
+
     def receive_part(self, str):
         try:
             # Don't process the part if we're already done
             if self.result != None:
                 return False
 
+            # Don't process the same string twice
+            if self.is_duplicate(str):
+                return False
+
+            # Check the header before decoding the body
+            header = URDecoder.parse_header(str)
+            if header == None:
+                return False
+
             # Don't continue if this part doesn't validate
-            (type, components) = URDecoder.parse(str)
+            (type, seq_num, seq_len, body) = header
             if not self.validate_part(type):
                 return False
 
+            if len(body) == 0 or '/' in body:
+                raise InvalidPathLength()
+
             # If this is a single-part UR then we're done
-            if len(components) == 1:
-                body = components[0]
+            if seq_num == None:
                 self.result = self.decode_by_type(type, body)
                 return True
 
-            # Multi-part URs must have two path components: seq/fragment
-            if len(components) != 2:
-                raise InvalidPathLength()
-            seq = components[0]
-            fragment = components[1]
+            # Make sure the part belongs to this message and is needed
+            if not self.admit_part(seq_num, seq_len):
+                return False
+            self.remember_part(str)
+            if self.is_duplicate_seq_num(seq_num):
+                return False
 
-            # Parse the sequence component and the fragment, and make sure they agree.
-            (seq_num, seq_len) = URDecoder.parse_sequence_component(seq)
-            cbor = Bytewords.decode(Bytewords_Style_minimal, fragment)
+            # Decode the fragment, and make sure it agrees with the sequence component.
+            cbor = Bytewords.decode(Bytewords_Style_minimal, body)
             part = FountainEncoderPart.from_cbor(cbor)
             if seq_num != part.seq_num or seq_len != part.seq_len:
                 return False
@@ -128,6 +196,7 @@ class URDecoder:
             # Process the part
             if not self.fountain_decoder.receive_part(part):
                 return False
+            self.remember_seq_num(seq_num)
 
             if self.fountain_decoder.is_success():
                 self.result = UR(type, self.fountain_decoder.result_message())
@@ -138,6 +207,32 @@ class URDecoder:
         except Exception as err:
             return False
 
+    # Return `True` if the part string `str` has been seen recently, and count
+    # it as a duplicate
+    def is_duplicate(self, str):
+        if self.seen_parts == None or self.seen_parts.get(str) == None:
+            return False
+        self.duplicate_parts_count += 1
+        return True
+
+    # Part strings are only remembered once their header has been admitted, so
+    # that garbage and frames of other messages don't evict them
+    def remember_part(self, str):
+        if self.seen_parts != None:
+            self.seen_parts.put(str, True)
+
+    # Return `True` if the part with this sequence number has already been
+    # received, and count it as a duplicate
+    def is_duplicate_seq_num(self, seq_num):
+        if self.received_seq_nums == None or seq_num not in self.received_seq_nums:
+            return False
+        self.duplicate_seq_nums_count += 1
+        return True
+
+    def remember_seq_num(self, seq_num):
+        if self.received_seq_nums != None:
+            self.received_seq_nums.add(seq_num)
+
     def expected_type(self):
        return self.expected_type
 
@@ -6,13 +6,85 @@
 #
 
 from .fountain_encoder import FountainEncoder
-from .bytewords import *
+from .bytewords import Bytewords, Bytewords_Style_minimal, MINIMAL_WORDS
+from .cbor_lite import CBOREncoder, get_tag_and_value_length, Tag_Major_array, Tag_Major_byteString, \
+    Tag_Minor_length1, Tag_Minor_length2, Tag_Minor_length4, Tag_Minor_length8
+from .crc32 import crc32
+from .qr_capacity import qr_capacity, QR_Mode_alphanumeric
+from .utils import crc32_int
+from .constants import MAX_UINT32
+
+# The CBOR header of a part: a 5-element array, followed by `seq_num`, encoded
+# in one of the widths below. Each entry holds the largest `seq_num` of its
+# width, the header bytes before the value, and the number of value bytes.
+PART_HEADER_WIDTHS = (
+    (23, bytes([Tag_Major_array + 5]), 1),
+    (0xff, bytes([Tag_Major_array + 5, Tag_Minor_length1]), 1),
+    (0xffff, bytes([Tag_Major_array + 5, Tag_Minor_length2]), 2),
+    (0xffffffff, bytes([Tag_Major_array + 5, Tag_Minor_length4]), 4),
+    (0xffffffffffffffff, bytes([Tag_Major_array + 5, Tag_Minor_length8]), 8),
+)
+
+# Serializes the parts of one message as UR strings. Everything but `seq_num`
+# and the data is the same for every part, so the URI prefix, the CBOR that
+# follows `seq_num` and their minimal Bytewords are computed once. So are the
+# CRC and Bytewords of the header bytes before `seq_num` for each width, so
+# the CRC of a part resumes from there.
+class PartTemplate:
+    def __init__(self, type, seq_len, message_len, checksum, fragment_len):
+        self.prefix = 'ur:{}/'.format(type)
+        self.seq_len_suffix = '-{}/'.format(seq_len)
+
+        encoder = CBOREncoder()
+        encoder.encodeInteger(seq_len)
+        encoder.encodeInteger(message_len)
+        encoder.encodeInteger(checksum)
+        encoder.encodeTagAndValue(Tag_Major_byteString, fragment_len)
+        self.tail = bytes(encoder.get_bytes())
+        self.tail_words = ''.join([MINIMAL_WORDS[b] for b in self.tail])
+        self.fragment_len = fragment_len
+
+        self.head_crcs = [crc32(head) for (_, head, _) in PART_HEADER_WIDTHS]
+        self.head_words = [''.join([MINIMAL_WORDS[b] for b in head]) for (_, head, _) in PART_HEADER_WIDTHS]
+
+    # Return the UR string of the part with the given `seq_num` and data. The
+    # result is the same as `UREncoder.encode_part()`.
+    def encode(self, seq_num, data):
+        assert(len(data) == self.fragment_len)
+        width = 0
+        while seq_num > PART_HEADER_WIDTHS[width][0]:
+            width += 1
+        seq_num_bytes = seq_num.to_bytes(PART_HEADER_WIDTHS[width][2], 'big')
+
+        crc = crc32(seq_num_bytes, self.head_crcs[width])
+        crc = crc32(self.tail, crc)
+        crc = crc32(data, crc)
+
+        words = MINIMAL_WORDS
+        return ''.join([
+            self.prefix, str(seq_num), self.seq_len_suffix,
+            self.head_words[width],
+            ''.join([words[b] for b in seq_num_bytes]),
+            self.tail_words,
+            ''.join([words[b] for b in data]),
+            ''.join([words[b] for b in crc.to_bytes(4, 'big')])])
 
 class UREncoder:
     # Start encoding a (possibly) multi-part UR.
-    def __init__(self, ur, max_fragment_len, first_seq_num = 0, min_fragment_len = 10):
+    #
+    # When the UR is shown on several displays at once, pass each display's
+    # encoder a different `stripe_index` in `range(stripe_count)` so that they
+    # generate disjoint, interleaved parts. See `FountainEncoder`.
+    def __init__(self, ur, max_fragment_len, first_seq_num = 0, min_fragment_len = 10, stripe_index = 0, stripe_count = 1):
         self.ur = ur
-        self.fountain_encoder = FountainEncoder(ur.cbor, max_fragment_len, first_seq_num, min_fragment_len)
+        self.fountain_encoder = FountainEncoder(ur.cbor, max_fragment_len, first_seq_num, min_fragment_len,
+            stripe_index=stripe_index, stripe_count=stripe_count)
+        if self.is_single_part():
+            self.template = None
+        else:
+            fountain_encoder = self.fountain_encoder
+            self.template = PartTemplate(ur.type, fountain_encoder.seq_len(), fountain_encoder.message_len,
+                fountain_encoder.checksum, fountain_encoder.fragment_len)
 
     # Encode a single-part UR.
     @staticmethod
@@ -20,6 +92,72 @@ class UREncoder:
         body = Bytewords.encode(Bytewords_Style_minimal, ur.cbor)
         return UREncoder.encode_ur([ur.type, body])
 
+    # Return the length of the UR string for a part of the given type, with the
+    # given header values and a fragment of `fragment_len` bytes.
+    @staticmethod
+    def part_length(type, seq_num, seq_len, message_len, checksum, fragment_len):
+        # CBOR array of four unsigned integers and a byte string
+        cbor_len = 1 + get_tag_and_value_length(seq_num) + get_tag_and_value_length(seq_len) + \
+            get_tag_and_value_length(message_len) + get_tag_and_value_length(checksum) + \
+            get_tag_and_value_length(fragment_len) + fragment_len
+
+        # ur:<type>/<seq_num>-<seq_len>/<minimal Bytewords of the CBOR and its CRC>
+        seq_len_chars = len(str(seq_num)) + 1 + len(str(seq_len))
+        return 3 + len(type) + 1 + seq_len_chars + 1 + 2 * (cbor_len + 4)
+
+    # Return the length of the UR string for a single-part UR
+    @staticmethod
+    def single_part_length(ur):
+        return 3 + len(ur.type) + 1 + 2 * (len(ur.cbor) + 4)
+
+    # Choose the fragment length for displaying `ur` in QR codes of the given
+    # version (1-40), error correction level ('L', 'M', 'Q' or 'H') and encoding
+    # mode ('alphanumeric' for uppercased URs, or 'byte').
+    #
+    # The result is the largest fragment length for which every part, up to
+    # sequence number `max_seq_num`, fits in the QR code. Since fewer, larger
+    # fragments need fewer frames for full delivery, this minimises the
+    # expected number of frames. The search takes O(log n) steps. Pass the
+    # result as `max_fragment_len` to the `UREncoder`, along with a
+    # `min_fragment_len` no larger than it. Raises `ValueError` if even
+    # single-byte fragments don't fit.
+    @staticmethod
+    def plan(ur, qr_version, ecc = 'L', mode = QR_Mode_alphanumeric, max_seq_num = MAX_UINT32 - 1):
+        capacity = qr_capacity(qr_version, ecc, mode)
+        message_len = len(ur.cbor)
+        checksum = crc32_int(ur.cbor)
+
+        def fragment_len_for(fragment_count):
+            return (message_len + fragment_count - 1) // fragment_count
+
+        def fits(fragment_count):
+            fragment_len = fragment_len_for(fragment_count)
+            seq_len = (message_len + fragment_len - 1) // fragment_len
+            if seq_len == 1:
+                return UREncoder.single_part_length(ur) <= capacity
+
+            # Sequence numbers only grow longer, so the last part is the longest
+            seq_num = max(max_seq_num, seq_len)
+            return UREncoder.part_length(ur.type, seq_num, seq_len, message_len, checksum, fragment_len) <= capacity
+
+        # A single-part UR has no sequence header, so check it separately
+        if fits(1):
+            return message_len
+
+        # Find the fewest fragments that fit
+        low = 2
+        high = message_len
+        if not fits(high):
+            raise ValueError('UR does not fit in a version {}-{} QR code'.format(qr_version, ecc))
+        while low < high:
+            mid = (low + high) // 2
+            if fits(mid):
+                high = mid
+            else:
+                low = mid + 1
+
+        return fragment_len_for(low)
+
     def last_part_indexes(self):
         return self.fountain_encoder.last_part_indexes()
 
@@ -39,7 +177,22 @@ class UREncoder:
         if self.is_single_part():
             return UREncoder.encode(self.ur)
         else:
-            return UREncoder.encode_part(self.ur.type, part)
+            return self.template.encode(part.seq_num, part.data)
+
+    # Return the UR string of the part with the given sequence number, without
+    # changing the encoder. See `FountainEncoder.part_at()`.
+    def ur_part_at(self, seq_num):
+        if self.is_single_part():
+            return UREncoder.encode(self.ur)
+        else:
+            part = self.fountain_encoder.part_at(seq_num)
+            return self.template.encode(part.seq_num, part.data)
+
+    # Generate the UR strings of the parts with sequence numbers
+    # `range(start, stop, step)`
+    def parts_range(self, start, stop, step = 1):
+        for seq_num in range(start, stop, step):
+            yield self.ur_part_at(seq_num)
 
     @staticmethod
     def encode_part(type, part):
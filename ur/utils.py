@@ -6,6 +6,10 @@
 #
 
 from .crc32 import crc32, crc32n
+from . import xor_kernel
+
+UR_TYPE_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789-'
+DIGITS = '0123456789'
 
 def crc32_bytes(buf):
     checksum = crc32n(buf)
@@ -27,14 +31,13 @@ def bytes_to_int(buf):
 def string_to_bytes(s):
     return bytes(s, 'utf8')
 
-def is_ur_type(ch):
-    if 'a' <= ch and ch <= 'z':
-         return True
-    if '0' <= ch and ch <= '9':
-        return True
-    if ch == '-':
-        return True
-    return False
+# A UR type is made of lowercase letters, digits and hyphens
+def is_ur_type(type):
+    return len(type) > 0 and all(c in UR_TYPE_CHARS for c in type)
+
+# Return `True` if `s` is a non-empty string of decimal digits
+def is_digits(s):
+    return len(s) > 0 and all(c in DIGITS for c in s)
 
 def partition(s, n):
     return [s[i:i+n] for i in range(0, len(s), n)]
@@ -56,16 +59,17 @@ def join_bytes(list_of_ba):
     return out
 
 def xor_into(target, source):
-    count = len(target)
-    assert(count == len(source)) # Must be the same length
-    for i in range(count):
-        target[i] ^= source[i]
+    xor_kernel.BACKEND.xor_into(target, source)
 
 def xor_with(a, b):
     target = a
     xor_into(target, b)
     return target
 
+# Return `a` XOR `b` as a new `bytes`, leaving both unchanged
+def xor_bytes(a, b):
+    return xor_kernel.BACKEND.xor_bytes(a, b)
+
 def take_first(s, count):
     return s[0:count]
 
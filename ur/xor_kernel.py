@@ -0,0 +1,160 @@
+#
+# xor_kernel.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+# XORing fragments together is the inner loop of both the fountain encoder and
+# decoder. This module provides several implementations ("backends") of the
+# XOR operations. The big integer backend is used by default, since it is the
+# fastest at the fragment sizes used in QR codes, falling back to a plain loop
+# where big integers can't be used. Call `set_backend()` to override the
+# choice.
+#
+# Each backend has a "native" representation of a buffer that is cheap to XOR.
+# Callers that XOR many buffers together convert them once with `load()`,
+# combine them with `xor()` starting from `zero()`, and convert the result back
+# with `store()`.
+
+# NumPy takes a long time to import, so it is only imported when the NumPy
+# backend is selected
+np = None
+
+# Byte-at-a-time loop. Works everywhere, including MicroPython.
+class LoopBackend:
+    name = 'loop'
+
+    def load(self, buf):
+        return buf
+
+    def zero(self, length):
+        return bytearray(length)
+
+    # Return `acc` XOR `value`, updating `acc` in place
+    def xor(self, acc, value):
+        for i in range(len(acc)):
+            acc[i] ^= value[i]
+        return acc
+
+    def store(self, acc, length):
+        return bytes(acc)
+
+    # Return `a` XOR `b` as a new `bytes`
+    def xor_bytes(self, a, b):
+        assert(len(a) == len(b)) # Must be the same length
+        return bytes(self.xor(bytearray(a), b))
+
+    # XOR `source` into the mutable buffer `target`
+    def xor_into(self, target, source):
+        count = len(target)
+        assert(count == len(source)) # Must be the same length
+        for i in range(count):
+            target[i] ^= source[i]
+
+# Treats each buffer as one big-endian integer, so an XOR is a single
+# arbitrary-precision integer operation.
+class BigIntBackend:
+    name = 'bigint'
+
+    def load(self, buf):
+        return int.from_bytes(buf, 'big')
+
+    def zero(self, length):
+        return 0
+
+    def xor(self, acc, value):
+        return acc ^ value
+
+    def store(self, acc, length):
+        return acc.to_bytes(length, 'big')
+
+    def xor_bytes(self, a, b):
+        length = len(a)
+        assert(length == len(b)) # Must be the same length
+        return (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(length, 'big')
+
+    def xor_into(self, target, source):
+        target[:] = self.xor_bytes(target, source)
+
+# Uses NumPy, viewing buffers as arrays of uint64 words where possible.
+class NumpyBackend:
+    name = 'numpy'
+
+    # Native values are uint64 arrays, zero padded to a whole number of words
+    def load(self, buf):
+        acc = self.zero(len(buf))
+        acc.view(np.uint8)[0:len(buf)] = np.frombuffer(buf, dtype=np.uint8)
+        return acc
+
+    def zero(self, length):
+        return np.zeros((length + 7) // 8, dtype=np.uint64)
+
+    def xor(self, acc, value):
+        return np.bitwise_xor(acc, value, out=acc)
+
+    def store(self, acc, length):
+        return acc.view(np.uint8)[0:length].tobytes()
+
+    def view(self, buf):
+        dtype = np.uint64 if len(buf) % 8 == 0 else np.uint8
+        return np.frombuffer(buf, dtype=dtype)
+
+    def xor_bytes(self, a, b):
+        assert(len(a) == len(b)) # Must be the same length
+        return (self.view(a) ^ self.view(b)).tobytes()
+
+    def xor_into(self, target, source):
+        assert(len(target) == len(source)) # Must be the same length
+        try:
+            t = self.view(target)
+        except (TypeError, ValueError):
+            # Not a writable buffer (e.g., a list of ints)
+            return BACKENDS[LoopBackend.name].xor_into(target, source)
+        np.bitwise_xor(t, self.view(source), out=t)
+
+BACKENDS = {
+    LoopBackend.name: LoopBackend(),
+    BigIntBackend.name: BigIntBackend(),
+}
+
+# The names of all the backends, including those not loaded yet
+BACKEND_NAMES = (LoopBackend.name, BigIntBackend.name, NumpyBackend.name)
+
+# Import NumPy and add its backend. Returns `False` if it isn't installed.
+def load_numpy_backend():
+    global np
+    if NumpyBackend.name in BACKENDS:
+        return True
+    try:
+        import numpy
+    except:
+        return False
+    np = numpy
+    BACKENDS[NumpyBackend.name] = NumpyBackend()
+    return True
+
+def bigint_available():
+    try:
+        return BigIntBackend().xor_bytes(b'\xff' * 32, b'\x0f' * 32) == b'\xf0' * 32
+    except:
+        return False
+
+def select_backend():
+    if bigint_available():
+        return BACKENDS[BigIntBackend.name]
+    return BACKENDS[LoopBackend.name]
+
+BACKEND = select_backend()
+
+def get_backend():
+    return BACKEND
+
+# Select the backend by name: 'loop', 'bigint' or (if installed) 'numpy'
+def set_backend(name):
+    global BACKEND
+    if name == NumpyBackend.name and not load_numpy_backend():
+        raise ValueError('NumPy is not available')
+    if name not in BACKENDS:
+        raise ValueError('Unknown XOR backend: {}'.format(name))
+    BACKEND = BACKENDS[name]
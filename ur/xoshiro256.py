@@ -6,11 +6,12 @@
 #
 
 import sys
+from array import array
 try:
-    import uhashlib as hashlib
+    import hashlib
 except:
     try:
-        import hashlib
+        import uhashlib as hashlib
     except:
         sys.exit("ERROR: No hashlib or uhashlib implementation found (required for sha256)")
 
@@ -43,6 +44,129 @@ def rotl(x, k):
 JUMP = [ 0x180ec6d33cfd0aba, 0xd5a61266f0c9392c, 0xa9582618e03fc9aa, 0x39abdc4529b1661c ]
 LONG_JUMP = [ 0x76e15d3efefdcbbf, 0xc5004e441c522fb3, 0x77710069854ee241, 0x39109bb02acbe635 ]
 
+# The state transition of xoshiro256 is linear over GF(2), so advancing the
+# generator by n steps is the same as applying a polynomial in the transition to
+# the state: the remainder of x^n divided by the characteristic polynomial of
+# the transition. JUMP and LONG_JUMP are such polynomials, for 2^128 and 2^192
+# steps. Here polynomials are ints, with bit k the coefficient of x^k; JUMP
+# and LONG_JUMP split theirs into four 64-bit words, lowest first.
+
+# The characteristic polynomial of the transition, of degree 256. Generated by
+# `_make_characteristic_polynomial()`.
+CHARACTERISTIC_POLYNOMIAL = 0x10003c03c3f3ecb1904b4edcf26259f850280002bcefd1a5e9d116f2bb0f0f001
+
+# Find the characteristic polynomial with the Berlekamp-Massey algorithm, from
+# the sequence of one bit of the state. It is frozen into
+# CHARACTERISTIC_POLYNOMIAL, so this is only needed to check that constant.
+def _make_characteristic_polynomial():
+    rng = Xoshiro256([1, 0, 0, 0])
+    bits = []
+    for i in range(512):
+        bits.append(rng.s[0] & 1)
+        rng.next()
+
+    c = 1
+    b = 1
+    l = 0
+    m = 1
+    for n in range(len(bits)):
+        d = bits[n]
+        for i in range(1, l + 1):
+            d ^= (c >> i) & bits[n - i]
+        if d == 0:
+            m += 1
+        elif 2 * l <= n:
+            t = c
+            c ^= b << m
+            l = n + 1 - l
+            b = t
+            m = 1
+        else:
+            c ^= b << m
+            m += 1
+
+    # `c` is the connection polynomial, whose coefficients are in reverse order
+    result = 0
+    for i in range(l + 1):
+        result |= ((c >> i) & 1) << (l - i)
+    return result
+
+# Return the square of the polynomial `a` modulo CHARACTERISTIC_POLYNOMIAL
+def poly_square_mod(a):
+    result = 0
+    i = 0
+    while a != 0:
+        if a & 1:
+            result |= 1 << (2 * i)
+        a >>= 1
+        i += 1
+
+    for i in range(510, 255, -1):
+        if (result >> i) & 1:
+            result ^= CHARACTERISTIC_POLYNOMIAL << (i - 256)
+    return result
+
+# States are packed into a single int as
+# `s[0] | s[1] << 64 | s[2] << 128 | s[3] << 192`. The jumps of JUMP and
+# LONG_JUMP are also stored as 256x256 bit matrices, as lists of their 256
+# columns, each one a packed state. Multiplying a state by a matrix costs one
+# XOR per bit set in the state, rather than 256 generator steps.
+def pack_state(s):
+    return s[0] | (s[1] << 64) | (s[2] << 128) | (s[3] << 192)
+
+def unpack_state(v):
+    return [v & MAX_UINT64, (v >> 64) & MAX_UINT64, (v >> 128) & MAX_UINT64, v >> 192]
+
+# Multiply a packed state by a matrix
+def apply_matrix(matrix, v):
+    result = 0
+    i = 0
+    while v != 0:
+        if v & 1:
+            result ^= matrix[i]
+        v >>= 1
+        i += 1
+    return result
+
+# Build the matrix of a jump polynomial, by jumping from each state with a
+# single bit set. The matrices of JUMP and LONG_JUMP are frozen into
+# xoshiro256_jump_table.py, so this is only needed to regenerate that file.
+def _make_jump_matrix(jump):
+    columns = []
+    for i in range(256):
+        rng = Xoshiro256(unpack_state(1 << i))
+        rng._jump(jump)
+        columns.append(pack_state(rng.s))
+    return columns
+
+# Loaded from xoshiro256_jump_table.py by the first jump
+JUMP_MATRIX = None
+LONG_JUMP_MATRIX = None
+
+# Below this many steps, `jump_ahead()` just steps the generator
+JUMP_AHEAD_STEP_LIMIT = 1024
+
+# Return the jump polynomial that advances the generator by `n` steps, as four
+# 64-bit words like JUMP and LONG_JUMP
+def jump_polynomial(n):
+    assert(n >= 0)
+
+    # Compute x^n by squaring, from the highest bit of `n` down
+    bits = []
+    while n != 0:
+        bits.append(n & 1)
+        n >>= 1
+
+    result = 1
+    for bit in reversed(bits):
+        result = poly_square_mod(result)
+        if bit:
+            result <<= 1
+            if (result >> 256) & 1:
+                result ^= CHARACTERISTIC_POLYNOMIAL
+
+    return [(result >> (64 * i)) & MAX_UINT64 for i in range(4)]
+
 class Xoshiro256:
     def __init__(self, arr = None):
         self.s = [0] * 4
@@ -95,18 +219,58 @@ class Xoshiro256:
         return x
 
     def next(self):
-        result = (rotl((self.s[1] * 5) & MAX_UINT64, 7) * 9) & MAX_UINT64
-        t = (self.s[1] << 17) & MAX_UINT64
+        s = self.s
+        s0 = s[0]
+        s1 = s[1]
+        s2 = s[2]
+        s3 = s[3]
+
+        x = (s1 * 5) & MAX_UINT64
+        result = ((((x << 7) | (x >> 57)) & MAX_UINT64) * 9) & MAX_UINT64
+        t = (s1 << 17) & MAX_UINT64
 
-        self.s[2] ^= self.s[0]
-        self.s[3] ^= self.s[1]
-        self.s[1] ^= self.s[2]
-        self.s[0] ^= self.s[3]
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
 
-        self.s[2] ^= t
+        s2 ^= t
 
-        self.s[3] = rotl(self.s[3], 45) & MAX_UINT64
+        s3 = ((s3 << 45) | (s3 >> 19)) & MAX_UINT64
+
+        s[0] = s0
+        s[1] = s1
+        s[2] = s2
+        s[3] = s3
+        return result
 
+    # Return the next `count` outputs as an array of unsigned 64-bit integers.
+    # This gives the same values as calling `next()` `count` times, but keeps the
+    # state in local variables for the duration of the loop.
+    def next_n(self, count):
+        s = self.s
+        s0 = s[0]
+        s1 = s[1]
+        s2 = s[2]
+        s3 = s[3]
+
+        result = array('Q')
+        append = result.append
+        for i in range(count):
+            x = (s1 * 5) & MAX_UINT64
+            append((((((x << 7) | (x >> 57)) & MAX_UINT64) * 9) & MAX_UINT64))
+            t = (s1 << 17) & MAX_UINT64
+            s2 ^= s0
+            s3 ^= s1
+            s1 ^= s2
+            s0 ^= s3
+            s2 ^= t
+            s3 = ((s3 << 45) | (s3 >> 19)) & MAX_UINT64
+
+        s[0] = s0
+        s[1] = s1
+        s[2] = s2
+        s[3] = s3
         return result
 
     def next_double(self):
@@ -114,28 +278,61 @@ class Xoshiro256:
         nxt = self.next()
         return nxt / m
 
+    # Batched version of `next_double()`
+    def next_doubles(self, count):
+        m = float(MAX_UINT64) + 1
+        return array('d', [nxt / m for nxt in self.next_n(count)])
+
     def next_int(self, low, high):
         return int(self.next_double() * (high - low + 1) + low) & MAX_UINT64
 
+    # Batched version of `next_int()`
+    def next_ints(self, low, high, count):
+        n = high - low + 1
+        return [int(d * n + low) & MAX_UINT64 for d in self.next_doubles(count)]
+
     def next_byte(self):
         return self.next_int(0, 255)
 
+    # Return `count` random bytes, the same as calling `next_byte()` `count`
+    # times. The result is filled in place, with the state kept in local
+    # variables for the duration of the loop.
     def next_data(self, count):
-        result = bytearray()
+        m = float(MAX_UINT64) + 1
+        s = self.s
+        s0 = s[0]
+        s1 = s[1]
+        s2 = s[2]
+        s3 = s[3]
+
+        result = bytearray(count)
         for i in range(count):
-            result.append(self.next_byte())
+            x = (s1 * 5) & MAX_UINT64
+            nxt = ((((x << 7) | (x >> 57)) & MAX_UINT64) * 9) & MAX_UINT64
+            result[i] = int(nxt / m * 256 + 0) & MAX_UINT64
+            t = (s1 << 17) & MAX_UINT64
+            s2 ^= s0
+            s3 ^= s1
+            s1 ^= s2
+            s0 ^= s3
+            s2 ^= t
+            s3 = ((s3 << 45) | (s3 >> 19)) & MAX_UINT64
+
+        s[0] = s0
+        s[1] = s1
+        s[2] = s2
+        s[3] = s3
         return result
 
-    def jump(self):
-        global JUMP
-
+    # Apply a jump polynomial, given as four 64-bit words, to the state
+    def _jump(self, jump):
         s0 = 0
         s1 = 0
         s2 = 0
         s3 = 0
-        for i in range(len(JUMP)):
+        for i in range(len(jump)):
             for b in range(64):
-                if JUMP[i] & (1 << b):
+                if jump[i] & (1 << b):
                     s0 ^= self.s[0]
                     s1 ^= self.s[1]
                     s2 ^= self.s[2]
@@ -147,23 +344,30 @@ class Xoshiro256:
         self.s[2] = s2
         self.s[3] = s3
 
-    def long_jump(self):
-        global LONG_JUMP
+    def _apply_matrix(self, matrix):
+        self.s = unpack_state(apply_matrix(matrix, pack_state(self.s)))
 
-        s0 = 0
-        s1 = 0
-        s2 = 0
-        s3 = 0
-        for i in range(len(LONG_JUMP)):
-            for b in range(64):
-                if LONG_JUMP[i] & (1 << b):
-                    s0 ^= self.s[0]
-                    s1 ^= self.s[1]
-                    s2 ^= self.s[2]
-                    s3 ^= self.s[3]
+    # Advance the generator by `n` steps, as if `next()` had been called `n`
+    # times, in time proportional to the number of bits in `n`.
+    def jump_ahead(self, n):
+        assert(n >= 0)
+        if n < JUMP_AHEAD_STEP_LIMIT:
+            for i in range(n):
                 self.next()
+        else:
+            self._jump(jump_polynomial(n))
 
-        self.s[0] = s0
-        self.s[1] = s1
-        self.s[2] = s2
-        self.s[3] = s3
+    # Equivalent to 2^128 calls to `next()`
+    def jump(self):
+        # The matrices take a while to load, so don't import them until needed
+        global JUMP_MATRIX
+        if JUMP_MATRIX == None:
+            from ur.xoshiro256_jump_table import JUMP_MATRIX
+        self._apply_matrix(JUMP_MATRIX)
+
+    # Equivalent to 2^192 calls to `next()`
+    def long_jump(self):
+        global LONG_JUMP_MATRIX
+        if LONG_JUMP_MATRIX == None:
+            from ur.xoshiro256_jump_table import LONG_JUMP_MATRIX
+        self._apply_matrix(LONG_JUMP_MATRIX)
@@ -0,0 +1,530 @@
+#
+# xoshiro256_jump_table.py
+#
+# Copyright © 2020 Foundation Devices, Inc.
+# Licensed under the "BSD-2-Clause Plus Patent License"
+#
+
+# The jumps of xoshiro256.py as 256x256 bit matrices, stored as constants so they
+# can be frozen into firmware rather than built at runtime. Each matrix is a
+# tuple of its 256 columns, each one a packed state. JUMP_MATRIX advances the
+# generator by 2^128 steps and LONG_JUMP_MATRIX by 2^192 steps. Generated by
+# `xoshiro256._make_jump_matrix()`.
+
+JUMP_MATRIX = (
+    0xccdd35ec385c77b3916b739d098c76489109688ad329b9604e430587575d3eb3,
+    0x1d8655f393535ea530ba0191ad9dfc5871689dd212c9468a85f96a097e2fe404,
+    0x091fd44be1410ca40acd21fc100290e36c9a85ccb545f4107c827e35f39c0021,
+    0xd8aa4aebe1b721982f60647f27ead1aadd375533c7813cf1d40e66e400d1d407,
+    0xcee2122e25950fbecbc778be1264b2a73906db63861aa8ff563c85cbdc748bdb,
+    0xc851e16d88693d88a001262a279e3011305adf2a0733f9b54ea96635932bb60b,
+    0x6cb1536548ab57cf7597b0f093a2d62700e62ba2ae1e4bdcc0ed6c34e1ddf502,
+    0xeb9d4133eb0bfcf449bfc9f414008c66d8d75d9eff237c71926e81e7a6ae8d45,
+    0x4c6e14deb6498a83efef9f8549d8cb0d23a2bdf1f2509938e253d4d8823e2197,
+    0x1865c5f742a2de9a945327cc3748b6694723537cdadc8621ef52021175c1a3d5,
+    0xa5e13b95e9c25bd160122d342475db0852e1afa6b3e7b06afebf913c6a302a86,
+    0x42723b1a2c9afaa4b284dfa9848a95d9350cd8ee726f81c9b90a2296870ce322,
+    0x0d2e7236ef7cf5e2c8035546defeb988e4155a2fbed6dd3176b33ca81b2ce346,
+    0x89d9558c0a0fc06d2c8ffaf3940434c81b1ad81bae562f7c1c3e14f58b3e78ea,
+    0x1465ac7ae8153d2b952e4e20ceea86d93fc69558dd0291c8ef3cf9709b75d7fb,
+    0x237bd1f33520b62c2035fb82714528d99168d8051e80efae495062a6b8e83f1d,
+    0xb8845e178b0b35180e45f2136066b15e6cb70062d198288104728437274607f6,
+    0xf2db5ce154939b0bbfb4d95b01e5a27a9d5d4040e3aa564f50283f7affd1ec18,
+    0x228787a4bf4e8186e213c0be6516b50e82a00d982c688be42a6d2c6434e23846,
+    0xa7a4b2225f446e03f8fdbe02f8201ea95ddf1e1b10e962bc52ce2c8d718b6458,
+    0x7a90e9dc0edab8ae31c2a344cd27521bcfbd36ec7e0bfdb35a7f8e7e1ccf61e4,
+    0xc409ebb167ecc6a29cf03e175e53f22175a2399c359efdd63686d787c8bc61f8,
+    0x94f1ee2221a2d4028d89b4d5acabfb160e68195adae00ac67d0f67ccf6cdf559,
+    0x9e0025fdde22ca46a4ce121c172a886e7fe22615c2a3389ccc151cb90e6dc1ab,
+    0x1cf57b4caed9c4871e47deaead9ba89be3b02cbf6c3951ab6c0febd011de2f63,
+    0xfda0282c274a339e2998378549a3f17368d2ca43b7eaceec0352176b36b4e2e9,
+    0x5029f8621874c97aafacd917077b68f91ef8889a790a6bb4a7b510c1f55afd5b,
+    0x08abb48785d9b2571740d3d8e5fe8fe951c637b278c50683ca92fd750dfe18e0,
+    0x520c517e797bab1d0de59e41ddb00e90a55e3ea9d1bf6535f91da490e9dce770,
+    0xb951363f32ac89fe9a642ab71060fb8921790d87ebec4aa794b9bb40dcead8fb,
+    0x7e46da7f82bda0c4cb499e51a6c7df81df3c92f49d960d4a5e55a6b40f14c1b5,
+    0x1768153ba6a2e3c73ffdac8b9d7f58b8188d11cdcb445bf9022dff9420d682b6,
+    0x3728448f30f50133e10a91bcf957df45bbeec34f996b19308c83cd0bdd57d582,
+    0x700efa98f64d376b69b0fd73e1625dbc91d2cbbd39c9ff50835b1707e9dcdd1b,
+    0xc56e7d04f8669fb244f60c8ad721715b23bc6cf4542863a873f64c71682d5756,
+    0xd2833a159ec5cef49a37390d7cb75bdee1fb9e7ae42f33a45d3156e4592d56d7,
+    0x817aa0dd5413abeae2eccc647d7dd052034f2ab7c3c164b76a499fb31372950e,
+    0x85da93a454fc55b2c3fcd8ab710bcde83f0f2cc2358819775fd21c66ccfb6ed3,
+    0x46ca5e403694832e0959dd85b9bec988dffd4b450bc58523f2ad1be5918185db,
+    0xcc51a75cba960af6b57559d5a661f628b522c46fcf6ee576c5eae0969305a632,
+    0x30f459ed36008e79c994af72bd470ec05069d75e4e48a5e12c4f9375e9cc5830,
+    0x8cbe0f6beef2c57389bb5801e7212fc860fc3255cba445e00b13778be25c68bf,
+    0x4b21512303d7638a9f57f2be579eefd0853073ccb1732326c8d20c9710d289b9,
+    0x117a2bde13bb3394ce6b167ab352f5c30ecc848a00324ade30657638e516d1f2,
+    0x23a789f8cb6c5ca4873dbaece3052fbcca50fcecf58bbfb7b47aa6e199ef72d7,
+    0x398584ea3687e1482db930cc2f7c7cde227c041f1342bda30a0a5704440bb984,
+    0x8a9707e56020d5796874a9b9e18974a30f3e4d6a913db8711beabeffbb050bd9,
+    0xe241bb0d4d9a9914eed781223aafcad7f5301998da2b096578b494c1306bdccf,
+    0xce7071ddfc59e14becd77ea9e54b634facfb2c40438ed672c877da10a14f7da9,
+    0xdfb3e9ce5398f62377b522a91bd7a3fb67095ced6950d18bf70b73a010398658,
+    0x58d3daa6a224d6253bd55745986cf508bd259d2879ae29813165cf49bc5eb8a3,
+    0xbbf4387c0bc9617e19f0e4763e1e37e9b5aa4d81d40ed46d718b78053f95a4a7,
+    0x4a8df4f62d850b423819365b9e9f0a069f8daf67c41f2e3ff09545500c95a57e,
+    0x8f7e1d7c1456679c3bd72c7f9c68304e714d4c5a4bcc9c852f82cecda697deab,
+    0x76cc768aca8c6f0ed2359dbc3393d89e42457275703889a3d4ac436b9770450c,
+    0xda870c9c0f739ec00d42a17dd266f082869f2cabf7ed628d16218c81ce288bc5,
+    0xde8681399a040525668bccf93ff5539e5e13bff538dc671bd6725111ff75b5d4,
+    0x81cd78dcf1a8992daf30333c344fd4379b36664345d3906a47294cb0bea149c2,
+    0x43fd86305f1c70f3e079a0bad144506b9ded38edbfef9a4c7b2f781495bebc2d,
+    0x0cb270263061143ceb92a086ecbf42d93f8c1d29cd1a88902742bc40e3684897,
+    0xed2d26f5a7d6965a8013570c29eef6b84ab751c3201059e95cebf9dd14c1ce2d,
+    0x2d1489c40e9536d7a3593969f7c58ec60e05776c1d391d22f930326a1f851bb8,
+    0x5d4a0fda70aeda2d71ac85963257cfe748214e960f3ccac7d412cff3f5193c52,
+    0xfb4b10be6024e0e6860441cfffe3d0731d58c89d0e8f7f8b15145edf099bb538,
+    0x33213ba572c774af5b8ced5b510e66e96bbb8c6cc90d3eb3f2b59f8556eba83a,
+    0xbe0e7ea5e6dc66d3877d2ae90d98ec3296bcffe80b8be404c37252bb74b2f41d,
+    0xa1fafbcaa3b1c68d5322b9c144e648fe8666a7773a7a0021c7da5b8f3124b04a,
+    0xef4b69fd95e02ccf74d6f700af92c5525de0135fda67d40752c212612af0d83b,
+    0x53dbf0154411d939e335610118b8771092bfc457e8c48bdb6695e5e5de79d051,
+    0xfe276283386b7ac088af2ae58c64428f733e01fe0063b60bf3677d0e631c86b2,
+    0x6257bf17572904a7e3e115f31235658aef6360a1da2bf502f77d3d9d58ce7999,
+    0x8c057c47af3f0e78b640b002ff6b5cea968c97fc46808d453ad544f2f38fdc6f,
+    0x73afc205deddd9c6e6766929c2006370d933eb1c26542197c9391b63100370cb,
+    0xeaac1046ab0580695432baa79802c32e322318191551a3d570fc839d6cae9b95,
+    0x535730cc8d5d2f2f839eab71689d2f09fec31390bcf42a862bafda2184a8c4b2,
+    0x85af70f5d7998c5f1c963d82fe901391cc919f1caf2ce322afaf87238bd768fc,
+    0x43005b1d634927ff9e5354fedc006973cd086e1cd25ee346788c53fefeba41a0,
+    0xd72f5aba7fe4a1f56d6f16a66afc4eca6d060e81bc5678ea3ea3dde9a735a1db,
+    0x7d7b8531b3b6f29e08be8138e4eaa32daee482e4b557d7fb4874798bdc4f0fce,
+    0xf6551e97317419ddfc325653e0d31bde8af1a0f136063f1d3d8aa0f39ac1425c,
+    0x1c1c942f414bf6af1d98ffe8ca79c422e99380b614f807f6248f062cf256d9bb,
+    0xe6eba43c11ee54087d2b77839cab96da4a882b3117bbec18888cb83d6f665b9e,
+    0xd43e0a02c9dcb8b26ef1cbf1662d143c62894530493638469d0270489f171e5e,
+    0x961984b3157968c5ae9afa374d4f3d2551700d4b89a164586b69561a3fb0319a,
+    0x029f8d2192e97535b99b523b6145d487c0dc5687439f61e4fbcda9e5b5a2919a,
+    0x2c2d469e3b7085f6f129bc1dd154204fe91c3fc1d75261f8ec20ed4b67641b3b,
+    0xa599181d0b1049374f1593015638a78f71be4c1b156df559eb88fa6e5b56794b,
+    0x733cf1f8a6244363da601c8b42e8f00175b074626f89c1abce0cf2fe4eb502db,
+    0x1e1f7cb2bd0466c7a833c939750ee7ab47278c55e3be2f632520213de6d87287,
+    0xe1d497d741cd208a2bb7576a7e11ed01fd031585498ae2e9d413d83e0c571073,
+    0xe6abaa271d268e2d9292c0649a20814fe703e117f3c0fd5b8dc1b35e2aac2381,
+    0x834b5e55ad3173943c33c0988d6a455d3df9e2aa1f2a18e0fd51adf86fa4f189,
+    0x9648c355ce550edfda65de2945ca9062d5d8121a3e96e7707ca1a40af02e5e4a,
+    0x3bacb2f0d152608f83d5711db8e7ca89bd9a88e1beb6d8fb29d1aedc96b509d0,
+    0xd06df0e8d1f543189440134eb921f2363c009b3baa82c1b572865d6619085fb8,
+    0x61c2e8dfee1f75bdb22e02edaf48bb403a455ee6265482b6a63831e173de037e,
+    0xab207d6e35b76a04b45b6cd3b713b9429a3e14a651bdd582a8bf0068a007a141,
+    0xadf1c27ba00c9b6b5beefb1d002380779b082de0ac04dd1b351b834c74df484c,
+    0x0bafb24e19472c096a8e26ba1f202b7328b701af4dcb57560ef5d2c451d8d769,
+    0x9b94c7ee2b47133e8307aea8c01a9419326fc63c89d956d7e3d452410d4c6949,
+    0x2edf58e5396fedcac3f889f2fff00bd5fa34315e7ab8950e84df2af7c886c488,
+    0xb66c3faaf7c536659a83178936442ed401f7c71d65c56ed327f71884cce06211,
+    0x8550c718d0ffdd53e5bff5758a62365273994dbf08d785db6b36a1a12423305f,
+    0x22fad94274631f6cb782d50bbbe6628dc0527ff0b5b9a6324396b783224e8d0d,
+    0x36888ea06752438a04ba660e6e4987a24920d9eebf8e5830aff43eb70b81ac3a,
+    0x75f791e094eecb7228091174740c65f03cee8621360c68bf971d4aa80ecae563,
+    0xe588f808470e63a89063825ec3f2590a3630f294893e89b947093c54aef619a6,
+    0xa1f5d66a8410b6bd476f070877268bd120eeec8d9b2cd1f24146328d8f29f29b,
+    0xa8ab0d6d3d1b0aebe07ddd44ba591d3ce218cbd0b9f972d7a6312e76dbc6fe2f,
+    0x11bc9e1a849ba9e9bddaef33f3fdcc2c98bf2a8dc6f1b9843ca834ca2f8490c7,
+    0x982527416b8d6649c81bf15c428a54b8760f6cde22a10bd9ba824b895ad139b0,
+    0x5f7519419b15634945ad17435d09120dd6425b00b70fdccfcf1bce415f16827c,
+    0xbf090508ad5271444142fcadccc073835f5a436fcb357da9ec64bf52b58944ba,
+    0xff2ed95a71dde8b652bd62a8f6e8fd9f521e5f6ef4d98658f6c829e48bd6da37,
+    0xfba9f654210bc16618fd53db5b3ac69ec6fd7ee8054cb8a330c356a86aa0393a,
+    0x7e94cc46e85287ddbf6fac676427dfa196072234f89da4a7cdbe2bb6d4326ab2,
+    0x3d3a6a5043924d6580cec1f24e1e546f892560b444e7a57e72b137b9b3887112,
+    0x0698e135d8f21cc88bd5294f5c787bf0d703d2a8ff01deab15d3f395637e80e9,
+    0xe024de99b93d1008086b77b0c94fb6638c7b80c9350a450c80df509cc2c750ce,
+    0x2d4e5ee2f395b924204d976d1702d4380bdb8faaea368bc538f85bab0e982875,
+    0x6387af78e0d454ea28b27dde8e12f43488e68d57967fb5d48959eeec8bf6960a,
+    0xddaec9285399bcb94406f4af61020e6b094ebefc361b49c2dc1c93db7d17072c,
+    0xea786ebd6aa469d59b6072f7274c1feca0168ddf01f0bc2def92463e6769f553,
+    0x893bd2afd976507514e373522452659388c3d62f77fa4897b20fee075c9bf93f,
+    0x7413e231ab6d16c0c4c7d02d5fa769690c0757644a63ce2d903749823511a6da,
+    0xcedb04a74458f9350821d4b2ab3568a451e9a803384d1bb86d318a01a5154351,
+    0x4fef628d8e686082a953f5594ea4ea509ebea1a5ff593c526bb8c43aaef8faba,
+    0xc595698ed2af1875bc1e4100a7d1da58bdc303e6566bb53863e0d904699c4535,
+    0x462665f3c137de72c4da4e8f7493585ab493fa7697dc7648af61c2e3bd9e66e9,
+    0xe08dc6cbac8b084539206572fea3083623ff9470d839fc58af9c9a9af528ec32,
+    0x37f3a331e8c020a92439ad7f5f5a48dff029f8bed9e490e3a25f0a08652048fe,
+    0xf44c03a5d7ac09910abf1ee6d6a11155a68e11c4fd5cd1aa575f0db90cc6c552,
+    0x69d1dcc7f8ad62f603cee8ff9532fccb0f44392226d4b2a791712ca87df67710,
+    0x6ef13cefd7cab6a3785242b7ec25f4849d9641e1b4d630110b6c4349ec46428f,
+    0xad6481f8f09aafbe744925fb645090885a19bc65a854d6279b2a455abe7b658a,
+    0x77889b1d07a150099f13cfa3a127d1af4d5ddfeff42e8c66099f585fe7a75cea,
+    0x1db6bb22fdb1bbc67fc65950724e42e7d48fa041edb2cb0da6f5b24c541a6370,
+    0x39debe593b762dfc1d990d0fe18160fb49223dc457d8b6692fba1516f4d0c32e,
+    0x4bc175b976191fba226c5d826279058f606eaf98f2b1db08dcaf4e12de8d2f09,
+    0x68b0e500277dfd251440fbcb7a0ef0b3c71f6223acaa95d9d8d164d7d5221391,
+    0x0b34540ce936f8285cbf15fb7d4e8a3573b807f2178cb98891b77be7af106973,
+    0x63143d6e04599513c1665effbf3a36205db7e087a36c34c8ac60507e036c4eca,
+    0x9c824c3f3c878917cd33c24d5c0f74d6d4f635b4e0c886d963d740a9e958a32d,
+    0xde1e9926656a6a85056809f4876724c3e39439d5ffab28d98f99a905b1611bde,
+    0xc72bf0bea18e68e5192fd8efbc3dc3d4e3a4f69253d8b15ef0bc5859a8c5c422,
+    0x2d98752d86e9f9e4ad828fadcfe47ac2a514cd10e98fa27ae70aa49cd85f96da,
+    0x37f5d9a287d5ab505facbf4445072c7aaaf7a9ea18c2b50e3d25fa740c31143c,
+    0x902ac9de3fba2f33c062f768f9bc597dfb439fc4000a1ea99112fa23701d3d25,
+    0x50acd25827d5c3818e3c205286ecb563ab617bbd9277521b4ee076d5c573d487,
+    0xaf4a3b1a26d9e91ab49700a7e24441b7436ad65141bdf2215d8b3f663516204f,
+    0x6ab0656c145d825d00af410db57952d681389f024f0bfb1671110d16a014a78f,
+    0xd3678839387b8ab55a5e85743dbd31aa1d6b7ac776ce886e2feef1165234f001,
+    0x104f9816b923da1c9d42fa9bc786c8c8356fb92b5ffba89bda6576ce2438e7ab,
+    0x03daed553acae100bc622fd4d57d0fe8d7c9356b369df17341613a519cf7ed01,
+    0x62db9b9f2b4d4b78241322b1b8127c14ef1a28c101e168f9c310c3a64bd2814f,
+    0x1d7a61ff988e7e6099c5cc678d925dbde02bcc07f72a8fe9a43c2ecd92b8455d,
+    0x5d818cc1fad450da5e2bd9c7667c7712212028cb0afa0e908bf3cbdd58ea9062,
+    0x9a96b7cae489f2590c631d85f1431272b3471916723cfb89b1f995644ff5ca89,
+    0xdb9afeb81a598039effc8ed6aca13383a91ca3de0351df81d3fc15ed0623f236,
+    0xa1ad3c18e8235bc693986bf1386c39f607950df99bfd58b8a9dd35171e38bb40,
+    0x5f084879d5ba7e04be47930e58246cc0f7b7481175bddf45247987a80999b942,
+    0x44f844d8d06515f04fcf9f89175f5d6c71e3c794a4ba5dbcd4c7b269bb5b8077,
+    0x11429390a31fa632c090c29bb05d7c251fb74154f2c7715be827c334fd962b73,
+    0x16bdfb94a10f3297e2c33012fe7fc2cef569a9d5ac435bded0acf62e77a69419,
+    0xf64e487edc3114dafcde91c325ec9edb7291628914b7d05206eaa09d5f540bd5,
+    0xba2e1b5414d5aff99cd560ffc85140079dd903d0d835cde89d22a7e2ad942ed4,
+    0xe35b2a7e04cbf9d78198f91b11a5b389886d8bdf20e8c988f201b4a419723652,
+    0xf35b7130a2937b25fab7ab40e20fc4bfb0cdc6b380ddf6283ae5d4b057b6628d,
+    0x030fdb5ee084a2fa864969eacc47df92acfbe5e9eb050ec0cf69b00473c987a2,
+    0x295be3033dbbcaab47b1f1b71d900d4fbe46a9ab33712fc87b5f77962b9c65f0,
+    0x26bc30e96084f676bf28ec2f956cd0b361b50cbdce72efd089181ebb1c52590a,
+    0x9fa6be42424107587e1e7154078c5a23dee08ccfcd68f5c35ef09dd99ca08bd1,
+    0x776ef9ab18d5d193adde90b25cd86febd15fd7ddc3132fbc4fc65b62e5211d3c,
+    0x83a4798f8202ec19bfee9eb2ccb075a8bf0c4d45ad867cde2751b43f0a41cc2c,
+    0xbf13301122fc4d1349246dd8896d5f6105917b98782d74a33f2b0106abcc54b8,
+    0x8f3a80a2e2dd48ab0e2837d47fa8cec240214ee3bdcbcad7d86a6cd4c8a7120d,
+    0x979e58843ab827f5d1b5a1a0c16b0e2a7bfae7d68f31634f8eefe2cf0a5e7383,
+    0x2468278374e179cc1c6cc3a945c77bc7d2a00e67ff37a3fb4e729cc7b11efd9f,
+    0xfc8eb04c4bdecc3213c86fceb4667e3dcc4de6e4217ef508d5351126b12ac69e,
+    0x33c295f12d245d5b55e77c7ff3687b06fe7cbe47f91637e9c3e05e4b0bf5dfa1,
+    0x3318240665657b142e940c9c1ef5f11141a913bfd6ed0a06a7b16c285a12546f,
+    0xd685c38fa680b0a73ce3701bc3e5a55bc356301ac5fe304eebe0a2b33ce47bf0,
+    0x0a3d0e82532e8850382dd4aa4d79f36f8ae25e1e91e9d89eb45654637873b663,
+    0x2840f9fdf8e0d8f76f3bf4361c305ffd10b8a256f678f08264e07b9cf606d438,
+    0xb146fe53dd09c594812a5d77bf5141e0381f10bf56ff539e09ccd020292ef434,
+    0x3d4b52abc1e2d31bcfa933b8ff7747a9e157c170bcf5d437c6e78d44c96c0e6b,
+    0xd4d2134f2263a5389194753c866aa3c13b405571450a506b3182f8e3879a1fec,
+    0xf61c24ee24b6bbe609f25527d61a2d044413cae9782d42d981318308a1e06593,
+    0x40c8b037425d50623baa69d0f8b4a744d0fff9b5774cf6b837ad3eb4b2d76969,
+    0x66b129017518cd971fc9dcaa8ef4731c0b80a300d00d8ec64e2074a9b6b968a4,
+    0x50b82ffa96ef355de06d24d32e33d6023b00ebc03817cfe77ed38576d16aea50,
+    0x4d33c5f2c98f9546383002c1515c6f602ed31cf6a013d07385f301270737da58,
+    0xc660c602a733018775dd6a992accb1e8eabdd0bf76a1be51934d05e8b2076310,
+    0x00bb47e1f392b84cfbd4ed60731c83861032cee272d97546051ef23a602d5be1,
+    0x57fe5ff7777c47078ecb84e3eb625a93e0c6e315a3460f2a01b61a7c3decb3a4,
+    0x75be5d8b62a125df0480cf20ff4046e21a38b6865753222a93cde77abf062bba,
+    0x5e6a0f8a083172ea044f561b168e5527c7752d8925fbc48605f02927b409c4c1,
+    0x62856fda307a833c647dc9580815d753d0e56d10cc9eeb4f4e686ca164f80337,
+    0xc284ec88f649a46a69a99081154a31b3f6c349aa0bdedc4e969d8b8222a17980,
+    0xe74a2c324e755dd39e5cfc9cd0ed115bdf4b776f04ee3cb9f8edc628871c05fc,
+    0x91e084af67a2e613829bd0c6e742118b41fb8d0f59189deb3be61ae85ac46ea8,
+    0x3ad503d62f05b7c3ea9ed9d42fce2572bc9609cfc9ddd7c39ddcc1e0135ec2f3,
+    0xaae024180640899eeb5294debe4ead388eeca9debd93fd5d2da4805718c23437,
+    0xd14417b81cefc4198190a1e6430d4efb79db923f80746a136a52a1b3bcc45115,
+    0x9fd5ce1084c28886f5bc70632aa655ec7761c51798e38088d745ab62e2c3063e,
+    0xef90d841bc9a1e7a7c95f106b79305c375aaa1937148a2c8f3ef38040843979b,
+    0x29bf8e70206c01b314a249f89bed6bcd336a55086c4bc2636097e9ba54fe5df5,
+    0x7268bed8da79c4711cba39a7db3ddd34b9bb26cde3c6a85b930ea1db3754f3a8,
+    0xb2b2ecc2b0ddf28ddb0e7462c2a0c386c081712cff94c4f2537b3b1ea1a14751,
+    0x9638a12aa6cb9efd386c63f95c02b181873eb9a831499ba4554254bb6c41963a,
+    0x329d747f8f0119c7521cdf0f2d345c9608997dd15ec58d2c5c1fb0b226888006,
+    0xe0cb7e7c2fdf7d8f962a99bd8a1ba62a41ccbdc753fc73ac6084eadebfaf096b,
+    0x08c65c18072a88358828d852771a3ac57929b658003959682e8e96047bf1eb58,
+    0xb840ca139a59c5f31a14dd61f9d1e5531a704e9797755a4e9500497ff87c4de1,
+    0x79e224e77a879f6583700b8dbeff696ae4a83cf8f4689518738898a9c724d49e,
+    0x45f7b7b2613c2202348589b03c00db721649072fa45a21539a5b85037f02063b,
+    0x7caebda0b2aa36ac6d9c7b7e672ba01cd81a48ba8f71c52c86d3726b48fddfd4,
+    0xa2ba24c2fbb82b44a9643bc25399a28f879cacde4419d262b0e914f5abb4624f,
+    0x3a8c842a526195b1a467ad365dc33a1b980e3426f72c2eaffdda66e5d70b43b9,
+    0xd233f8938b51cf53337aa5b3fdb622735374eb492975050a7033f447f51ebc11,
+    0xeac4736a3ec7dfde97cd217cdc2748ab7f86c09ad8349914f183d6801c716349,
+    0x90e4c8df39c77cc3866c5791ab9027f501dd6fbf3ac7e14b28249c77c7287144,
+    0xad40e53232838e353fa0e2fe9cb179ccc37c17a1146ef6235a3bf594953de8b6,
+    0x4c428b58123893cbf6c60b74838acc32951b985b4834d6250c3147f59819c166,
+    0x210fa9289e55a4ba90273efba3625d5bc77bca50641b617e991896772f5a87dd,
+    0xcab4e8258f4bc6c98bc0882d67eb7b146df2592c39890b42448a4fb40be04d65,
+    0xf1aa867aaad7dfaa8b5521e94240b0a7ef4b968074ca679cfe19fd5081641cc8,
+    0x7c482598987b6e805378a7347b4c8850caf155597bb06f0eb8f31d3b1b471008,
+    0x919576ac46cf24d02aef2ebbcb74d8f79e2ae06dee779ec030b45dc9d78bb924,
+    0xc126f32d5e95bf1af57d0eeadfabc594fff82cc73d3805253d13733e89de54ea,
+    0x02cccb68accba9240ed4ccd1dadcd31b032c013759c6992d93c93b64db23bcb9,
+    0x333ae1c0e9d4544c1455e565ce77a538e91f0c24ffca70f331419b76feea69d5,
+    0x0695e2b6e9875198f5c3a175210abbe69960807cb5d3143c26bab8c04de45075,
+    0x42236bc69a113cbbbeec8a4980a550621e47c86c4aa6965a24ff4c88f5cf16c0,
+    0x5f9e3e851f5940609e6ec3f265a0cd976b1529df131936d766029ece6390f935,
+    0x393f777dc6a3b489595fbf1ee40b355d8aca7ff5ef60da2d05430cdb84286082,
+    0xab77d63a7fc6e80be228341cfc0f9546c2a65099c0c2e0e66d4234b78d5f1875,
+    0x9b27f0779a8bcd81d685f1afede5a4b09d24d7443d43d5c9f1d316d234c8e275,
+    0x642717e2a2732e8c53b4fb795420243f9f904c6a7321ebab906e11309f4972ef,
+    0x401a62acf6dd5623439bf9efd8d879d40321f846c08d120dca0cd8ab1a4afba8,
+    0x9854e71b3cd68726d521e28323f8bcf25042cbefd094738328456a938a25f848,
+    0x982f810dc1d56a07916a4c7539ef2341ffcc89d60166fd9fcad38eef45b7f976,
+    0x455f97218830621450351aee9dede475caaa17c3a740c69eb2a1085e0b37dd4f,
+    0x83b5d5edbc0f087d19f7bc4e1cd59e140911790b922bdfa1623742943eebf4a6,
+    0x87b00633c06055a7c1d0fa9c3a8398c1612d1045ac3c546f52821c926b29e9d3,
+    0x03110eddd77d8d544c8ce79acf88b42edb24fad016ce7bf009aec790e64034c7,
+    0x1465d53f23e1e241f08eac43a45e51e88cf742872f91b663f4cdc9e880470126,
+    0xcb795f14787a8cabf559429a784342071afb12f1a8f8d438f7179cadc9216a72,
+    0x37b36e09dc2a09377d39df14af658a37a7154a840dd2f4347bc706a2a7531c3d,
+    0x2c2faf206e1c166660d5bf80178bea5ab18d4439ee500e6b49429ccde5ceed76,
+    0xde4f06cb453599d7e0d3d1606e44a690e1cab08a60ce1fec75eb55234eaf53c3,
+    0xec1faf20537a34af4b0b36f5853fb0e1789960127e5a6593957ecbb283ac49de,
+    0xcefe88894622111be21aa473cd9a0645a76766b4112f6969118d5b68b603a09f,
+    0x9e4bb051f8b6fcf1646942468a83358924433e324d0d68a4253a22c7c9ae76d8,
+    0xb2707ec19783c9fba1ca8c8a06ee85c1774dceaae2a0ea50146c734304127f7b,
+    0xb01ae0e43e7b5bbe17b2128874f2699e843a1ff47911da584c769578c3ae2cab,
+)
+
+LONG_JUMP_MATRIX = (
+    0xd92a5d2281721d7f92363eacd09910b72b7f3b62d5a6f2c5ce29becfff66233d,
+    0x6874aa6dc4e099cd6c24f608718edc376dc5205838d4ceaf9811ad96d891ffde,
+    0x11f819d413a78e7bbc6757b142046827c8688e923ce29a41cdb2a1c6eaeff250,
+    0x113375bbd7aa369c8d406e6b98e882f51d95139d42157a80742d71ab9d3fd26c,
+    0x359cad57d815999fbc0ee4ea8c1839a8fd620e6077831bb921f2ff4eef8a2cd3,
+    0x807e70de098fe1d0eeac23c9d1ce8cf45cb6d167d4287805276426f151df8165,
+    0xe8145e39c4b88700c1504f53a8342d4080079c9c6eceb565c038b0240a16e834,
+    0xbf1ba10c64cd08938832460d7f2c13add928d79f1e9abfb5b7475b0b1e16bbd1,
+    0x782a7296f74203248bad59b30c76863b544d89e4d65579caa7330f996844b93c,
+    0x72c92e6a0964b03105f9bbb720e2b669e8dcd6c8d215c7723ae89e7012968101,
+    0xeb8c7c9e871d23fe67d5fcf67a18a725ad35770bec1c29a33ce23de02d2ac67a,
+    0xdd1a0e1b87b84f3e77027ceb962af98e9479828e61dc500d9ef85d1e0f80fbe3,
+    0x27548049969dc9ff4fb785d09a27386aa1daef272b491ef1d1225e6fb855a770,
+    0xb6c6c66ab88542bd75d5c9ad9f995e4cd6e1e254877e2f0f8c7e7b4aff1fb942,
+    0xf10ccfd96a5562ed62fb67e3b21bf1c08e0add29c1812d6ae24fa82f97ca2695,
+    0x069db5e737f12498070ed6b599f70cb3d2b55a6dca12b74cf66304d4c2f704eb,
+    0x687d26a754c95f3eca2854790da1a85327de1ee26570e614680744ecaa63adab,
+    0x40bcfb356b902ba3e8c781f35eb5bf31056f17a92289fd248a6c9d930ee06afb,
+    0x1159d830edc4d9d94f3b32482742b278c02c191893cf95ea6d6f058a912a9516,
+    0x30209d6b141a7fedc07068d240c4a6b29763e2949e9620bfbbfd8b0b7c4a2cfb,
+    0x2ff2c0903d3dc7d5b2c119ffece089c7aa8ba508952817cbe9cb5b34aec2bdf0,
+    0xd7ad2fb3e9a24cc03f52e6afd6cfd4222b6ac93f5664405a08908291a464a283,
+    0x5e18db5e5029d659c371be27f6b87cdab97dd0711729a035b9fe87f96a23cc2c,
+    0x1a34030025c6c7aab6f21f2853c4363095aa6c0cb9b1dcbee9882dfb12569bff,
+    0x100bea0ce79c862d4b77b8ccc1eced8e33d0d0de13701a2e132903fc6c43b4ad,
+    0x11410d1b544e587cc207594b7192ee59ccc5829b98a8faf57050222ab3d12707,
+    0x1ef9fc9e2e8f856da9c25cdc037832548c8bc63e0576268e075f181e663f800d,
+    0x0ea5fd03fc60c8a57807d7892ae1de22730436e2fb4d58f61e3f4010649a144c,
+    0x4e5e58f4210b981ecd170cb87c530eab53736debefb09fae899d12a96a8022a4,
+    0xa62fa59e6d6b18b7caa5af3804124ec0179d15a5fb466895a1db293eb5e9f59d,
+    0xee6b64ddb4de8aaf7950a9c3b54314ffa53884fb331c83f29abc86e7765bdd40,
+    0xad793aa4b81109b1af69fabcbd6dbf20152b464e9ca9e51f0d3463e5fb97ec55,
+    0x20af76e24dde1db1c2675a47f4fcc9c184e7395de1f06696a477f881bf759b6f,
+    0x8d60e233fe652f71ac5c25a40d6110e89ef3841cd6772b99a5f968d7f11db18e,
+    0x81b8bbd1128993bcfef9c62fcf388bc56a38c11ea9e1000e1537728bb99f613c,
+    0xce04b1c4eeee2d4521b6bee670271701edc03fd749f3174021c7c8ea18df4214,
+    0xa77cefa00c2ecf90d162c5b33a4366926329115d338b0ea13173d723ee0bc748,
+    0x6d6dcfcbb6908e9df25f9528cb2829d0afa49e2942f84d9462fd2791a3c9d9c8,
+    0xb4fc907a5198fc0843a246fbdd15c84d1bcd769e4c8d40d1c9cbeaa07f53ed3d,
+    0x2dc4fe624734dc8452e57a53ae3e1463881eabbeb89061248bd6fbf52e1a3958,
+    0xd29ba57910e7714f319bcd388192a087eb127149bf30dae1898d5ab53514650d,
+    0x4adfd5ae1a23500a9dded23aab29c5ee629ca4b4f451d0022d943247f51c7e7c,
+    0x7bd883e09c9801828ccb39265fa964b1a4048fe9f49a54c02f3315b32acb7978,
+    0x39f879c68ce7413652a6f54bc933a4cc51f591aad5e580b68f4cb6549974fb1b,
+    0x59f0d70c0db5d19b804d84ebf5e64aa0073c6a530e2aa103615db27c2dedfef2,
+    0x20b7c25647d9019f42da07a9dc034bc1d2f434364213b88b929e5709bfd1f701,
+    0xa9e21c4fdc5fe1e3d6cd87753bb9fb95ab053024582f96132d71188819065d2f,
+    0xa5193ec319dbcb8cce1b845a2b293c8218ca63117a57842d3a19c2a68f72fde2,
+    0x97eb6e1f5d61d8d76bc7b8caac16b935e341e34b00df3e5748c9ebbcc0d9646c,
+    0x09b7ab8c291d9af2e7141dc89bea1163d4d0c55587e019a1f532591b2f7b9dab,
+    0xf3a149676dd409cb6973689f36f79fab97a7d265c10c8289a89747b359b98a0e,
+    0x1626104b42c0c40ed488e4f90915f084bf9969d810e6dc8f6c42aa5c9d695dfc,
+    0x7ca3b840969be3a8781e1fcb4417a4cd7dae41dc4c84d5c15d970e15656379ec,
+    0x1dafad428596118d3b085d7a7a052d4b434fe9299c239cf135c6b07269bbd7fd,
+    0xd04cab9e2ec74819e2cbb06438942163f94d88ead882a12e0215845198c624dc,
+    0x5fbb91ac36dd2c2c4a278a1cec60e7310be7680b55084b2284c96bdbb7915d53,
+    0x6832a4e9dde7ecb4daf35e1864d93864d9a8397eceb47c770ef3991acc2f5e5e,
+    0xb0e7f0c8cde6e05a1a27418f634a4eb2a2cb2c5212a08cbd7154b2fa09779f9f,
+    0x4ac8532627b24988f06be4e80958e3d04b6a73da099147c89b3b4a7bea5bdc11,
+    0x5bb9b208eef6c2cf1cea67020748817509489757c61284c023c1ed65381217e6,
+    0xbdab374a7ec73f7d371a66607e842c0548973da96005326fee67971ed326fec8,
+    0xc9fadd5b04a9959a438b07243678989ec715d3fda51192cb603d2c7be668bed5,
+    0x940cd28ccc76f057a6dacda5e253664440e63dbba05e938d0e76a67f2b8961d2,
+    0x79db1dfa0abea61b55fe3a189408ef18ef3c1a454a8ffccf294c27b7a5384565,
+    0xc159d3a386ed21ba9322236aca90c952c2da3d783b82233d1b416dd0bf2a26e8,
+    0xc56b69369347eebb0ed68e79760543a585197542fda1ffde56dfad31325f14c7,
+    0xc2c52b78fb1ab84e0969d0aca3968fc0175f95930e23f25017300a7a5c9d9bfa,
+    0x873a151c5233a359d9566d54b10a899b279f25846dd5d26ca178db77215fc587,
+    0xd0678c4ba7267b065d8f50d8bfa9ace50a03803caba82cd3a240639b636f2ec3,
+    0x929fdd41f6b7ccb671703c26176c03f3722bfef8b83d81655a38edc6d3239a26,
+    0x0b88b668b6e36dc9b5ab1538628740a2bd655d453a5ce83499dde761927172c7,
+    0x6aa3083113c93b8f6263685063c7f8dd727928064626bbd16e5050fb3eca4ffb,
+    0x93a2e448c38c7a80b0d65d391555c153909b441a97a6b93cb8d041623834bbbd,
+    0x2967749a2e5ebc3c473bce8ced599649a312bff2f0a08101e945b3875afae10a,
+    0x34860dd2b58d7f85313af6c051bd5c63073b2bf13026c67aa24d337c74f6563e,
+    0x7f48e36aac94fd9f1ac9b79b8aeae8d0f1f114ff5c86fbe339bfb1579f92f7e3,
+    0x524ff6787e4ccb85f88d1acc3f2d3aa4f5ada6dff563a77084c2db80f22dedaa,
+    0x43a057150b0b008a498b3e14a975b63632098f881d99b9425372e0142a16db84,
+    0x4565921c1fff41b69a374434f4ef8866bce03db22e9e269501cd405bbcbbc7e1,
+    0x8126e1e31d2ad0ae923c639b3da634ed7fbd4ce3b50904eb7b115003d923a739,
+    0xaba24d9b6aa4ab994cb58415a95543e92c4cac5236edadab7a999e0fc84afac3,
+    0xc23ed24dd89fced13a14e9be237805e746816dbf8aca6afb9c78b01d1403d360,
+    0x9f13c80a8d44a29d4bb3beebaa388aced56af2d8de0e951610f2af0eb0c3c6fd,
+    0x6a0edaec42def65873de396eb20d8104e6522f9a70502cfb4c1bdf2c75e5de56,
+    0xc8640e1757caf498203c481f2d277f968767d09592dabdf081f88c7696bcaf88,
+    0x567b6dad328cbee911aeb16dce42bd69f6dfd2268c94a2838158ab9ed9c0b1f3,
+    0x13a1c36b4be0c4c9c7821f824b7ef0c6046c3766d3fdcc2c3d978a61f5ca86aa,
+    0xc3d5b232cfd8a8a0dbf623865130d1a0f2665328c74a9bff979f413aa127cab4,
+    0x9c164b346bee2962d68d61bdea74805f347f78458303b4ad73bc0636c5841c5c,
+    0x0460c2d692728738dbc413e71f528a08c679a2ee9a892707b55e2df20f062881,
+    0x7ee8c3a44386e66ae3a121e44fc0f7cf8c73476a4f8b800d76834edc0091542c,
+    0xe3d3d5d0a050d31e371fad95f96c752facfaf8196932144c95be28e74205e57c,
+    0x3c320979d7b81a201977b4eedda472f28c9c717a488a22a4da8c3d430e497542,
+    0xe50ce00f204465edbd7bfa28583d317d1b184ec2f943f59d9d41db635390415f,
+    0x40c9722d813e34aed47c90467c81735b61dbd66c5841dd406dbe46d2d2bd7a06,
+    0x5dff800497aa756176b5d2af33cd6bc9223948914fe9ec556d77bc6269358767,
+    0xd6486e26afdc5fa92d173a557e0b057b4cc96fc4e1db9b6f135a214f41a77e5c,
+    0x970c0b0bbabdb574ed07042f5a5c6b075158333f87ffb18e020c9506539e6fef,
+    0x93632c92e3f2716397e925118a6e0dc5de6b9014ae09613c3508ee83268c9e77,
+    0x022b2094c2ba048716b3963b442c7025c6fdba46185d4214ade3f962cd334a20,
+    0xb8083e4e1af4f42090dfb53cb1a13be7fe16647f3e6dc748b9559f8b4320fad6,
+    0x28a5056c1f8f51a7516db3c4274b6b6e719fa5216b41d9c8bc94e5668083a867,
+    0x0e6f88055c39acda0ca7149c70dfa7e4ab82ebe16e6bed3d2ce36a23fd501b3d,
+    0xed0604b052ba8494f734b0c6cce76e27d88d03b5c494395856c86c7a1b85d387,
+    0x556f68a77a96fb4198006d86cb7094ddd8d6ce69c1d8650d1241530b25a93f73,
+    0x3daf4bdc9ad11edcdb85d0f90b8e56fe1208db07dec47e7c8533a0006e20d6f6,
+    0x3fb89e564643c3b5420c9a56c571dec46de882114a297978c0d8e8c964118b86,
+    0x0c1da69ee09e6099742b64b54029cfc316061e10d180fb1ba6398f5650b30e43,
+    0xbe58d1da37fbc456039c28ee199acf860e07eb69faabfef2e6acd0f18f45bf1e,
+    0x509262160ab1f64dfff24be69b7b05be17b2a6005945f701e0f1c8a80933bcaa,
+    0x1d8324c6520a52180efd2394f8374f10a1ba69bcc20a5d2fe099ce948b6d38e0,
+    0xe7295e6e17ffdc177e2e7a30256128c9740d82e7fe2cfde24bcb930c3fe96768,
+    0x1b99fa01351bb38e8959aeabb4d6bf5b77fcafa7ce1d646c0450665a9b0259db,
+    0x58cdf0c137c570a051c85c30f5564dbd723042073eff9dab81062635796dceee,
+    0xe78e03a45080d5b3acf977c771099d0aeb9edccd63fd8a0e2f3df5a2e2871648,
+    0x378d2dda8ea7f77f4c3cb401c178b13071942996c57f5dfc2be56f957256a9b1,
+    0x377a1fff48fb0f5257bff8c054d9e51d4b94db03877b79ecc3094d43c75cd374,
+    0xde11199a01b73ff1c5aa1e52d6feed7d482bbad70acfd7fd34f468db95dd6001,
+    0x097e6a8d842c9ce0be0b062602088265f13a4548985c24dc75f0554eb68b6b52,
+    0x21555ce81f18bdb51c62de64af00fddcc5dca946efb75d53d93d4f4e02b79ad2,
+    0x11edbafc145ae7ec125336c1156b41954913dd8c44095e5e96d472a876f0d156,
+    0xff5f0b466cb21ed8d28ba19f9fb1873f7d3d59138d699f9f946ab3addd93ebd8,
+    0x4e7a3b6740a4779e7307bf438be2564296b9db88a26bdc1198931d6e62615802,
+    0xc54ff9ddf8e13d6476836ff31490ddcdebaa7905337817e6c2b652e93e9e9bc2,
+    0xbabab7fd58e490ebffc77299a3e7ed59d0a1d3b4eff2fec84f6ffcdae52fe04b,
+    0xd813dfcecac191b4fb9c60e99dea4fd6d68223fdf2c2bed5e4372bea0d6e4887,
+    0x38629a0b76c5b82aa95270354e34a0664835f540c01b61d2408c8c80ee94c3bc,
+    0xda571526290535097f4532b8eeebced88d53d5e5829645657937524a70ea940c,
+    0x8584d0cbab57365f2bce36e8d07cea6f9ec5bd1b147d10b7e9140b90ebfec952,
+    0x27f383ed66e1c8f0d677524633cabc7b712c2edc54bedc37536e2704ce6b43a5,
+    0x71ba699efa55f3ddd9ff08af7dfb7d90668a63e4a6c86827cea09d3c73d88fc0,
+    0x7f8ae133495d47728a4198d5d9355bf7def23a44680282f5addebd51b4e0899b,
+    0x35bff803ab55176b60bd40906751803697ff9b98c83a39a86abec0acccf9ace5,
+    0xe1db1606eb0f16d2f4dbb287b6b98296bbe3fbc0382c8cf486f04c7f0e8403f3,
+    0x25d045530a0f5f874cab7881025ba896bc0da232987e2d40f1ce25c4380740a2,
+    0x235c65fb19d65c567a1a0e6e02bb430c4d0c3500271c13ad08632668449df8dd,
+    0x04d55352cba03d86042cfe0a8e85786fbc051230f394863b94b7ba101923c153,
+    0x754629b2982e5763d042f4d7712b17489c039a35c2d4b66973504b25818b9649,
+    0xfe41d99b13e2f11be3cf13182fd19a195c0ceae76714a725e4f438e91ff75c63,
+    0x21b4845d5abe0e6d812d293d25701333180b350ac52cf98e70dc3dc279f6e8d0,
+    0xeffaa6e0253cd5c0f7e11231ba9a9dd46b387d60d711386a024cb4ee4ff93aa4,
+    0x98d0dd7b570985c8015c4ba208740f74cba23d6f7d1f5e4c3355c42a15edb636,
+    0x3d99b225b7f43621c22b6f1939f1aef33c54f27e0b4ff1c07ecb52ab176f8866,
+    0xf5c1ce81372aab8ad084f36a91c930068ed09e82ee090cb3af39bf8924c034ed,
+    0xf4fa22c85965529019760a18cf1eee428e63bcc7912fa853353aa64af9f343e9,
+    0xb852c1c2ce9c6c519f2a313ed7d06f1c242a71dfda9fbf31d9ab5c815d1a05e7,
+    0xe7cc6a14d8a5748514ed9cfe10c61fd8f73ec51a6866b278c1876e26cec88ace,
+    0xd1c4136f393b78e40d0a8f498f39adff9ddfcc434cdea6b2eb58a0d3ff698104,
+    0x5d951e284644264f83e6397bac73c266dc6d925ed0f889c70481e9ee3ea97f96,
+    0x40451d8627ff65d18b409f34ea921feac11db618fe3fd4227d9f4d126606bd69,
+    0x437484d9baacfa70de9eb62861373cea7ee30eb84f667cdadaf2814eb2caf0c6,
+    0x3a8320c127fffc84ea677d1efa1a4a5fad1c61fb86d8363018012e363d50d1a0,
+    0x1f9dc543eb28f1d2641844a1b26b34f26c21c3752eaced8e50673ce43168805f,
+    0xc170f47d57ccc6d8aea3009c5969ad0f742ed98f58caee5968daa272c3e08a08,
+    0x546d4d742a5d66786882331664e377c222ee03a82acc3254e4f1747c2b68f7cf,
+    0x5f7c4767654c3b5e44e51b1f2c1a6163cac26f802749de22e81fe3064528752f,
+    0x129a522850107be94b3d792688785056c8166f6b5e590eabc7a1085cc0f272f2,
+    0xed2713a71b280f9f37eb259a3cfec4e07066c8c448b84ec02cf36b58c5bd317d,
+    0xef89bf9a49e46ef9473670980d3eae1b8237f9489b5914ff26eda6f4557f735b,
+    0xed136daa60263847f71c88190264879c8064d1c80913bf20d525c0884d8d6bc9,
+    0x3983ec4debf5b79dfbdb01340c529e142ad9cd02aa52c9c1b7126ef0ed89057b,
+    0x5af1eb4a281d7f0740c7c016fc73da8958fd7e4c7b8310e8119ff3297b8c6b07,
+    0x00adca33fe2215b200e3045833ed6cf935a524b0d8ae8bc5de88944c9de40dc5,
+    0x6b6f3528bd965d2148dacd3772733231c68ccc4a70a517018e2777716a2e7025,
+    0xa752e964a9059c448316050942e8fcaf1e0776efea2566927d0061767c853be7,
+    0x5da9f2fe832381b70fc211a51faab2a6e13d179803a029d07e5db48474eb6b6e,
+    0x0d082d99317dd370285067268e2e4ad921eb47bacc2dc84d83d28cc7e045a7e4,
+    0x5776ee695f35c7e42b9f3a1320b5577f01be821344b01463f31239a6e4216e27,
+    0x72810aef50f79ff4f31e49524ba6f1d060c059e4755ea0872bc8873b8a7e94dd,
+    0x27719b7aeed11318bf780a1d5e962882a2423b7a80f1c5eead70d11a805256fe,
+    0x0ec8464d5b5aef3772ec66d1463aa7bcce10ae843f4b64b11f04e4c00c13dec4,
+    0x6dd5d259d174aa8fd832792ad83134d8cbec5d0f81c7a4ccce34673a09b1cfc3,
+    0x09bb0d0fade5f5beb66786c776713174ef17ddfe22a04aa0b8606dae8cdacf86,
+    0x27073e0833a4f76b050098c855bcf2bfc7f6f6a03a974bc112b23ec80cf905be,
+    0xba9f38d56bd8c37543c48b43cd17123f5a06f641e0b5fb95e27ee2ff0f1d4f10,
+    0xcbc45717659e5bea82154c39a249d52b800fc41b5a773c82f618cede5c6528c9,
+    0x50a29a8b39d0e0ee070644a908a1db3754f2fcd1a2d2b93570faeb0ec6bcbf5b,
+    0xe11020e1f303df8d2e510aebe96fd016601606d48a6e11635c6148ecd7904dbd,
+    0x05470643ee3489e3a0a5b26d2da217042a7af3e10cb39fab4b3b6ea04e5f9d0a,
+    0xe2bb08a623555935f3ce3f90e50fecccc95e67335103f084825a16062070b130,
+    0xad14879e615377b989906fdc9a389cf16e1dcadda60fa4cdc204b4df1d43e51d,
+    0x72113f048cac4d4a223f966786a73a8046e557df19712d4b6a142cb08c68ed7d,
+    0x641424338e854a31adcb3372d892a6b911e4717d380e21635cf1763a40ce8265,
+    0xd20f07cfb6f17de348bd1faf8ed5a08f0b324881b446e7318d61b6e96162fddc,
+    0x0bc768269a0fe9326e5d32b321aa1fcb9d131a8eecff3864274eef3f65a34195,
+    0x822419cb3ac7a56afb7b36248fbc18a0164eaa66e7544eb286466f3702d5873f,
+    0x657a68752309bbd20f88e61aee298a53fde9751b4168e3d099313d924c425642,
+    0x1637a18b32bc1ab77bed0eb32502ca2bd481f3620c228175904777b6167addcd,
+    0x46b3de10a77fcc4e6af2258d141f139109dc22ca42502c05ba53f639fbeded59,
+    0x110323482fbcd0193c5a06b15e14f103f53408a222d2989eead8254cacd64fd6,
+    0xa015121ae755a5f8dc5396f742a7c1b4e0999e9a09c16644946663b782bca066,
+    0x88d69a00c34c7b1462838010b24d8bbdf1e1c84ab3a6ef18efd055f530dbced8,
+    0x2628df68616fd3a0504952572e3f844bb6a17239b35b197f4aa11f0b3241cdbf,
+    0xb31235999204ea589dd0a1991e1694e9ea7276f92d13ee05d89531321f399ff6,
+    0x8f533b937da2569a3217333ec4272f089a7794768dcb848d2be6b1ddfa39190d,
+    0xbbd354a5fa7d6677bbb4a9aebb9fad0f42d6c781ed2dc23a5d214a52161faaee,
+    0xed0b5debc6cab1ec742299d58ebb0d54b90357543cf8672df3f34bda90ba3c7d,
+    0x18d5cf4f44cd814a7738b2e033a4d95034a38c2fbc7143c31630e19704fc7f9c,
+    0x6fee71c3b161316c4068277a76a061646c4f120ab7b73ccdad4da6d2b73959fc,
+    0xa1081330cce4080989a7f43ddbc252a0d245f409cbe021a13bf0fbea638329a9,
+    0xbc276c39d46cd729abecabcd360d0a2a3eb26e6e62848205e976007721221c98,
+    0x127bf9900a1706b3f06f382762ee8956577e12e606cad3df2b815462f94b1f9e,
+    0x0bb26286b32e050f89a50d9f71af1da06da1c2af105ee322bdb1650c63f32afd,
+    0x985b85c504f6dec43a2313ab7f37bbd29cf59674c757b62d4db6ec78f3411c67,
+    0xd302afd3cf792736543a9da40453e3705a1bd4526483b0840208407ee568ca3a,
+    0xef6feb75313dd45520e5b2546aea678bdabc249354320cd26297b18f26e21214,
+    0x5fb4b7b12dea944e688a0d30104168035b82e6d4d306b0da28963e438200287e,
+    0x926b7644c5be725518164b2ecec3f97e01876dbf54006338da65d80bd414c053,
+    0x89e96e549e5d0527714918e2a304c1d0388d9a5366e389882715e6e7df7be19a,
+    0x4b08e6295130526982f6b0847154a6c40c466c35d87be2db1d79a1a246fa195d,
+    0xf0d105b373933b92a94295bf20a9270e53b9b9f6dd3eaffe6736f1e697c9d3c2,
+    0x20a0eb0d172cab7bf03eefa074ea73ff30bb40a075441b39e1473fad2c635106,
+    0x1cbc1445ef6103e76d1badb2e6a1d82fb4f16d8c830de4e0991313cfdd97c501,
+    0xd61945a2646ff80d44722ba7e19d8754771de5a2b6bd3ffd8272934c8c8f7c7e,
+    0xbe1ef3f351e09d86a16a29a8d7d8994bc1c3a156d097b3da9b029f0efd4b489e,
+    0x050e1677ebef390d33dc4b0eec4a251cf2510e1459d880f7ed247e4230db1e78,
+    0xa026420bbc172bc2a24cfc917ba9b91e8a3b5883872f6d332f04f8e353878dc0,
+    0xf1ffb395f2a4bc7e8c68a7fcd95304bd17389aeeba2749053bdaad834c6b8b80,
+    0x50193abeb2bf98543278eb7d799536df2d6e29e2d99a67db41d8f0a86e99562b,
+    0x3d51550e64b69aef87ae4de5b8c748c8b480156e98d30efb7e980007b9dd9cc0,
+    0x260ed2c995b52aa1801feb0fef045bea2d2f8a2d60dfcb8ca93d1e2f66a1dc17,
+    0x568ed992c2ceb43930d842aaffcce0ee6e482bba2f0bd8d724acbe1a3bdfb38e,
+    0x0cdb3e12a8802b75e21c4602d9d1df8d041ebf500bdb9af2dfcfebdd264170a0,
+    0xbfd8eb4126b9fa17ffd45ac6c06c89e314635000528209cba48798da6ac4d5b3,
+    0x34fb5552eceeba0aac400192c0bb5935d840b24ca3c8c40e2a5bae10d6b1f77f,
+    0x450e682206ff750a0d105c7e709377b9e918f45fdf01e3a82179cae9aae30f52,
+    0xdebf261fd0488f137a52203e40224d4ab2119fa0df00118da3fc133f62c33ff1,
+    0xce355e1b2f1377771daad592c7a74a3132b6db826c014819fa51ab9484b69ce0,
+    0x82f211d517704f8cc1971a3c54717de3ceb8f921f8bf2c2c60409e75473ebdb5,
+    0x0ee9550a05530152f73fa4a2ae95e9325d2f7d17ad2fecb4560dfe6a9c7ce7ec,
+    0x3f900bc2eb1e42b93c6ae8f181e7a56ae42a3e605082e05af336e0afe8ac1ed8,
+    0xf1c393591b0bc24fdfe9bd51d31bbbd2a0fed1f7e012498843f8aa940894779e,
+    0xbba60e09a60ce6d82c56531b161a1ab7bd7daa4dec1cc2cf0d246dbdf38b3d64,
+    0xcad5edf44aaa9974df1c455f663bcc4ef83fb3ea26cd3f7d847cf357643090eb,
+    0x74052347f1ee632ee047c94b46bcd019d8be98fe3595959a6eacd048de6b91b4,
+    0x7751468d575a3ea60cd7c113cf63a5f8a938c10e00fef0577e21c9349d57b82a,
+    0xcd81823cbba3e66087026d7e6e287b14e94e7ab7d48ea61b7e48e7740eab3509,
+    0x4071af33b4d827396cad1546fe195943873604077a83a24e14010c951f13245d,
+    0x88ff0141cc8c8e2fc4933c84acabd728c2f2c60a14e82bb519e4dfc478bf6475,
+    0x2bbafb70865b30768d7bcec575005e224bee98078f3728c9f370bffee0bf394a,
+    0x05baca9b65ceb476e4d657ccb11c8514b9d637e002b8bf5bd009a8dd9c70dccf,
+    0x6f4487d6d94266d995774f155c430881c3b08b3b557a4dbd8609be2b8502c66f,
+    0x182f5550c1e3fec797fb085c61102a38091d0e3f5f019d0a1d228406ad9f3c70,
+    0x29a07e4de8c1a7da0860a195103715d8016d0f3e18e0b1306ed4753fbbf9bc69,
+    0x3a2eaf65d82a2873d276de1a842f68a4b93a2c416d3be51dfffa47d87a91bbd0,
+    0x728fe2c45708f5f915eb37001f53908928654c30a3feed7dccd00db9ff8ef088,
+    0xc864a6cab40a71aafbdbda671cf920a1644ca86b4f7a8265546c2164e7004bf3,
+    0xf749d05cf3181790d69fb4d8ae009078f480dd37ee1efddce740f8c5eda90aaa,
+    0xf0072e8e45ce774a2c7e0d9776065e3b7f19eb292afd4195d7e0a2d73f608f6d,
+    0x75a2d16ab9edfc80b121910d1a141120adf3e6afaef1873f5a336590f6c7faf8,
+    0x4dd620d0c1798e1c7e816212ca352bd34e2fc51c9f445642db3a0523bcf273d1,
+    0x759e4f5fa079dd30ef4ef29d41eeb1bd9594088e80c6ddcdceefc709eb262a7f,
+    0xc4b0079ab48e56af1e03ed904550359e1141a4f784c5ed59bfeac724875dd5d5,
+    0xb9e8d08bca49a029a8d267bb62ce8819490f7ab47fec4fd6fe76560c8da6c09e,
+    0x36aab3dcbad3ba8aaf232022acad00a896a66abacd5ca066d05bb62dc151c314,
+    0xa3d44c5dfa4c6c0cf2a2ec6ccfde46b45de1c4b7f991ced8a9314829a84ed2b8,
+)